@@ -0,0 +1,87 @@
+"""Initial schema
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+
+The tables as ``SQLModel.metadata.create_all`` created them before migrations were
+introduced. Databases created that way are brought under Alembic with
+``alembic stamp 0001``.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "connector_instances",
+        sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("connector_type", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("config", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "pipelines",
+        sa.Column("name", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("description", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("source_connector", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("destination_connector", sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+        sa.Column("schedule_cron", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column(
+            "status",
+            sa.Enum("DRAFT", "ACTIVE", "PAUSED", "FAILED", "DELETED", name="pipelinestatus"),
+            nullable=False,
+        ),
+        sa.Column(
+            "replication_mode",
+            sa.Enum("FULL_TABLE", "INCREMENTAL_KEY", "LOG_BASED", name="replicationmode"),
+            nullable=False,
+        ),
+        sa.Column("incremental_key", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("batch_size", sa.Integer(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("source_config", sa.JSON(), nullable=False),
+        sa.Column("destination_config", sa.JSON(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "jobs",
+        sa.Column("pipeline_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "status",
+            sa.Enum("PENDING", "RUNNING", "COMPLETED", "FAILED", "CANCELLED", name="jobstatus"),
+            nullable=False,
+        ),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column("rows_synced", sa.Integer(), nullable=False),
+        sa.Column("error_message", sqlmodel.sql.sqltypes.AutoString(), nullable=True),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["pipeline_id"], ["pipelines.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("jobs")
+    op.drop_table("pipelines")
+    op.drop_table("connector_instances")
+    sa.Enum(name="jobstatus").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="replicationmode").drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name="pipelinestatus").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,40 @@
+"""Index job and pipeline listings
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+
+Listings filter jobs by pipeline or status and page newest first by (created_at, id).
+On PostgreSQL the indexes are built concurrently so a large jobs table stays writable.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+NEWEST_FIRST = [sa.literal_column("created_at DESC"), sa.literal_column("id DESC")]
+INDEXES = {
+    "ix_pipelines_created_at_id": ("pipelines", NEWEST_FIRST),
+    "ix_jobs_created_at_id": ("jobs", NEWEST_FIRST),
+    "ix_jobs_pipeline_id_created_at_id": ("jobs", ["pipeline_id", *NEWEST_FIRST]),
+    "ix_jobs_status_created_at_id": ("jobs", ["status", *NEWEST_FIRST]),
+}
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, _) in INDEXES.items():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
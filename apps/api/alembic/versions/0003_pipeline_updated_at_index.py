@@ -0,0 +1,38 @@
+"""Index pipelines by last update
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+
+The scheduler polls for pipelines changed since its last refresh by (updated_at, id).
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_pipelines_updated_at_id",
+            "pipelines",
+            ["updated_at", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_pipelines_updated_at_id",
+            table_name="pipelines",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,46 @@
+"""Add job concurrency policies and source hosts
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+
+Pipelines choose what a run does while a previous one is unfinished, runs can wait as
+``queued`` jobs, and jobs record the source host they extract from.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+concurrency_policy = sa.Enum("SKIP", "QUEUE", "CANCEL_PREVIOUS", name="concurrencypolicy")
+
+
+def upgrade() -> None:
+    if op.get_context().dialect.name == "postgresql":
+        # New enum values cannot be used in the transaction that adds them.
+        with op.get_context().autocommit_block():
+            op.execute("ALTER TYPE jobstatus ADD VALUE IF NOT EXISTS 'QUEUED' BEFORE 'PENDING'")
+    concurrency_policy.create(op.get_bind(), checkfirst=True)
+    op.add_column(
+        "pipelines",
+        sa.Column("concurrency_policy", concurrency_policy, nullable=False, server_default="SKIP"),
+    )
+    op.add_column(
+        "jobs",
+        sa.Column("concurrency_key", sqlmodel.sql.sqltypes.AutoString(length=255), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    # PostgreSQL cannot drop enum values, so QUEUED stays in jobstatus, unused.
+    op.execute(sa.text("UPDATE jobs SET status = 'PENDING' WHERE status = 'QUEUED'"))
+    op.drop_column("jobs", "concurrency_key")
+    op.drop_column("pipelines", "concurrency_policy")
+    concurrency_policy.drop(op.get_bind(), checkfirst=True)
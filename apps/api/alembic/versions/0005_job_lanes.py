@@ -0,0 +1,37 @@
+"""Add job classes and pipeline fair share weights
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+
+Jobs wait in a worker queue per class (incremental, full refresh or backfill) and are
+ordered within it by their pipeline's weighted share of recent worker time.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+job_class = sa.Enum("INCREMENTAL", "FULL_REFRESH", "BACKFILL", name="jobclass")
+
+
+def upgrade() -> None:
+    job_class.create(op.get_bind(), checkfirst=True)
+    op.add_column(
+        "jobs", sa.Column("job_class", job_class, nullable=False, server_default="FULL_REFRESH")
+    )
+    op.add_column(
+        "pipelines", sa.Column("fair_share_weight", sa.Float(), nullable=False, server_default="1")
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("pipelines", "fair_share_weight")
+    op.drop_column("jobs", "job_class")
+    job_class.drop(op.get_bind(), checkfirst=True)
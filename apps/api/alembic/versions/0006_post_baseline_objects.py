@@ -0,0 +1,54 @@
+"""Add the job memory budget, metrics and artifacts
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+
+``pipelines.memory_budget_mb``, ``jobs.metrics`` and the ``job_artifacts`` table were
+added to the models before migrations existed but after the schema of revision 0001,
+so databases stamped at 0001 lack them. Databases built by an earlier version of
+revision 0001 already have them, so each object is only created when it is missing.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+import sqlmodel
+from alembic import op
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _columns(inspector: sa.Inspector, table: str) -> set[str]:
+    return {column["name"] for column in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    if "memory_budget_mb" not in _columns(inspector, "pipelines"):
+        op.add_column("pipelines", sa.Column("memory_budget_mb", sa.Integer(), nullable=True))
+    if "metrics" not in _columns(inspector, "jobs"):
+        op.add_column("jobs", sa.Column("metrics", sa.JSON(), nullable=True))
+    if not inspector.has_table("job_artifacts"):
+        op.create_table(
+            "job_artifacts",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("job_id", sa.Integer(), nullable=False),
+            sa.Column("name", sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+            sa.Column("content_type", sqlmodel.sql.sqltypes.AutoString(length=100), nullable=False),
+            sa.Column("content", sa.Text(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["job_id"], ["jobs.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index("ix_job_artifacts_job_id", "job_artifacts", ["job_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_job_artifacts_job_id", table_name="job_artifacts")
+    op.drop_table("job_artifacts")
+    op.drop_column("jobs", "metrics")
+    op.drop_column("pipelines", "memory_budget_mb")
@@ -0,0 +1,27 @@
+"""Add job heartbeats
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+
+Running jobs record a heartbeat, so that jobs whose worker died or whose message was
+lost can be told apart from live ones and recovered.
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("heartbeat_at", sa.DateTime(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("jobs", "heartbeat_at")
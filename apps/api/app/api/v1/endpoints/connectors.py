@@ -1,6 +1,10 @@
 """REST endpoints for connector metadata and validation."""
 
-from fastapi import APIRouter, HTTPException, Query, status
+import hashlib
+from dataclasses import dataclass
+from functools import lru_cache
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response, status
 
 from app.api.v1.schemas.connectors import (
     ConnectorCapability,
@@ -13,13 +17,23 @@ from app.services.connectors import derive_capabilities, registry
 
 router = APIRouter(prefix="/connectors", tags=["connectors"])
 
+# Browsers reuse the catalog for a few minutes, then revalidate it with If-None-Match.
+CACHE_CONTROL = "public, max-age=300"
 
-@router.get("", response_model=ConnectorListResponse)
-async def list_connectors(
-    capability: ConnectorCapability | None = Query(default=None, description="Filter by connector capability"),
-) -> ConnectorListResponse:
-    """Return all registered connectors and their metadata."""
 
+@dataclass(frozen=True)
+class _Cached:
+    body: bytes
+    etag: str
+
+
+def _cached(body: bytes) -> _Cached:
+    return _Cached(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+# The registry version is part of every key, so registering a connector invalidates the cache.
+@lru_cache(maxsize=32)
+def _catalog(capability: ConnectorCapability | None, version: int) -> _Cached:
     definitions = registry.describe()
     if capability is not None:
         definitions = [
@@ -27,35 +41,71 @@ async def list_connectors(
             for definition in definitions
             if capability in derive_capabilities(definition.tags)
         ]
-    return ConnectorListResponse.from_definitions(definitions)
+    return _cached(ConnectorListResponse.from_definitions(definitions).model_dump_json().encode())
+
+
+@lru_cache(maxsize=256)
+def _detail(name: str, version: int) -> _Cached:
+    definition = registry.definition(name)
+    return _cached(ConnectorDetailResponse.from_definition(definition).model_dump_json().encode())
+
+
+def _respond(request: Request, cached: _Cached) -> Response:
+    headers = {"ETag": cached.etag, "Cache-Control": CACHE_CONTROL}
+    # If-None-Match uses weak comparison, so a W/ prefix added by a proxy still matches.
+    header = request.headers.get("if-none-match", "")
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    if cached.etag in candidates or "*" in candidates:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.body, media_type="application/json", headers=headers)
+
+
+@router.get("", response_model=ConnectorListResponse)
+async def list_connectors(
+    request: Request,
+    capability: ConnectorCapability | None = Query(
+        default=None, description="Filter by connector capability"
+    ),
+) -> Response:
+    """Return all registered connectors and their metadata."""
+
+    return _respond(request, _catalog(capability, registry.version))
 
 
 @router.get("/{name}", response_model=ConnectorDetailResponse)
-async def get_connector(name: str) -> ConnectorDetailResponse:
+async def get_connector(name: str, request: Request) -> Response:
     """Return metadata for a specific connector."""
 
     try:
-        definition = registry.get(name).to_definition()
-    except LookupError as exc:  # pragma: no cover - defensive branch
+        cached = _detail(name, registry.version)
+    except LookupError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
-    return ConnectorDetailResponse.from_definition(definition)
+    return _respond(request, cached)
 
 
 @router.post("/{name}/validate", response_model=ConnectorValidationResponse)
 async def validate_connector(
     name: str, request: ConnectorValidationRequest
 ) -> ConnectorValidationResponse:
-    """Validate a connector configuration without executing the pipeline."""
+    """Validate a connector configuration without executing the pipeline.
+
+    Schema violations are all reported at once; the connector's own checks run only
+    for configurations that match its schema.
+    """
 
     try:
-        connector = registry.create(name, **request.config)
+        errors = registry.validate_config(name, request.config)
     except LookupError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    if errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=errors)
 
     try:
-        connector.validate()
+        registry.create(name, **request.config).validate()
     except Exception as exc:  # pylint: disable=broad-except
-        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)) from exc
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=[str(exc)]
+        ) from exc
 
     return ConnectorValidationResponse(name=name, valid=True)
@@ -1,22 +1,27 @@
 """REST endpoints for global pipeline job listing."""
 
-from fastapi import APIRouter, Depends
-from sqlmodel import desc, func, select
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.api.v1.schemas.pipelines import JobListResponse, JobResponse
-from app.db import get_session
-from app.db.models import Job, JobStatus
+from app.api.v1.pagination import paginate
+from app.api.v1.schemas.pipelines import JobArtifactResponse, JobListResponse, JobResponse
+from app.db import get_async_session
+from app.db.models import Job, JobArtifact, JobStatus
+from app.services.workflows.concurrency import cancel_job
 
 router = APIRouter(prefix="/jobs", tags=["jobs"])
 
 
 @router.get("", response_model=JobListResponse)
 async def list_jobs(
-    skip: int = 0,
     limit: int = 50,
+    cursor: str | None = None,
+    include_total: bool = False,
     status_filter: JobStatus | None = None,
     pipeline_id: int | None = None,
-    session=Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> JobListResponse:
     """List jobs across all pipelines with optional filtering."""
 
@@ -26,13 +31,88 @@ async def list_jobs(
     if pipeline_id is not None:
         query = query.where(Job.pipeline_id == pipeline_id)
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total = session.exec(count_query).one()
-
-    query = query.offset(skip).limit(limit).order_by(desc(Job.created_at))
-    jobs = session.exec(query).all()
+    page = await paginate(session, query, Job, limit, cursor, include_total)
 
     return JobListResponse(
-        jobs=[JobResponse.model_validate(job) for job in jobs],
-        total=total,
+        jobs=[JobResponse.model_validate(job) for job in page.items],
+        total=page.total,
+        total_estimated=page.total_estimated,
+        next_cursor=page.next_cursor,
+    )
+
+
+@router.post("/{job_id}/cancel", response_model=JobResponse)
+async def cancel(
+    job_id: int,
+    session: AsyncSession = Depends(get_async_session),
+) -> JobResponse:
+    """Cancel an unfinished job; running jobs stop within ``job_cancel_poll_seconds``.
+
+    The pipeline's next queued run, if any, starts in its place.
+    """
+
+    job = await session.get(Job, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found",
+        )
+
+    if job.status not in (JobStatus.QUEUED, JobStatus.PENDING, JobStatus.RUNNING):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Job {job_id} has already finished",
+        )
+
+    promoted = await session.run_sync(lambda sync_session: cancel_job(sync_session, job))
+    if promoted is not None:
+        from app.services.workflows import tasks
+
+        try:
+            await run_in_threadpool(tasks.enqueue_runs, [promoted])
+        except Exception:
+            # As for new runs, the job stays pending when the broker is unavailable.
+            pass
+
+    return JobResponse.model_validate(job)
+
+
+@router.get("/{job_id}/artifacts", response_model=list[JobArtifactResponse])
+async def list_job_artifacts(
+    job_id: int,
+    session: AsyncSession = Depends(get_async_session),
+) -> list[JobArtifactResponse]:
+    """List artifacts recorded for a job."""
+
+    if not await session.get(Job, job_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found",
+        )
+
+    query = select(JobArtifact).where(JobArtifact.job_id == job_id).order_by(JobArtifact.id)
+    artifacts = (await session.exec(query)).all()
+    return [JobArtifactResponse.model_validate(artifact) for artifact in artifacts]
+
+
+@router.get("/{job_id}/artifacts/{name}")
+async def get_job_artifact(
+    job_id: int,
+    name: str,
+    session: AsyncSession = Depends(get_async_session),
+) -> Response:
+    """Download a job artifact, e.g. ``profile.folded`` for flamegraph tools."""
+
+    query = select(JobArtifact).where(JobArtifact.job_id == job_id, JobArtifact.name == name)
+    artifact = (await session.exec(query)).first()
+    if not artifact:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Artifact '{name}' not found for job {job_id}",
+        )
+
+    return Response(
+        content=artifact.content,
+        media_type=artifact.content_type,
+        headers={"Content-Disposition": f'attachment; filename="job-{job_id}-{name}"'},
     )
@@ -1,51 +1,148 @@
 """REST endpoints for pipeline management."""
 
 from datetime import datetime
+from typing import Any, TypeVar
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import select, func, desc
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import insert
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.api.v1.pagination import paginate
 from app.api.v1.schemas.pipelines import (
+    JobBatchResponse,
+    JobListResponse,
+    JobResponse,
+    PipelineBatchCreate,
+    PipelineBatchResponse,
+    PipelineBatchRunRequest,
+    PipelineBatchUpdate,
     PipelineCreate,
     PipelineListResponse,
     PipelineResponse,
-    PipelineUpdate,
-    JobListResponse,
-    JobResponse,
     PipelineRunRequest,
+    PipelineUpdate,
 )
-from app.db import get_session
-from app.db.models import Pipeline, Job, JobStatus, PipelineStatus
+from app.db import get_async_session
+from app.db.models import Job, Pipeline, PipelineStatus
 from app.services.connectors import derive_capabilities, registry
+from app.services.workflows.concurrency import start_jobs
 
 router = APIRouter(prefix="/pipelines", tags=["pipelines"])
 
+ModelT = TypeVar("ModelT", bound=SQLModel)
 
-def _require_connector_capability(name: str, required: str) -> None:
-    """Ensure a connector supports the required role."""
+
+def _capability_error(name: str, required: str) -> str | None:
+    """Explain why a connector cannot fill the required role, if it cannot."""
 
     try:
-        connector_cls = registry.get(name)
+        definition = registry.definition(name)
     except LookupError:
+        return f"Connector '{name}' not found"
+
+    if required not in derive_capabilities(definition.tags):
+        return f"Connector '{name}' does not support '{required}' capability"
+    return None
+
+
+def _require_connector_capability(name: str, required: str) -> None:
+    """Ensure a connector supports the required role."""
+
+    error = _capability_error(name, required)
+    if error:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=error)
+
+
+def _config_errors(pipeline: PipelineCreate | Pipeline, prefix: str = "") -> list[str]:
+    """Every way a pipeline's configurations violate their connectors' schemas."""
+
+    errors = registry.validate_config(
+        pipeline.source_connector, pipeline.source_config, f"{prefix}source_config"
+    )
+    errors += registry.validate_config(
+        pipeline.destination_connector, pipeline.destination_config, f"{prefix}destination_config"
+    )
+    return errors
+
+
+def _require_valid_configs(pipeline: PipelineCreate | Pipeline) -> None:
+    """Reject configurations that violate their connectors' schemas, listing every violation."""
+
+    errors = _config_errors(pipeline)
+    if errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=errors)
+
+
+def _apply_update(pipeline: Pipeline, changes: dict[str, Any], updated_at: datetime) -> bool:
+    """Set the changed fields on ``pipeline``; returns whether a configuration changed."""
+
+    for field, value in changes.items():
+        setattr(pipeline, field, value)
+    pipeline.updated_at = updated_at
+    return bool(changes.keys() & {"source_config", "destination_config"})
+
+
+async def _load_pipelines(session: AsyncSession, pipeline_ids: list[int]) -> dict[int, Pipeline]:
+    """Fetch the pipelines of a batch request with one query; all must exist."""
+
+    if len(set(pipeline_ids)) != len(pipeline_ids):
         raise HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Connector '{name}' not found",
+            detail="Each pipeline may appear only once in a batch",
         )
 
-    capabilities = derive_capabilities(list(getattr(connector_cls, "tags", [])))
-    if required not in capabilities:
+    query = select(Pipeline).where(
+        Pipeline.id.in_(pipeline_ids), Pipeline.status != PipelineStatus.DELETED
+    )
+    pipelines = {pipeline.id: pipeline for pipeline in (await session.exec(query)).all()}
+    missing = [str(pipeline_id) for pipeline_id in pipeline_ids if pipeline_id not in pipelines]
+    if missing:
         raise HTTPException(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            detail=f"Connector '{name}' does not support '{required}' capability",
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Pipelines not found: {', '.join(missing)}",
         )
+    return pipelines
+
+
+async def _bulk_insert(
+    session: AsyncSession, model: type[ModelT], rows: list[dict]
+) -> list[ModelT]:
+    """Insert rows with multi-row INSERT ... RETURNING statements, in ``rows`` order."""
+
+    inserted = (await session.scalars(insert(model).returning(model), rows)).all()
+    # Ids are drawn in VALUES order, so sorting restores the input order; asking for ordered
+    # RETURNING instead would make SQLite fall back to one INSERT per row.
+    return sorted(inserted, key=lambda row: row.id)
+
+
+def _new_pipeline(pipeline: PipelineCreate) -> Pipeline:
+    return Pipeline(
+        name=pipeline.name,
+        description=pipeline.description,
+        source_connector=pipeline.source_connector,
+        source_config=pipeline.source_config,
+        destination_connector=pipeline.destination_connector,
+        destination_config=pipeline.destination_config,
+        schedule_cron=pipeline.schedule_cron,
+        replication_mode=pipeline.replication_mode,
+        incremental_key=pipeline.incremental_key,
+        batch_size=pipeline.batch_size,
+        memory_budget_mb=pipeline.memory_budget_mb,
+        concurrency_policy=pipeline.concurrency_policy,
+        fair_share_weight=pipeline.fair_share_weight,
+        status=PipelineStatus.DRAFT,
+    )
 
 
 @router.get("", response_model=PipelineListResponse)
 async def list_pipelines(
-    skip: int = 0,
     limit: int = 50,
+    cursor: str | None = None,
+    include_total: bool = False,
     status_filter: PipelineStatus | None = None,
-    session=Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> PipelineListResponse:
     """List all pipelines with pagination."""
 
@@ -53,57 +150,146 @@ async def list_pipelines(
     if status_filter:
         query = query.where(Pipeline.status == status_filter)
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total = session.exec(count_query).one()
-
-    query = query.offset(skip).limit(limit).order_by(desc(Pipeline.created_at))
-    pipelines = session.exec(query).all()
+    page = await paginate(session, query, Pipeline, limit, cursor, include_total)
 
     return PipelineListResponse(
-        pipelines=[PipelineResponse.model_validate(p) for p in pipelines],
-        total=total,
+        pipelines=[PipelineResponse.model_validate(p) for p in page.items],
+        total=page.total,
+        total_estimated=page.total_estimated,
+        next_cursor=page.next_cursor,
     )
 
 
 @router.post("", response_model=PipelineResponse, status_code=status.HTTP_201_CREATED)
 async def create_pipeline(
     pipeline: PipelineCreate,
-    session=Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> PipelineResponse:
     """Create a new pipeline."""
 
     _require_connector_capability(pipeline.source_connector, "source")
     _require_connector_capability(pipeline.destination_connector, "destination")
+    _require_valid_configs(pipeline)
 
-    db_pipeline = Pipeline(
-        name=pipeline.name,
-        description=pipeline.description,
-        source_connector=pipeline.source_connector,
-        source_config=pipeline.source_config,
-        destination_connector=pipeline.destination_connector,
-        destination_config=pipeline.destination_config,
-        schedule_cron=pipeline.schedule_cron,
-        replication_mode=pipeline.replication_mode,
-        incremental_key=pipeline.incremental_key,
-        batch_size=pipeline.batch_size,
-        status=PipelineStatus.DRAFT,
-    )
-
+    db_pipeline = _new_pipeline(pipeline)
     session.add(db_pipeline)
-    session.commit()
-    session.refresh(db_pipeline)
+    await session.commit()
 
     return PipelineResponse.model_validate(db_pipeline)
 
 
+@router.post(":batch", response_model=PipelineBatchResponse, status_code=status.HTTP_201_CREATED)
+async def create_pipelines(
+    batch: PipelineBatchCreate,
+    session: AsyncSession = Depends(get_async_session),
+) -> PipelineBatchResponse:
+    """Create many pipelines in one transaction.
+
+    The whole batch is validated first and every problem is reported at once; nothing is
+    created unless all pipelines are valid. Rows are written with multi-row INSERTs.
+    """
+
+    errors = []
+    for index, pipeline in enumerate(batch.pipelines):
+        prefix = f"pipelines[{index}]"
+        capability_errors = [
+            error
+            for error in (
+                _capability_error(pipeline.source_connector, "source"),
+                _capability_error(pipeline.destination_connector, "destination"),
+            )
+            if error
+        ]
+        errors += [f"{prefix}: {error}" for error in capability_errors]
+        if not capability_errors:
+            errors += _config_errors(pipeline, f"{prefix}.")
+    if errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=errors)
+
+    rows = [_new_pipeline(pipeline).model_dump(exclude={"id"}) for pipeline in batch.pipelines]
+    db_pipelines = await _bulk_insert(session, Pipeline, rows)
+    await session.commit()
+
+    return PipelineBatchResponse(
+        pipelines=[PipelineResponse.model_validate(p) for p in db_pipelines]
+    )
+
+
+@router.patch(":batch", response_model=PipelineBatchResponse)
+async def update_pipelines(
+    batch: PipelineBatchUpdate,
+    session: AsyncSession = Depends(get_async_session),
+) -> PipelineBatchResponse:
+    """Update many pipelines in one transaction; all of them must exist.
+
+    Changed configurations are validated against their connectors' schemas and every
+    violation is reported at once; nothing is updated unless all of them are valid.
+    """
+
+    pipelines = await _load_pipelines(session, [item.id for item in batch.pipelines])
+
+    updated_at = datetime.utcnow()
+    errors = []
+    for index, item in enumerate(batch.pipelines):
+        pipeline = pipelines[item.id]
+        if _apply_update(pipeline, item.model_dump(exclude_unset=True, exclude={"id"}), updated_at):
+            errors += _config_errors(pipeline, f"pipelines[{index}].")
+    if errors:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=errors)
+    await session.commit()
+
+    return PipelineBatchResponse(
+        pipelines=[PipelineResponse.model_validate(pipelines[item.id]) for item in batch.pipelines]
+    )
+
+
+@router.post(":batch/run", response_model=JobBatchResponse)
+async def run_pipelines(
+    request: PipelineBatchRunRequest,
+    session: AsyncSession = Depends(get_async_session),
+) -> JobBatchResponse:
+    """Trigger a run of every listed pipeline.
+
+    Each run follows its pipeline's concurrency policy, so a pipeline that is already
+    running returns that job unless its policy queues or replaces runs. New jobs are
+    inserted together and their run messages are published as one Celery group over a
+    single broker connection.
+    """
+
+    pipelines = await _load_pipelines(session, request.pipeline_ids)
+    inactive = [
+        str(p_id)
+        for p_id in request.pipeline_ids
+        if pipelines[p_id].status != PipelineStatus.ACTIVE
+    ]
+    if inactive:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Pipelines must be active to run: {', '.join(inactive)}",
+        )
+
+    jobs, pending = await session.run_sync(start_jobs, request.pipeline_ids, request.backfill)
+    await session.commit()
+
+    from app.services.workflows import tasks
+
+    try:
+        await run_in_threadpool(tasks.enqueue_runs, pending, profile=request.profile)
+    except Exception:
+        # As with single runs, jobs stay pending when the broker is unavailable.
+        pass
+
+    return JobBatchResponse(jobs=[JobResponse.model_validate(job) for job in jobs])
+
+
 @router.get("/{pipeline_id}", response_model=PipelineResponse)
 async def get_pipeline(
     pipeline_id: int,
-    session=Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> PipelineResponse:
     """Get a specific pipeline."""
 
-    pipeline = session.get(Pipeline, pipeline_id)
+    pipeline = await session.get(Pipeline, pipeline_id)
     if not pipeline or pipeline.status == PipelineStatus.DELETED:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -117,25 +303,21 @@ async def get_pipeline(
 async def update_pipeline(
     pipeline_id: int,
     update: PipelineUpdate,
-    session=Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> PipelineResponse:
     """Update a pipeline."""
 
-    pipeline = session.get(Pipeline, pipeline_id)
+    pipeline = await session.get(Pipeline, pipeline_id)
     if not pipeline or pipeline.status == PipelineStatus.DELETED:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Pipeline {pipeline_id} not found",
         )
 
-    update_data = update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(pipeline, field, value)
-
-    pipeline.updated_at = datetime.utcnow()
+    if _apply_update(pipeline, update.model_dump(exclude_unset=True), datetime.utcnow()):
+        _require_valid_configs(pipeline)
     session.add(pipeline)
-    session.commit()
-    session.refresh(pipeline)
+    await session.commit()
 
     return PipelineResponse.model_validate(pipeline)
 
@@ -143,11 +325,11 @@ async def update_pipeline(
 @router.delete("/{pipeline_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_pipeline(
     pipeline_id: int,
-    session=Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> None:
     """Soft delete a pipeline."""
 
-    pipeline = session.get(Pipeline, pipeline_id)
+    pipeline = await session.get(Pipeline, pipeline_id)
     if not pipeline:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -156,18 +338,22 @@ async def delete_pipeline(
 
     pipeline.status = PipelineStatus.DELETED
     pipeline.updated_at = datetime.utcnow()
-    session.commit()
+    await session.commit()
 
 
 @router.post("/{pipeline_id}/run", response_model=JobResponse)
 async def run_pipeline(
     pipeline_id: int,
     request: PipelineRunRequest | None = None,
-    session=Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> JobResponse:
-    """Trigger a pipeline run."""
+    """Trigger a pipeline run, following the pipeline's concurrency policy.
+
+    While a previous run is unfinished, ``skip`` returns that job, ``queue`` returns a
+    queued job that starts when it ends and ``cancel_previous`` cancels it.
+    """
 
-    pipeline = session.get(Pipeline, pipeline_id)
+    pipeline = await session.get(Pipeline, pipeline_id)
     if not pipeline or pipeline.status == PipelineStatus.DELETED:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -180,17 +366,17 @@ async def run_pipeline(
             detail="Pipeline must be active to run",
         )
 
-    job = Job(
-        pipeline_id=pipeline_id,
-        status=JobStatus.PENDING,
+    (job,), pending = await session.run_sync(
+        start_jobs, [pipeline_id], bool(request and request.backfill)
     )
-    session.add(job)
-    session.commit()
-    session.refresh(job)
+    await session.commit()
+
+    from app.services.workflows import tasks
 
-    from app.services.workflows.tasks import run_pipeline_task
     try:
-        run_pipeline_task.delay(job.id)
+        await run_in_threadpool(
+            tasks.enqueue_runs, pending, profile=bool(request and request.profile)
+        )
     except Exception:
         # Keep API responsive in environments where the broker is unavailable.
         # The job remains pending and can be retried by a worker later.
@@ -202,13 +388,14 @@ async def run_pipeline(
 @router.get("/{pipeline_id}/jobs", response_model=JobListResponse)
 async def list_pipeline_jobs(
     pipeline_id: int,
-    skip: int = 0,
     limit: int = 20,
-    session=Depends(get_session),
+    cursor: str | None = None,
+    include_total: bool = False,
+    session: AsyncSession = Depends(get_async_session),
 ) -> JobListResponse:
     """List jobs for a pipeline."""
 
-    pipeline = session.get(Pipeline, pipeline_id)
+    pipeline = await session.get(Pipeline, pipeline_id)
     if not pipeline or pipeline.status == PipelineStatus.DELETED:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -216,26 +403,24 @@ async def list_pipeline_jobs(
         )
 
     query = select(Job).where(Job.pipeline_id == pipeline_id)
-    count_query = select(func.count()).select_from(query.subquery())
-    total = session.exec(count_query).one()
-
-    query = query.offset(skip).limit(limit).order_by(desc(Job.created_at))
-    jobs = session.exec(query).all()
+    page = await paginate(session, query, Job, limit, cursor, include_total)
 
     return JobListResponse(
-        jobs=[JobResponse.model_validate(j) for j in jobs],
-        total=total,
+        jobs=[JobResponse.model_validate(j) for j in page.items],
+        total=page.total,
+        total_estimated=page.total_estimated,
+        next_cursor=page.next_cursor,
     )
 
 
 @router.get("/{pipeline_id}/validate")
 async def validate_pipeline(
     pipeline_id: int,
-    session=Depends(get_session),
+    session: AsyncSession = Depends(get_async_session),
 ) -> dict:
     """Validate pipeline configuration."""
 
-    pipeline = session.get(Pipeline, pipeline_id)
+    pipeline = await session.get(Pipeline, pipeline_id)
     if not pipeline or pipeline.status == PipelineStatus.DELETED:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -243,17 +428,16 @@ async def validate_pipeline(
         )
 
     errors = []
-
-    try:
-        source = registry.create(pipeline.source_connector, **pipeline.source_config)
-        source.validate()
-    except Exception as e:
-        errors.append(f"Source: {str(e)}")
-
-    try:
-        dest = registry.create(pipeline.destination_connector, **pipeline.destination_config)
-        dest.validate()
-    except Exception as e:
-        errors.append(f"Destination: {str(e)}")
+    for label, name, config in (
+        ("Source", pipeline.source_connector, pipeline.source_config),
+        ("Destination", pipeline.destination_connector, pipeline.destination_config),
+    ):
+        try:
+            problems = registry.validate_config(name, config)
+            if not problems:
+                registry.create(name, **config).validate()
+        except Exception as e:
+            problems = [str(e)]
+        errors.extend(f"{label}: {error}" for error in problems)
 
     return {"valid": len(errors) == 0, "errors": errors}
@@ -0,0 +1,98 @@
+"""Keyset pagination for listing endpoints.
+
+Lists are ordered newest first by ``(created_at, id)`` and continued with an
+opaque cursor holding the last row's key, so every page is an index range scan
+no matter how deep it is. Counting all matching rows is a full scan on large
+tables, so totals are only reported on the first page: exact when requested,
+otherwise the query planner's estimate where the database provides one.
+"""
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+from sqlmodel import SQLModel, desc, func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+MAX_LIMIT = 500
+
+
+@dataclass
+class Page:
+    items: list[Any]
+    next_cursor: str | None
+    total: int | None
+    total_estimated: bool
+
+
+def encode_cursor(row: Any) -> str:
+    """Return an opaque cursor pointing just past ``row``."""
+
+    payload = json.dumps([row.created_at.isoformat(), row.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Return the ``(created_at, id)`` key stored in ``cursor``."""
+
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), int(row_id)
+    except (binascii.Error, TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        ) from exc
+
+
+async def estimate_count(session: AsyncSession, query: Any) -> int | None:
+    """Return the planner's row estimate for ``query``, or ``None`` if unavailable."""
+
+    connection = await session.connection()
+    if connection.dialect.name != "postgresql":
+        return None
+    # Render the filter values inline so enums go through the column types' conversion.
+    compiled = query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    plan = (await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+async def paginate(
+    session: AsyncSession,
+    query: Any,
+    model: type[SQLModel],
+    limit: int,
+    cursor: str | None = None,
+    include_total: bool = False,
+) -> Page:
+    """Return the page of ``query`` following ``cursor``, or the first page."""
+
+    if limit < 1 or limit > MAX_LIMIT:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"limit must be between 1 and {MAX_LIMIT}",
+        )
+
+    total: int | None = None
+    estimated = False
+    if cursor is None:
+        if include_total:
+            total = (await session.exec(select(func.count()).select_from(query.subquery()))).one()
+        else:
+            total = await estimate_count(session, query)
+            estimated = total is not None
+    else:
+        query = query.where(tuple_(model.created_at, model.id) < tuple_(*decode_cursor(cursor)))
+
+    query = query.order_by(desc(model.created_at), desc(model.id)).limit(limit + 1)
+    rows = (await session.exec(query)).all()
+    next_cursor = encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+    return Page(rows[:limit], next_cursor, total, estimated)
@@ -1,45 +1,91 @@
 """Pydantic schemas for pipeline API endpoints."""
 
+from dataclasses import fields
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, get_type_hints
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, create_model, field_validator
 
-from app.db.models import JobStatus, PipelineStatus, ReplicationMode
+from app.db.models import ConcurrencyPolicy, JobClass, JobStatus, PipelineStatus, ReplicationMode
+from app.services.workflows.cron import CronSchedule
+from app.services.workflows.dataplane import JobMetrics as DataPlaneMetrics
+
+#: Most pipelines a single batch request may create, update or run.
+MAX_BATCH_SIZE = 1000
 
 
 class PipelineBase(BaseModel):
     """Base pipeline schema."""
 
     name: str = Field(max_length=255)
-    description: Optional[str] = None
+    description: str | None = None
     source_connector: str
-    source_config: Dict[str, Any] = Field(default_factory=dict)
+    source_config: dict[str, Any] = Field(default_factory=dict)
     destination_connector: str
-    destination_config: Dict[str, Any] = Field(default_factory=dict)
-    schedule_cron: Optional[str] = None
+    destination_config: dict[str, Any] = Field(default_factory=dict)
+    schedule_cron: str | None = None
     replication_mode: ReplicationMode = ReplicationMode.FULL_TABLE
     incremental_key: str | None = None
     batch_size: int = 10000
+    memory_budget_mb: int | None = Field(default=None, gt=0)
+    concurrency_policy: ConcurrencyPolicy = Field(
+        default=ConcurrencyPolicy.SKIP,
+        description="While a previous run is unfinished: skip the new run, queue it or cancel the previous one",
+    )
+    fair_share_weight: float = Field(
+        default=1.0,
+        gt=0,
+        description="Relative share of worker time when jobs wait in the same lane",
+    )
+
+
+def _check_schedule(value: str | None) -> str | None:
+    if value:
+        CronSchedule.parse(value)
+    return value
 
 
 class PipelineCreate(PipelineBase):
     """Schema for creating a pipeline."""
-    pass
+
+    _valid_schedule = field_validator("schedule_cron")(_check_schedule)
 
 
 class PipelineUpdate(BaseModel):
     """Schema for updating a pipeline."""
 
-    name: Optional[str] = None
-    description: Optional[str] = None
-    source_config: Optional[Dict[str, Any]] = None
-    destination_config: Optional[Dict[str, Any]] = None
-    schedule_cron: Optional[str] = None
-    status: Optional[PipelineStatus] = None
-    replication_mode: Optional[ReplicationMode] = None
-    incremental_key: Optional[str] = None
+    name: str | None = None
+    description: str | None = None
+    source_config: dict[str, Any] | None = None
+    destination_config: dict[str, Any] | None = None
+    schedule_cron: str | None = None
+    status: PipelineStatus | None = None
+    replication_mode: ReplicationMode | None = None
+    incremental_key: str | None = None
     batch_size: int | None = None
+    memory_budget_mb: int | None = Field(default=None, gt=0)
+    concurrency_policy: ConcurrencyPolicy | None = None
+    fair_share_weight: float | None = Field(default=None, gt=0)
+
+    _valid_schedule = field_validator("schedule_cron")(_check_schedule)
+
+
+class PipelineBatchUpdateItem(PipelineUpdate):
+    """Update of one pipeline within a batch."""
+
+    id: int
+
+
+class PipelineBatchCreate(BaseModel):
+    """Pipelines to create in one request."""
+
+    pipelines: list[PipelineCreate] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class PipelineBatchUpdate(BaseModel):
+    """Pipeline updates to apply in one request."""
+
+    pipelines: list[PipelineBatchUpdateItem] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
 
 
 class PipelineResponse(PipelineBase):
@@ -57,8 +103,21 @@ class PipelineResponse(PipelineBase):
 class PipelineListResponse(BaseModel):
     """List of pipelines."""
 
-    pipelines: List[PipelineResponse]
-    total: int
+    pipelines: list[PipelineResponse]
+    total: int | None = Field(
+        default=None,
+        description="Matching rows; only reported on the first page, estimated unless include_total is set",
+    )
+    total_estimated: bool = False
+    next_cursor: str | None = Field(
+        default=None, description="Pass as cursor to fetch the next page"
+    )
+
+
+class PipelineBatchResponse(BaseModel):
+    """Pipelines created or updated by a batch request, in request order."""
+
+    pipelines: list[PipelineResponse]
 
 
 class JobBase(BaseModel):
@@ -66,6 +125,21 @@ class JobBase(BaseModel):
 
     pipeline_id: int
     status: JobStatus = JobStatus.PENDING
+    job_class: JobClass = JobClass.FULL_REFRESH
+
+
+# The counters recorded by the data plane, plus the throughput derived from them.
+JobMetrics = create_model(
+    "JobMetrics",
+    __doc__="Throughput and latency recorded while a job moved data.",
+    **{
+        field.name: (hint, field.default)
+        for field, hint in zip(
+            fields(DataPlaneMetrics), get_type_hints(DataPlaneMetrics).values(), strict=True
+        )
+    },
+    rows_per_second=(float, 0.0),
+)
 
 
 class JobResponse(JobBase):
@@ -73,9 +147,21 @@ class JobResponse(JobBase):
 
     id: int
     rows_synced: int
-    error_message: Optional[str]
-    started_at: Optional[datetime]
-    completed_at: Optional[datetime]
+    error_message: str | None
+    started_at: datetime | None
+    completed_at: datetime | None
+    created_at: datetime
+    metrics: JobMetrics | None = None
+
+    class Config:
+        from_attributes = True
+
+
+class JobArtifactResponse(BaseModel):
+    """Metadata of a stored job artifact."""
+
+    name: str
+    content_type: str
     created_at: datetime
 
     class Config:
@@ -85,20 +171,50 @@ class JobResponse(JobBase):
 class JobListResponse(BaseModel):
     """List of jobs."""
 
-    jobs: List[JobResponse]
-    total: int
+    jobs: list[JobResponse]
+    total: int | None = Field(
+        default=None,
+        description="Matching rows; only reported on the first page, estimated unless include_total is set",
+    )
+    total_estimated: bool = False
+    next_cursor: str | None = Field(
+        default=None, description="Pass as cursor to fetch the next page"
+    )
 
 
 class PipelineRunRequest(BaseModel):
     """Request to run a pipeline manually."""
 
     backfill: bool = False
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+    profile: bool = Field(
+        default=False,
+        description="Record a sampled CPU profile and top allocations as job artifacts",
+    )
+
+
+class PipelineBatchRunRequest(BaseModel):
+    """Request to run many pipelines at once."""
+
+    pipeline_ids: list[int] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+    backfill: bool = Field(
+        default=False, description="Run in the backfill lane, behind scheduled syncs"
+    )
+    profile: bool = Field(
+        default=False,
+        description="Record a sampled CPU profile and top allocations as job artifacts",
+    )
+
+
+class JobBatchResponse(BaseModel):
+    """Jobs started by a batch run, in the order of the requested pipelines."""
+
+    jobs: list[JobResponse]
 
 
 class PipelineValidateRequest(BaseModel):
     """Request to validate a pipeline configuration."""
 
-    source_config: Dict[str, Any]
-    destination_config: Dict[str, Any]
+    source_config: dict[str, Any]
+    destination_config: dict[str, Any]
@@ -0,0 +1,234 @@
+"""Prometheus metrics shared by the API and the Celery workers.
+
+``prometheus_client`` is optional: when it is not installed every helper here is a
+no-op and the ``/metrics`` endpoint and worker exporter are not started.
+
+Counters are exported as running totals, so rates such as rows per second are
+derived in Prometheus (``rate(openfuse_connector_rows_total[5m])``).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any
+
+try:
+    import prometheus_client
+    from prometheus_client.core import GaugeMetricFamily
+except ImportError:  # pragma: no cover - exercised when the optional dependency is missing
+    prometheus_client = None
+
+logger = logging.getLogger(__name__)
+
+ENABLED = prometheus_client is not None
+
+#: Upper bounds (in rows) for the batch size histogram.
+BATCH_SIZE_BUCKETS = (1, 10, 100, 500, 1_000, 5_000, 10_000, 50_000, 100_000, float("inf"))
+
+if ENABLED:
+    REQUEST_LATENCY = prometheus_client.Histogram(
+        "openfuse_http_request_duration_seconds",
+        "HTTP request latency by route template.",
+        ["method", "route", "status"],
+    )
+    CONNECTOR_ROWS = prometheus_client.Counter(
+        "openfuse_connector_rows_total",
+        "Rows moved by connectors.",
+        ["connector", "direction"],
+    )
+    CONNECTOR_BYTES = prometheus_client.Counter(
+        "openfuse_connector_bytes_total",
+        "Estimated in-memory bytes moved by connectors.",
+        ["connector", "direction"],
+    )
+    CONNECTOR_ERRORS = prometheus_client.Counter(
+        "openfuse_connector_errors_total",
+        "Failed jobs by source and destination connector.",
+        ["source", "destination"],
+    )
+    BATCH_ROWS = prometheus_client.Histogram(
+        "openfuse_batch_rows",
+        "Rows per batch read from a source connector.",
+        ["connector"],
+        buckets=BATCH_SIZE_BUCKETS,
+    )
+    JOB_DURATION = prometheus_client.Histogram(
+        "openfuse_job_duration_seconds",
+        "Pipeline job run time by final status.",
+        ["status"],
+        buckets=(1, 5, 15, 30, 60, 300, 900, 1800, 3600, 7200, float("inf")),
+    )
+    PLUGIN_IMPORT = prometheus_client.Gauge(
+        "openfuse_connector_plugin_import_seconds",
+        "Time taken to import each connector plugin.",
+        ["connector"],
+        multiprocess_mode="max",
+    )
+
+
+@lru_cache
+def registry() -> Any:
+    """Return the registry to expose.
+
+    With ``PROMETHEUS_MULTIPROC_DIR`` set (required for prefork Celery workers and
+    multi-process API servers) it aggregates the metrics written by every process.
+    """
+
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        collector_registry = prometheus_client.CollectorRegistry()
+        multiprocess.MultiProcessCollector(collector_registry)
+        return collector_registry
+    return prometheus_client.REGISTRY
+
+
+def render() -> tuple[bytes, str]:
+    """Serialise the current metrics in the Prometheus text format."""
+
+    return prometheus_client.generate_latest(registry()), prometheus_client.CONTENT_TYPE_LATEST
+
+
+class PrometheusMiddleware:
+    """ASGI middleware recording request latency labelled by the matched route template.
+
+    Labelling by template (``/api/v1/pipelines/{pipeline_id}``) rather than the raw path
+    keeps the number of series bounded.
+    """
+
+    def __init__(self, app: Callable) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: dict) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                scope["method"],
+                getattr(route, "path", "<unmatched>"),
+                str(status),
+            ).observe(time.perf_counter() - started)
+
+
+class PoolCollector:
+    """Report SQLAlchemy connection pool usage at scrape time, per named engine."""
+
+    def __init__(self, engines: dict[str, Any]) -> None:
+        self.engines = engines
+
+    def collect(self) -> Iterable[Any]:
+        family = GaugeMetricFamily(
+            "openfuse_db_pool_connections",
+            "Database pool connections by state.",
+            labels=["engine", "state"],
+        )
+        for name, engine in self.engines.items():
+            pool = engine.pool
+            for state, read in (
+                ("size", "size"),
+                ("checked_out", "checkedout"),
+                ("idle", "checkedin"),
+                ("overflow", "overflow"),
+            ):
+                # Pools used for SQLite do not track every state, and SingletonThreadPool
+                # has its size as an attribute rather than a method.
+                value = getattr(pool, read, None)
+                if callable(value):
+                    value = value()
+                if isinstance(value, int):
+                    family.add_metric([name, state], value)
+        yield family
+
+
+class QueueDepthCollector:
+    """Report the number of messages waiting on each Celery queue at scrape time."""
+
+    def __init__(self, celery_app: Any, queues: Iterable[str]) -> None:
+        self.celery_app = celery_app
+        self.queues = list(queues)
+
+    def collect(self) -> Iterable[Any]:
+        family = GaugeMetricFamily(
+            "openfuse_celery_queue_depth", "Messages waiting on a Celery queue.", labels=["queue"]
+        )
+        try:
+            with self.celery_app.connection_for_read() as connection:
+                channel = connection.default_channel
+                for queue in self.queues:
+                    declared = channel.queue_declare(queue=queue, passive=True)
+                    family.add_metric([queue], declared.message_count)
+        except Exception:  # noqa: BLE001 - a broker outage must not fail the scrape
+            logger.warning("Could not read Celery queue depth", exc_info=True)
+        yield family
+
+
+def register_collector(collector: Any) -> None:
+    """Add a scrape-time collector to the exposed registry."""
+
+    if ENABLED:
+        registry().register(collector)
+
+
+def observe_batch(connector: str, rows: int) -> None:
+    if ENABLED:
+        BATCH_ROWS.labels(connector).observe(rows)
+
+
+def observe_plugin_import(connector: str, seconds: float) -> None:
+    if ENABLED:
+        PLUGIN_IMPORT.labels(connector).set(seconds)
+
+
+def observe_job(
+    source: str,
+    destination: str,
+    status: str,
+    job_metrics: dict[str, Any],
+) -> None:
+    """Record the outcome and throughput of a finished pipeline job."""
+
+    if not ENABLED:
+        return
+    CONNECTOR_ROWS.labels(source, "read").inc(job_metrics.get("rows_read", 0))
+    CONNECTOR_BYTES.labels(source, "read").inc(job_metrics.get("bytes_read", 0))
+    CONNECTOR_ROWS.labels(destination, "write").inc(job_metrics.get("rows_written", 0))
+    CONNECTOR_BYTES.labels(destination, "write").inc(job_metrics.get("bytes_written", 0))
+    JOB_DURATION.labels(status).observe(job_metrics.get("elapsed_seconds", 0.0))
+    if status == "failed":
+        CONNECTOR_ERRORS.labels(source, destination).inc()
+
+
+def start_exporter(port: int) -> None:
+    """Serve metrics over HTTP from a process without an ASGI app (the Celery worker)."""
+
+    if not ENABLED or not port:
+        return
+    prometheus_client.start_http_server(port, registry=registry())
+    logger.info("Serving Prometheus metrics on port %s", port)
+
+
+def mark_process_dead(pid: int) -> None:
+    """Drop live gauges of an exited worker process in multiprocess mode."""
+
+    if ENABLED and "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(pid)
@@ -0,0 +1,265 @@
+"""OpenTelemetry tracing for the API, Celery tasks and connector work.
+
+A job's trace starts at the API request that queued it, crosses the broker through
+W3C trace context in the Celery message headers and continues in the worker with
+spans for each connector phase, batch write, HTTP page fetch and database query.
+
+``opentelemetry-api`` and ``opentelemetry-sdk`` are optional: without them every
+helper here is a no-op. Exporters are chosen with ``OPENFUSE_OTEL_EXPORTER``:
+``otlp`` (configured through the standard ``OTEL_EXPORTER_OTLP_*`` variables, needs
+``opentelemetry-exporter-otlp-proto-http``), ``console``, ``file`` (JSON lines at
+``OPENFUSE_OTEL_FILE_PATH``, used by tests) or ``none``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+import httpx
+
+try:
+    from opentelemetry import context, propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover - exercised when the optional dependency is missing
+    trace = None
+
+logger = logging.getLogger(__name__)
+
+ENABLED = trace is not None
+
+#: Longest SQL statement recorded on database spans.
+MAX_STATEMENT_LENGTH = 2048
+
+_tracer = trace.get_tracer("openfuse") if ENABLED else None
+_configured = False
+
+
+class _NoopSpan:
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def record_exception(self, exc: BaseException) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+NOOP_SPAN = _NoopSpan()
+
+
+@contextmanager
+def span(name: str, kind: Any = None, **attributes: Any) -> Iterator[Any]:
+    """Run the block inside a new current span, recording any exception it raises."""
+
+    if not ENABLED:
+        yield NOOP_SPAN
+        return
+    with _tracer.start_as_current_span(
+        name, kind=kind or SpanKind.INTERNAL, attributes=_clean(attributes)
+    ) as current:
+        yield current
+
+
+def start_span(name: str, **attributes: Any) -> Any:
+    """Start a span that is not made current; the caller must ``end()`` it.
+
+    Used where the traced work spans an ``await`` or ``yield`` owned by another frame.
+    """
+
+    if not ENABLED:
+        return NOOP_SPAN
+    return _tracer.start_span(name, attributes=_clean(attributes))
+
+
+def _clean(attributes: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in attributes.items() if value is not None}
+
+
+def configure_tracing(service_name: str) -> None:
+    """Install the global tracer provider for this process (once)."""
+
+    global _configured
+
+    from app.core.config import settings
+
+    exporter_name = settings.otel_exporter.lower()
+    if _configured or exporter_name == "none":
+        return
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import (
+            BatchSpanProcessor,
+            ConsoleSpanExporter,
+            SimpleSpanProcessor,
+        )
+    except ImportError:
+        logger.warning("opentelemetry-sdk is not installed; tracing is disabled")
+        return
+
+    provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+    if exporter_name == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+
+        provider.add_span_processor(BatchSpanProcessor(OTLPSpanExporter()))
+    elif exporter_name == "console":
+        provider.add_span_processor(BatchSpanProcessor(ConsoleSpanExporter()))
+    elif exporter_name == "file":
+        # Exported synchronously so spans are on disk as soon as they end.
+        provider.add_span_processor(SimpleSpanProcessor(FileSpanExporter(settings.otel_file_path)))
+    else:
+        raise ValueError(f"Unknown OpenTelemetry exporter '{settings.otel_exporter}'")
+
+    trace.set_tracer_provider(provider)
+    _configured = True
+
+
+class FileSpanExporter:
+    """Append finished spans to a file as JSON lines."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Any]) -> Any:
+        from opentelemetry.sdk.trace.export import SpanExportResult
+
+        lines = [json.dumps(json.loads(s.to_json())) + "\n" for s in spans]
+        with self._lock, open(self.path, "a", encoding="utf-8") as handle:
+            handle.writelines(lines)
+        return SpanExportResult.SUCCESS
+
+    def shutdown(self) -> None:
+        pass
+
+    def force_flush(self, timeout_millis: int = 30000) -> bool:
+        return True
+
+
+class TracingMiddleware:
+    """ASGI middleware opening a server span per request, continuing incoming trace context."""
+
+    def __init__(self, app: Callable) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        carrier = {
+            key.decode("latin-1"): value.decode("latin-1") for key, value in scope["headers"]
+        }
+        token = context.attach(propagate.extract(carrier))
+        try:
+            with span(
+                f"{scope['method']} {scope['path']}",
+                kind=SpanKind.SERVER,
+                **{"http.request.method": scope["method"], "url.path": scope["path"]},
+            ) as current:
+
+                async def send_with_status(message: dict) -> None:
+                    if message["type"] == "http.response.start":
+                        current.set_attribute("http.response.status_code", message["status"])
+                        if message["status"] >= 500:
+                            current.set_status(Status(StatusCode.ERROR))
+                    await send(message)
+
+                try:
+                    await self.app(scope, receive, send_with_status)
+                finally:
+                    route = getattr(scope.get("route"), "path", None)
+                    if route:
+                        current.update_name(f"{scope['method']} {route}")
+                        current.set_attribute("http.route", route)
+        finally:
+            context.detach(token)
+
+
+class TracedTransport(httpx.AsyncHTTPTransport):
+    """httpx transport recording a client span for every request (e.g. each API page)."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        with span(
+            f"HTTP {request.method}",
+            kind=SpanKind.CLIENT if ENABLED else None,
+            **{
+                "http.request.method": request.method,
+                "server.address": request.url.host,
+                "url.path": request.url.path,
+            },
+        ) as current:
+            response = await super().handle_async_request(request)
+            current.set_attribute("http.response.status_code", response.status_code)
+            return response
+
+
+def instrument_engine(engine: Any) -> None:
+    """Record a span for every statement executed through a SQLAlchemy engine."""
+
+    if not ENABLED:
+        return
+
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _start(conn, cursor, statement, parameters, execution_context, executemany):
+        execution_context._openfuse_span = start_span(
+            "db.query",
+            **{
+                "db.system": engine.dialect.name,
+                "db.statement": statement[:MAX_STATEMENT_LENGTH],
+            },
+        )
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _end(conn, cursor, statement, parameters, execution_context, executemany):
+        current = getattr(execution_context, "_openfuse_span", None)
+        if current is not None:
+            current.end()
+
+    @event.listens_for(engine, "handle_error")
+    def _fail(exception_context):
+        execution_context = exception_context.execution_context
+        current = getattr(execution_context, "_openfuse_span", None)
+        if current is not None:
+            current.record_exception(exception_context.original_exception)
+            current.set_status(Status(StatusCode.ERROR))
+            current.end()
+
+
+def instrument_celery(celery_app: Any) -> None:
+    """Propagate trace context from publishers to tasks through Celery message headers."""
+
+    if not ENABLED:
+        return
+
+    from celery import signals
+
+    tokens: dict[str, Any] = {}
+
+    @signals.before_task_publish.connect(weak=False)
+    def _inject(headers: dict | None = None, **_: Any) -> None:
+        if headers is not None:
+            propagate.inject(headers)
+
+    @signals.task_prerun.connect(weak=False)
+    def _extract(task_id: str | None = None, task: Any = None, **_: Any) -> None:
+        fields = propagate.get_global_textmap().fields
+        carrier = {
+            field: value for field in fields if (value := getattr(task.request, field, None))
+        }
+        if carrier:
+            tokens[task_id] = context.attach(propagate.extract(carrier))
+
+    @signals.task_postrun.connect(weak=False)
+    def _release(task_id: str | None = None, **_: Any) -> None:
+        token = tokens.pop(task_id, None)
+        if token is not None:
+            context.detach(token)
@@ -1,19 +1,69 @@
 """Database session management for OpenFuse."""
 
-from sqlmodel import Session, SQLModel, create_engine
-from typing import Generator
+from collections.abc import AsyncGenerator, Generator
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.core.metrics import PoolCollector, register_collector
+from app.core.tracing import instrument_engine
+
+# Async drivers for the sync drivers database_url may name.
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+psycopg",
+    "postgresql+psycopg2": "postgresql+psycopg",
+    "sqlite": "sqlite+aiosqlite",
+    "sqlite+pysqlite": "sqlite+aiosqlite",
+    "mysql": "mysql+aiomysql",
+    "mysql+pymysql": "mysql+aiomysql",
+}
+
+
+def async_database_url(url: str) -> str:
+    """Return ``url`` with its driver swapped for an asyncio one (psycopg 3 serves both)."""
+
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
 
+def _pool_options(url: str) -> dict:
+    # SQLite uses pools without size limits (and a single shared connection in memory).
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": settings.database_pool_size,
+        "max_overflow": settings.database_max_overflow,
+        "pool_timeout": settings.database_pool_timeout,
+        "pool_recycle": settings.database_pool_recycle,
+    }
+
+
+# Celery tasks, migrations and maintenance commands use the synchronous engine.
 engine = create_engine(settings.database_url, echo=False, pool_pre_ping=True)
 
+# API endpoints await queries on the async engine so requests do not block the event loop.
+async_url = settings.async_database_url or async_database_url(settings.database_url)
+async_engine = create_async_engine(
+    async_url, echo=False, pool_pre_ping=True, **_pool_options(async_url)
+)
 
-def create_db_and_tables() -> None:
-    """Create all database tables."""
-    SQLModel.metadata.create_all(engine)
+register_collector(PoolCollector({"sync": engine, "async": async_engine.sync_engine}))
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
 
 
 def get_session() -> Generator[Session, None, None]:
     """Get database session."""
     with Session(engine) as session:
         yield session
+
+
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get an async database session for request handlers."""
+    # Objects stay readable after commit without another round trip to refresh them.
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        yield session
@@ -0,0 +1,74 @@
+"""Alembic integration: schema version checks and programmatic upgrades."""
+
+from functools import lru_cache
+from pathlib import Path
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError, ProgrammingError
+
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+
+class SchemaOutOfDate(RuntimeError):
+    """Raised when the database is not at the latest migration."""
+
+
+def alembic_config(connection: Connection | None = None) -> Config:
+    config = Config(str(ALEMBIC_INI))
+    config.attributes["configure_logger"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+@lru_cache
+def head_revision() -> str:
+    """Latest revision in ``alembic/versions``; read from disk once per process."""
+
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def current_revision(connection: Connection) -> str | None:
+    """Revision recorded in ``alembic_version``, or ``None`` for an unmigrated database."""
+
+    try:
+        return connection.execute(text("SELECT version_num FROM alembic_version")).scalar()
+    except (OperationalError, ProgrammingError):
+        connection.rollback()
+        return None
+
+
+def upgrade(engine: Engine) -> None:
+    # Alembic manages the transactions itself; concurrent index builds need autocommit.
+    with engine.connect() as connection:
+        command.upgrade(alembic_config(connection), "head")
+
+
+def verify_schema(engine: Engine, migrate: bool = False) -> None:
+    """Ensure the database is at the head revision with a single query.
+
+    With ``migrate`` pending migrations are applied; otherwise ``SchemaOutOfDate``
+    explains how to bring the database up to date.
+    """
+
+    with engine.connect() as connection:
+        current = current_revision(connection)
+        if current == head_revision():
+            return
+        legacy = current is None and inspect(connection).has_table("pipelines")
+
+    if migrate and not legacy:
+        upgrade(engine)
+        return
+    if legacy:
+        raise SchemaOutOfDate(
+            "Database tables predate migrations; run `alembic stamp 0001` and then `alembic upgrade head`"
+        )
+    raise SchemaOutOfDate(
+        f"Database schema is at revision {current or 'none'} but the code expects {head_revision()}; "
+        "run `alembic upgrade head`"
+    )
@@ -1,14 +1,15 @@
 """Database models for OpenFuse."""
 
 from datetime import datetime
-from enum import Enum
-from typing import Any, Dict, Optional
+from enum import StrEnum
+from typing import Any
 
-from sqlalchemy.types import JSON
+from sqlalchemy import Index
+from sqlalchemy.types import JSON, Text
 from sqlmodel import Field, SQLModel
 
 
-class PipelineStatus(str, Enum):
+class PipelineStatus(StrEnum):
     """Pipeline lifecycle states."""
 
     DRAFT = "draft"
@@ -18,7 +19,7 @@ class PipelineStatus(str, Enum):
     DELETED = "deleted"
 
 
-class ReplicationMode(str, Enum):
+class ReplicationMode(StrEnum):
     """Data replication modes."""
 
     FULL_TABLE = "full_table"
@@ -26,9 +27,26 @@ class ReplicationMode(str, Enum):
     LOG_BASED = "log_based"
 
 
-class JobStatus(str, Enum):
+class ConcurrencyPolicy(StrEnum):
+    """What a run does while another run of the same pipeline is unfinished."""
+
+    SKIP = "skip"
+    QUEUE = "queue"
+    CANCEL_PREVIOUS = "cancel_previous"
+
+
+class JobClass(StrEnum):
+    """Kind of run, which decides the worker queue (lane) a job waits in."""
+
+    INCREMENTAL = "incremental"
+    FULL_REFRESH = "full_refresh"
+    BACKFILL = "backfill"
+
+
+class JobStatus(StrEnum):
     """Pipeline job execution status."""
 
+    QUEUED = "queued"
     PENDING = "pending"
     RUNNING = "running"
     COMPLETED = "completed"
@@ -40,14 +58,30 @@ class PipelineBase(SQLModel):
     """Base pipeline model."""
 
     name: str = Field(max_length=255, description="Pipeline display name")
-    description: Optional[str] = Field(default=None, max_length=1000)
+    description: str | None = Field(default=None, max_length=1000)
     source_connector: str = Field(max_length=100, description="Source connector name")
     destination_connector: str = Field(max_length=100, description="Destination connector name")
-    schedule_cron: Optional[str] = Field(default=None, description="Cron expression for scheduling")
+    schedule_cron: str | None = Field(default=None, description="Cron expression for scheduling")
     status: PipelineStatus = Field(default=PipelineStatus.DRAFT)
     replication_mode: ReplicationMode = Field(default=ReplicationMode.FULL_TABLE)
-    incremental_key: Optional[str] = Field(default=None, description="Column for incremental replication")
+    incremental_key: str | None = Field(
+        default=None, description="Column for incremental replication"
+    )
     batch_size: int = Field(default=10000, description="Rows per batch")
+    memory_budget_mb: int | None = Field(
+        default=None,
+        description="Buffered batch memory budget per job (defaults to the worker setting)",
+    )
+    concurrency_policy: ConcurrencyPolicy = Field(
+        default=ConcurrencyPolicy.SKIP,
+        description="What a run does while a previous run is unfinished",
+        sa_column_kwargs={"server_default": ConcurrencyPolicy.SKIP.name},
+    )
+    fair_share_weight: float = Field(
+        default=1.0,
+        description="Relative share of worker time when jobs wait in the same lane",
+        sa_column_kwargs={"server_default": "1"},
+    )
 
 
 class Pipeline(PipelineBase, table=True):
@@ -55,11 +89,13 @@ class Pipeline(PipelineBase, table=True):
 
     __tablename__ = "pipelines"
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    source_config: Dict[str, Any] = Field(default_factory=dict, sa_type=JSON())
-    destination_config: Dict[str, Any] = Field(default_factory=dict, sa_type=JSON())
+    id: int | None = Field(default=None, primary_key=True)
+    source_config: dict[str, Any] = Field(default_factory=dict, sa_type=JSON())
+    destination_config: dict[str, Any] = Field(default_factory=dict, sa_type=JSON())
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow})
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow}
+    )
 
 
 class JobBase(SQLModel):
@@ -67,10 +103,14 @@ class JobBase(SQLModel):
 
     pipeline_id: int = Field(foreign_key="pipelines.id")
     status: JobStatus = Field(default=JobStatus.PENDING)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    job_class: JobClass = Field(
+        default=JobClass.FULL_REFRESH,
+        sa_column_kwargs={"server_default": JobClass.FULL_REFRESH.name},
+    )
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
     rows_synced: int = 0
-    error_message: Optional[str] = None
+    error_message: str | None = None
 
 
 class Job(JobBase, table=True):
@@ -78,7 +118,37 @@ class Job(JobBase, table=True):
 
     __tablename__ = "jobs"
 
-    id: Optional[int] = Field(default=None, primary_key=True)
+    id: int | None = Field(default=None, primary_key=True)
+    metrics: dict[str, Any] | None = Field(default=None, sa_type=JSON())
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # Source host the job extracts from, for per-host concurrency limits.
+    concurrency_key: str | None = Field(default=None, max_length=255)
+    # Last sign of life from the worker running the job, or waiting on its source host.
+    heartbeat_at: datetime | None = None
+
+
+# Listings page newest first by (created_at, id), optionally filtered by pipeline or status.
+_pipelines, _jobs = Pipeline.__table__.c, Job.__table__.c
+Index("ix_pipelines_created_at_id", _pipelines.created_at.desc(), _pipelines.id.desc())
+Index("ix_jobs_created_at_id", _jobs.created_at.desc(), _jobs.id.desc())
+Index(
+    "ix_jobs_pipeline_id_created_at_id", _jobs.pipeline_id, _jobs.created_at.desc(), _jobs.id.desc()
+)
+Index("ix_jobs_status_created_at_id", _jobs.status, _jobs.created_at.desc(), _jobs.id.desc())
+# The scheduler polls for pipelines changed since its last refresh.
+Index("ix_pipelines_updated_at_id", _pipelines.updated_at, _pipelines.id)
+
+
+class JobArtifact(SQLModel, table=True):
+    """Files produced while running a job, such as profiles."""
+
+    __tablename__ = "job_artifacts"
+
+    id: int | None = Field(default=None, primary_key=True)
+    job_id: int = Field(foreign_key="jobs.id", index=True)
+    name: str = Field(max_length=255)
+    content_type: str = Field(max_length=100)
+    content: str = Field(sa_type=Text())
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
@@ -86,7 +156,9 @@ class ConnectorInstanceBase(SQLModel):
     """Saved connector configuration."""
 
     name: str = Field(max_length=255, description="Instance display name")
-    connector_type: str = Field(max_length=100, description="Connector type (e.g., postgres, snowflake)")
+    connector_type: str = Field(
+        max_length=100, description="Connector type (e.g., postgres, snowflake)"
+    )
     is_active: bool = Field(default=True)
 
 
@@ -95,7 +167,9 @@ class ConnectorInstance(ConnectorInstanceBase, table=True):
 
     __tablename__ = "connector_instances"
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    config: Dict[str, Any] = Field(default_factory=dict, sa_type=JSON())
+    id: int | None = Field(default=None, primary_key=True)
+    config: dict[str, Any] = Field(default_factory=dict, sa_type=JSON())
     created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow})
+    updated_at: datetime = Field(
+        default_factory=datetime.utcnow, sa_column_kwargs={"onupdate": datetime.utcnow}
+    )
@@ -0,0 +1,195 @@
+"""Optional monthly partitioning of the jobs table and job retention.
+
+On PostgreSQL ``python -m app.db.partitions enable`` converts ``jobs`` into a table
+range-partitioned by ``created_at`` with one partition per month, so retention can
+detach and drop whole months instead of deleting rows. The conversion copies every
+job and holds an exclusive lock while it runs, so schedule it in a maintenance window.
+
+Partitioned tables need the partition key in their primary key, which becomes
+``(id, created_at)``; ``job_artifacts.job_id`` therefore loses its foreign key and
+artifacts are removed by retention together with their jobs.
+
+Without partitioning, retention deletes expired jobs in bounded batches.
+"""
+
+import argparse
+import logging
+from datetime import date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection, Engine
+
+from app.core.config import settings
+from app.db.models import Job, JobArtifact
+
+logger = logging.getLogger(__name__)
+
+DELETE_BATCH_SIZE = 10_000
+
+
+def _month(value: datetime | date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"jobs_{month:%Y_%m}"
+
+
+def is_partitioned(connection: Connection) -> bool:
+    if connection.dialect.name != "postgresql":
+        return False
+    query = text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table WHERE partrelid = 'jobs'::regclass)"
+    )
+    return bool(connection.execute(query).scalar())
+
+
+def ensure_partitions(
+    connection: Connection, start: datetime | date, months_ahead: int
+) -> list[str]:
+    """Create monthly partitions from ``start`` until ``months_ahead`` months from now."""
+
+    created = []
+    month, last = _month(start), _month(datetime.utcnow())
+    for _ in range(months_ahead):
+        last = _next_month(last)
+    while month <= last:
+        name = partition_name(month)
+        connection.execute(
+            text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF jobs "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_next_month(month).isoformat()}')"
+            )
+        )
+        created.append(name)
+        month = _next_month(month)
+    return created
+
+
+def enable(connection: Connection, months_ahead: int) -> None:
+    """Rebuild ``jobs`` as a monthly partitioned table, keeping its rows and id sequence."""
+
+    if connection.dialect.name != "postgresql":
+        raise RuntimeError("Job partitioning requires PostgreSQL")
+    if is_partitioned(connection):
+        return
+
+    connection.execute(text("LOCK TABLE jobs IN ACCESS EXCLUSIVE MODE"))
+    oldest = (
+        connection.execute(text("SELECT min(created_at) FROM jobs")).scalar() or datetime.utcnow()
+    )
+    for statement in (
+        "CREATE TABLE jobs_partitioned (LIKE jobs INCLUDING DEFAULTS INCLUDING CONSTRAINTS) "
+        "PARTITION BY RANGE (created_at)",
+        "ALTER TABLE jobs_partitioned ADD CONSTRAINT jobs_partitioned_pkey PRIMARY KEY (id, created_at)",
+        "ALTER TABLE jobs_partitioned ADD FOREIGN KEY (pipeline_id) REFERENCES pipelines (id)",
+        # Catches rows outside the monthly partitions should retention stop running.
+        "CREATE TABLE jobs_default PARTITION OF jobs_partitioned DEFAULT",
+    ):
+        connection.execute(text(statement))
+
+    connection.execute(text("ALTER TABLE jobs RENAME TO jobs_unpartitioned"))
+    connection.execute(text("ALTER TABLE jobs_partitioned RENAME TO jobs"))
+    ensure_partitions(connection, oldest, months_ahead)
+
+    for statement in (
+        "INSERT INTO jobs SELECT * FROM jobs_unpartitioned",
+        "ALTER TABLE job_artifacts DROP CONSTRAINT IF EXISTS job_artifacts_job_id_fkey",
+        "ALTER SEQUENCE jobs_id_seq OWNED BY NONE",
+        "DROP TABLE jobs_unpartitioned",
+        "ALTER SEQUENCE jobs_id_seq OWNED BY jobs.id",
+        "ALTER TABLE jobs RENAME CONSTRAINT jobs_partitioned_pkey TO jobs_pkey",
+    ):
+        connection.execute(text(statement))
+    for index in Job.__table__.indexes:
+        index.create(connection)
+    logger.info("Partitioned jobs by month from %s", _month(oldest))
+
+
+def _drop_expired_partitions(connection: Connection, cutoff: datetime) -> list[str]:
+    names = connection.execute(
+        text(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = 'jobs'::regclass ORDER BY c.relname"
+        )
+    ).scalars()
+    dropped = []
+    for name in names:
+        try:
+            month = datetime.strptime(name, "jobs_%Y_%m").date()
+        except ValueError:
+            continue  # the default partition
+        if _next_month(month) > cutoff.date():
+            continue
+        connection.execute(
+            text(f"DELETE FROM job_artifacts WHERE job_id IN (SELECT id FROM {name})")
+        )
+        connection.execute(text(f"ALTER TABLE jobs DETACH PARTITION {name}"))
+        connection.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    return dropped
+
+
+def _delete_expired_jobs(engine: Engine, cutoff: datetime) -> int:
+    jobs, artifacts = Job.__table__, JobArtifact.__table__
+    expired = select(jobs.c.id).where(jobs.c.created_at < cutoff).limit(DELETE_BATCH_SIZE)
+    deleted = 0
+    while True:
+        # Short transactions keep locks and WAL bursts small on a busy table.
+        with engine.begin() as connection:
+            ids = connection.execute(expired).scalars().all()
+            if not ids:
+                return deleted
+            connection.execute(artifacts.delete().where(artifacts.c.job_id.in_(ids)))
+            connection.execute(jobs.delete().where(jobs.c.id.in_(ids)))
+        deleted += len(ids)
+
+
+def enforce_retention(
+    engine: Engine,
+    retention_days: int | None = None,
+    months_ahead: int | None = None,
+) -> dict[str, Any]:
+    """Create upcoming partitions and remove jobs older than the retention period."""
+
+    retention_days = settings.jobs_retention_days if retention_days is None else retention_days
+    months_ahead = settings.jobs_partitions_ahead if months_ahead is None else months_ahead
+    summary: dict[str, Any] = {"partitions_dropped": [], "jobs_deleted": 0}
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+
+    with engine.begin() as connection:
+        if is_partitioned(connection):
+            ensure_partitions(connection, datetime.utcnow(), months_ahead)
+            if retention_days:
+                summary["partitions_dropped"] = _drop_expired_partitions(connection, cutoff)
+
+    if retention_days:
+        # Also clears rows older than the cutoff left in partially expired or default partitions.
+        summary["jobs_deleted"] = _delete_expired_jobs(engine, cutoff)
+    return summary
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.db.partitions", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("command", choices=["enable", "retention"])
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    from app.db import engine
+
+    if args.command == "enable":
+        with engine.begin() as connection:
+            enable(connection, settings.jobs_partitions_ahead)
+    else:
+        logger.info("Retention: %s", enforce_retention(engine))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,20 @@
 """Entry point for the OpenFuse FastAPI application."""
 
-from typing import Dict
-
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1 import api_router
+from app.core import metrics, tracing
 from app.core.config import settings
-from app.db import create_db_and_tables
+from app.db import engine
+from app.db.migrations import verify_schema
+from app.services.connectors import registry
+from app.services.connectors.plugins import load_plugins_in_background
 
 
 def create_application() -> FastAPI:
     """Instantiate the FastAPI application with global configuration."""
+    tracing.configure_tracing("openfuse-api")
     app = FastAPI(
         title="OpenFuse API",
         version=settings.version,
@@ -22,8 +25,9 @@ def create_application() -> FastAPI:
 
     @app.on_event("startup")
     def on_startup():
-        """Create database tables on startup."""
-        create_db_and_tables()
+        """Refuse to serve against a database that is not fully migrated."""
+        verify_schema(engine, migrate=settings.migrate_on_startup)
+        load_plugins_in_background(registry)
 
     app.add_middleware(
         CORSMiddleware,
@@ -33,13 +37,26 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    if metrics.ENABLED:
+        app.add_middleware(metrics.PrometheusMiddleware)
+    if tracing.ENABLED:
+        app.add_middleware(tracing.TracingMiddleware)
+
     app.include_router(api_router, prefix=settings.api_prefix)
 
     @app.get("/health", tags=["system"])
-    async def healthcheck() -> Dict[str, str]:
+    async def healthcheck() -> dict[str, str]:
         """Liveness probe for the service."""
         return {"status": "ok"}
 
+    if metrics.ENABLED:
+
+        @app.get("/metrics", tags=["system"], include_in_schema=False)
+        def prometheus_metrics() -> Response:
+            """Prometheus scrape endpoint."""
+            content, media_type = metrics.render()
+            return Response(content=content, media_type=media_type)
+
     return app
 
 
@@ -38,8 +38,6 @@ class AirtableSourceConnector(Connector):
             raise ValueError("Base ID is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
-
         api_key = self.config["api_key"]
         base_id = self.config["base_id"]
 
@@ -49,13 +47,13 @@ class AirtableSourceConnector(Connector):
         table_ids = self.config.get("table_ids", [])
 
         if not table_ids:
-            response = await httpx.AsyncClient(headers=headers).get(base_url)
+            response = await self.http_client(headers=headers).get(base_url)
             response.raise_for_status()
             tables = response.json().get("tables", [])
             table_ids = [t["id"] for t in tables]
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             for table_id in table_ids:
                 logger.info(f"Extracting table: {table_id}")
                 offset = None
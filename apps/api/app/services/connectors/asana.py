@@ -43,8 +43,6 @@ class AsanaSourceConnector(Connector):
             raise ValueError("Access Token is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
-
         access_token = self.config["access_token"]
 
         headers = {"Authorization": f"Bearer {access_token}"}
@@ -54,7 +52,7 @@ class AsanaSourceConnector(Connector):
         project_ids = self.config.get("project_ids", [])
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             if "projects" in objects and not project_ids:
                 workspace_id = self.config.get("workspace_id", "")
                 if workspace_id:
@@ -2,9 +2,19 @@
 
 from __future__ import annotations
 
+import importlib
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
-from typing import Any, ClassVar, Literal
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
+
+from .schema import ConfigValidator, compile_schema
+
+if TYPE_CHECKING:
+    import httpx
 
 Capability = Literal["source", "destination"]
 
@@ -50,8 +60,52 @@ class Connector(ABC):
     async def run(self) -> dict[str, Any] | None:
         """Execute the connector pipeline."""
 
+    async def read(self) -> AsyncIterator[list[dict[str, Any]]]:
+        """Yield extracted records in batches.
+
+        Source connectors that can stream their data override this method. The default
+        implementation signals that the connector does not expose records.
+        """
+
+        raise NotImplementedError(f"Connector '{self.name}' does not stream records")
+        yield  # pragma: no cover - marks this method as an async generator
+
+    async def write(self, batches: AsyncIterator[list[dict[str, Any]]]) -> dict[str, Any]:
+        """Load record batches produced by a source connector.
+
+        Destination connectors with a bulk load path override this method and return a
+        result payload including ``rows_loaded``.
+        """
+
+        raise NotImplementedError(f"Connector '{self.name}' does not load records")
+
+    def checkpoint(self) -> None:
+        """Persist the source's progress once its records are loaded.
+
+        Sources that resume from a watermark override this method. It is called after the
+        job completes, so the watermark only advances past data the destination committed.
+        """
+
+        raise NotImplementedError(f"Connector '{self.name}' does not checkpoint")
+
+    @staticmethod
+    def http_client(**options: Any) -> httpx.AsyncClient:
+        """Return an ``httpx.AsyncClient`` that records a trace span for every request."""
+
+        import httpx
+
+        from app.core import tracing
+
+        return httpx.AsyncClient(transport=tracing.TracedTransport(), **options)
+
     @classmethod
-    def to_definition(cls) -> "ConnectorDefinition":
+    def supports(cls, method: str) -> bool:
+        """Return whether the connector overrides an optional streaming method."""
+
+        return getattr(cls, method) is not getattr(Connector, method)
+
+    @classmethod
+    def to_definition(cls) -> ConnectorDefinition:
         """Return a definition object that can be serialised via the API."""
 
         return ConnectorDefinition(
@@ -74,32 +128,162 @@ class ConnectorDefinition:
     config_schema: dict[str, Any]
 
 
+def check_definition(definition: ConnectorDefinition) -> list[str]:
+    """Return the problems that would stop a connector from being listed or configured."""
+
+    problems = []
+    if not isinstance(definition.name, str) or not definition.name.strip():
+        problems.append("name must be a non-empty string")
+    if not isinstance(definition.title, str) or not definition.title.strip():
+        problems.append("title must be a non-empty string")
+    if not isinstance(definition.description, str):
+        problems.append("description must be a string")
+    if not isinstance(definition.tags, list) or not all(
+        isinstance(tag, str) for tag in definition.tags
+    ):
+        problems.append("tags must be a list of strings")
+    elif not derive_capabilities(definition.tags):
+        problems.append("tags must include 'source' or 'destination'")
+    schema = definition.config_schema
+    if not isinstance(schema, dict) or schema.get("type") != "object":
+        problems.append("config_schema must be a JSON schema of type 'object'")
+    else:
+        try:
+            compile_schema(schema)
+        except (ValueError, re.error) as exc:
+            problems.append(f"config_schema is not supported: {exc}")
+    return problems
+
+
+@dataclass(slots=True)
+class _LazyConnector:
+    module: str
+    #: Metadata shown before import; ``None`` keeps the connector unlisted until it is loaded.
+    definition: ConnectorDefinition | None = None
+    #: Attribute holding the class when importing ``module`` does not register it.
+    attr: str | None = None
+
+
 class ConnectorRegistry:
-    """In-memory registry for connector implementations."""
+    """In-memory registry for connector implementations.
+
+    Connectors may be registered lazily from their metadata and module path; the module
+    is imported, registering the implementation, the first time the class is needed.
+    """
 
     def __init__(self) -> None:
         self._registry: dict[str, type[Connector]] = {}
+        self._lazy: dict[str, _LazyConnector] = {}
+        self._validators: dict[str, ConfigValidator] = {}
+        self._loading = threading.RLock()
+        #: Incremented on every registration so derived caches can tell they are stale.
+        self.version = 0
+        #: Seconds spent importing each lazily registered connector.
+        self.import_seconds: dict[str, float] = {}
 
     def register(self, connector: type[Connector]) -> None:
         identifier = connector.name
-        if identifier in self._registry:
+        lazy = self._lazy.get(identifier)
+        if identifier in self._registry or (lazy and lazy.module != connector.__module__):
             raise ValueError(f"Connector '{identifier}' is already registered")
 
+        self._lazy.pop(identifier, None)
+        self._validators.pop(identifier, None)
         self._registry[identifier] = connector
+        self.version += 1
+
+    def register_lazy(
+        self,
+        name: str,
+        module: str,
+        definition: ConnectorDefinition | None = None,
+        attr: str | None = None,
+    ) -> None:
+        """Register a connector by module path, to be imported on first use.
+
+        Importing ``module`` must register the connector unless ``attr`` names the class
+        to register. Without a ``definition`` the connector is not listed until loaded.
+        """
+
+        if name in self._registry or name in self._lazy:
+            raise ValueError(f"Connector '{name}' is already registered")
+
+        self._lazy[name] = _LazyConnector(module, definition, attr)
+        self.version += 1
+
+    def unregister(self, name: str) -> None:
+        """Remove a connector, e.g. a plugin that failed to load."""
+
+        self._validators.pop(name, None)
+        if self._registry.pop(name, None) or self._lazy.pop(name, None):
+            self.version += 1
+
+    def _load(self, name: str) -> None:
+        with self._loading:
+            lazy = self._lazy.get(name)
+            if name in self._registry or lazy is None:
+                return  # loaded by another thread meanwhile
+            started = time.perf_counter()
+            imported = importlib.import_module(lazy.module)
+            if lazy.attr is not None and name not in self._registry:
+                connector = getattr(imported, lazy.attr)
+                if not (isinstance(connector, type) and issubclass(connector, Connector)):
+                    raise TypeError(f"{lazy.module}:{lazy.attr} is not a Connector subclass")
+                if connector.name != name:
+                    raise ValueError(
+                        f"{lazy.module}:{lazy.attr} is named '{connector.name}', not '{name}'"
+                    )
+                problems = check_definition(connector.to_definition())
+                if problems:
+                    raise ValueError(f"Connector '{name}' is invalid: {'; '.join(problems)}")
+                self._lazy.pop(name)
+                self._validators.pop(name, None)
+                self._registry[name] = connector
+                self.version += 1
+            self.import_seconds[name] = time.perf_counter() - started
 
     def get(self, name: str) -> type[Connector]:
+        if name not in self._registry and name in self._lazy:
+            self._load(name)
         try:
             return self._registry[name]
         except KeyError as exc:
             raise LookupError(f"Connector '{name}' is not registered") from exc
 
+    def definition(self, name: str) -> ConnectorDefinition:
+        """Return a connector's metadata without importing its implementation."""
+
+        lazy = self._lazy.get(name)
+        if lazy is not None and lazy.definition is not None:
+            return lazy.definition
+        return self.get(name).to_definition()
+
+    def validator(self, name: str) -> ConfigValidator:
+        """Return the connector's compiled ``config_schema``, compiling it on first use."""
+
+        try:
+            return self._validators[name]
+        except KeyError:
+            validator = self._validators[name] = compile_schema(self.definition(name).config_schema)
+            return validator
+
+    def validate_config(self, name: str, config: dict[str, Any], path: str = "") -> list[str]:
+        """Return every way ``config`` violates the connector's schema; empty when valid.
+
+        Errors read ``"<path>.<field>: <problem>"``, so ``path`` names the configuration
+        when it is part of a larger payload.
+        """
+
+        return self.validator(name)(config, path)
+
     def list(self) -> list[str]:
-        return sorted(self._registry.keys())
+        described = {name for name, lazy in self._lazy.items() if lazy.definition is not None}
+        return sorted(self._registry.keys() | described)
 
     def describe(self) -> list[ConnectorDefinition]:
         """Return metadata for all registered connectors."""
 
-        return [self._registry[name].to_definition() for name in self.list()]
+        return [self.definition(name) for name in self.list()]
 
     def create(self, name: str, **config: Any) -> Connector:
         """Instantiate a registered connector with the provided configuration."""
@@ -107,5 +291,11 @@ class ConnectorRegistry:
         connector_cls = self.get(name)
         return connector_cls(**config)
 
+    def load_all(self) -> None:
+        """Import every lazily registered connector."""
+
+        for name in list(self._lazy):
+            self.get(name)
+
 
 registry = ConnectorRegistry()
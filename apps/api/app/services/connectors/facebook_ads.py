@@ -19,8 +19,17 @@ class FacebookAdsSourceConnector(Connector):
     config_schema = {
         "type": "object",
         "properties": {
-            "access_token": {"type": "string", "title": "Access Token", "description": "Facebook Marketing API access token", "format": "password"},
-            "ad_account_id": {"type": "string", "title": "Ad Account ID", "description": "Facebook Ad Account ID (format: act_XXXXXX)"},
+            "access_token": {
+                "type": "string",
+                "title": "Access Token",
+                "description": "Facebook Marketing API access token",
+                "format": "password",
+            },
+            "ad_account_id": {
+                "type": "string",
+                "title": "Ad Account ID",
+                "description": "Facebook Ad Account ID (format: act_XXXXXX)",
+            },
             "objects": {
                 "type": "array",
                 "title": "Objects",
@@ -46,8 +55,6 @@ class FacebookAdsSourceConnector(Connector):
             raise ValueError("Ad Account ID is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
-
         access_token = self.config["access_token"]
         ad_account_id = self.config["ad_account_id"]
 
@@ -58,7 +65,7 @@ class FacebookAdsSourceConnector(Connector):
         date_preset = self.config.get("date_preset", "last_30d")
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             if "campaigns" in objects:
                 logger.info("Extracting campaigns")
                 response = await client.get(f"{base_url}/campaigns", params={"limit": 100})
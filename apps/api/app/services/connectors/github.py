@@ -20,7 +20,11 @@ class GitHubSourceConnector(Connector):
         "type": "object",
         "properties": {
             "token": {"type": "string", "title": "Personal Access Token", "format": "password"},
-            "owner": {"type": "string", "title": "Repository Owner", "description": "GitHub username or organization"},
+            "owner": {
+                "type": "string",
+                "title": "Repository Owner",
+                "description": "GitHub username or organization",
+            },
             "repo": {"type": "string", "title": "Repository Name"},
             "objects": {
                 "type": "array",
@@ -42,8 +46,6 @@ class GitHubSourceConnector(Connector):
             raise ValueError("Repository name is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
-
         token = self.config["token"]
         owner = self.config["owner"]
         repo = self.config["repo"]
@@ -54,7 +56,7 @@ class GitHubSourceConnector(Connector):
         objects = self.config.get("objects", ["issues", "pull_requests", "commits"])
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             for obj in objects:
                 logger.info(f"Extracting {obj}")
 
@@ -19,7 +19,12 @@ class HubSpotSourceConnector(Connector):
     config_schema = {
         "type": "object",
         "properties": {
-            "api_key": {"type": "string", "title": "API Key", "description": "HubSpot private app access token", "format": "password"},
+            "api_key": {
+                "type": "string",
+                "title": "API Key",
+                "description": "HubSpot private app access token",
+                "format": "password",
+            },
             "objects": {
                 "type": "array",
                 "title": "Objects",
@@ -36,15 +41,13 @@ class HubSpotSourceConnector(Connector):
             raise ValueError("API Key is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
-
         headers = {"Authorization": f"Bearer {self.config['api_key']}"}
         base_url = "https://api.hubapi.com"
 
         objects = self.config.get("objects", ["contacts", "companies", "deals", "tickets"])
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             for obj in objects:
                 logger.info(f"Extracting {obj}")
                 endpoint = f"{base_url}/crm/v3/objects/{obj}?limit=100"
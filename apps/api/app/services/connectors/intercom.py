@@ -36,8 +36,6 @@ class IntercomSourceConnector(Connector):
             raise ValueError("Access Token is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
-
         access_token = self.config["access_token"]
 
         headers = {
@@ -49,7 +47,7 @@ class IntercomSourceConnector(Connector):
         objects = self.config.get("objects", ["contacts", "conversations"])
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             if "contacts" in objects:
                 logger.info("Extracting contacts")
                 response = await client.get(f"{base_url}/contacts")
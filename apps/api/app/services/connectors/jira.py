@@ -19,7 +19,11 @@ class JiraSourceConnector(Connector):
     config_schema = {
         "type": "object",
         "properties": {
-            "domain": {"type": "string", "title": "Domain", "description": "Your Jira domain (e.g., company.atlassian.net)"},
+            "domain": {
+                "type": "string",
+                "title": "Domain",
+                "description": "Your Jira domain (e.g., company.atlassian.net)",
+            },
             "email": {"type": "string", "title": "Email"},
             "api_token": {"type": "string", "title": "API Token", "format": "password"},
             "project_keys": {
@@ -48,7 +52,6 @@ class JiraSourceConnector(Connector):
             raise ValueError("API Token is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
         from base64 import b64encode
 
         domain = self.config["domain"]
@@ -63,7 +66,7 @@ class JiraSourceConnector(Connector):
         project_keys = self.config.get("project_keys", [])
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             if "projects" in objects:
                 logger.info("Extracting projects")
                 response = await client.get(f"{base_url}/project")
@@ -0,0 +1,65 @@
+"""Shared helpers for destination connectors that bulk load record batches."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Callable
+from typing import Any
+
+
+def record_columns(records: list[dict[str, Any]]) -> list[str]:
+    """Return the union of record keys, preserving first-seen order."""
+
+    columns: dict[str, None] = {}
+    for record in records:
+        for key in record:
+            columns.setdefault(key, None)
+    return list(columns)
+
+
+def record_rows(records: list[dict[str, Any]], columns: list[str]) -> list[tuple[Any, ...]]:
+    """Project records onto ``columns`` as positional tuples, filling gaps with ``None``."""
+
+    return [tuple(record.get(column) for column in columns) for record in records]
+
+
+async def rebatch(
+    batches: AsyncIterator[list[dict[str, Any]]], batch_size: int
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Regroup incoming record batches into batches of exactly ``batch_size`` (last may be short)."""
+
+    pending: list[dict[str, Any]] = []
+    async for batch in batches:
+        pending.extend(batch)
+        # Slice by offset and keep only the remainder, so large batches are copied once.
+        full = len(pending) - len(pending) % batch_size
+        for start in range(0, full, batch_size):
+            yield pending[start : start + batch_size]
+        if full:
+            pending = pending[full:]
+    if pending:
+        yield pending
+
+
+async def rebatch_by_size(
+    batches: AsyncIterator[list[dict[str, Any]]],
+    max_rows: int,
+    max_bytes: int,
+    size_of: Callable[[dict[str, Any]], int],
+) -> AsyncIterator[list[dict[str, Any]]]:
+    """Regroup record batches so each stays within ``max_rows`` and ``max_bytes``.
+
+    A single record larger than ``max_bytes`` is still emitted on its own.
+    """
+
+    pending: list[dict[str, Any]] = []
+    pending_bytes = 0
+    async for batch in batches:
+        for record in batch:
+            size = size_of(record)
+            if pending and (len(pending) >= max_rows or pending_bytes + size > max_bytes):
+                yield pending
+                pending, pending_bytes = [], 0
+            pending.append(record)
+            pending_bytes += size
+    if pending:
+        yield pending
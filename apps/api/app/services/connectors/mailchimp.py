@@ -19,8 +19,17 @@ class MailchimpSourceConnector(Connector):
     config_schema = {
         "type": "object",
         "properties": {
-            "api_key": {"type": "string", "title": "API Key", "description": "Mailchimp API key", "format": "password"},
-            "dc": {"type": "string", "title": "Data Center", "description": "Mailchimp data center (e.g., us1, us2)"},
+            "api_key": {
+                "type": "string",
+                "title": "API Key",
+                "description": "Mailchimp API key",
+                "format": "password",
+            },
+            "dc": {
+                "type": "string",
+                "title": "Data Center",
+                "description": "Mailchimp data center (e.g., us1, us2)",
+            },
             "objects": {
                 "type": "array",
                 "title": "Objects",
@@ -39,8 +48,6 @@ class MailchimpSourceConnector(Connector):
             raise ValueError("Data Center is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
-
         api_key = self.config["api_key"]
         dc = self.config["dc"]
 
@@ -50,7 +57,7 @@ class MailchimpSourceConnector(Connector):
         objects = self.config.get("objects", ["lists", "campaigns"])
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             if "lists" in objects:
                 logger.info("Extracting lists")
                 response = await client.get(f"{base_url}/lists")
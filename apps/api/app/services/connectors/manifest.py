@@ -0,0 +1,100 @@
+"""Manifest of built-in connector metadata, read at startup instead of importing connectors.
+
+Regenerate ``manifest.json`` after adding a connector or changing one's title,
+description, tags or config schema::
+
+    python3 scripts/generate_connector_catalog.py
+"""
+
+from __future__ import annotations
+
+import importlib
+import json
+from pathlib import Path
+from typing import Any
+
+from .base import ConnectorDefinition, ConnectorRegistry
+
+MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+
+#: Modules implementing the built-in community connectors.
+BUILTIN_MODULES = (
+    "example",
+    "postgres",
+    "mysql",
+    "s3",
+    "snowflake",
+    "mongodb",
+    "bigquery",
+    "google_analytics",
+    "salesforce",
+    "hubspot",
+    "stripe",
+    "github",
+    "shopify",
+    "slack",
+    "sqlserver",
+    "google_sheets",
+    "airtable",
+    "zendesk",
+    "mailchimp",
+    "redshift",
+    "gcs",
+    "intercom",
+    "quickbooks",
+    "twilio",
+    "asana",
+    "jira",
+    "facebook_ads",
+)
+
+
+def build_manifest() -> list[dict[str, Any]]:
+    """Import every built-in connector module and describe what it registers."""
+
+    from . import registry
+
+    for module in BUILTIN_MODULES:
+        importlib.import_module(f"{__package__}.{module}")
+    registry.load_all()
+
+    entries = []
+    for name in registry.list():
+        connector = registry.get(name)
+        if connector.__module__.rpartition(".")[0] != __package__:
+            continue  # registered by a plugin, not a built-in module
+        definition = connector.to_definition()
+        entries.append(
+            {
+                "name": definition.name,
+                "module": connector.__module__,
+                "title": definition.title,
+                "description": definition.description,
+                "tags": definition.tags,
+                "config_schema": definition.config_schema,
+            }
+        )
+    return entries
+
+
+def register_builtins(registry: ConnectorRegistry) -> None:
+    """Register built-in connectors from the manifest, or by importing them if it is missing."""
+
+    try:
+        entries = json.loads(MANIFEST_PATH.read_text())
+    except FileNotFoundError:
+        for module in BUILTIN_MODULES:
+            importlib.import_module(f"{__package__}.{module}")
+        return
+
+    for entry in entries:
+        module = entry.pop("module")
+        registry.register_lazy(entry["name"], module, ConnectorDefinition(**entry))
+
+
+def write_manifest() -> int:
+    """Rewrite ``manifest.json`` from the connector modules; returns the connector count."""
+
+    entries = build_manifest()
+    MANIFEST_PATH.write_text(json.dumps(entries, indent=2) + "\n")
+    return len(entries)
@@ -1,12 +1,37 @@
 """MongoDB connector for data extraction."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 from app.services.connectors import Connector, registry
+from app.services.connectors.loading import rebatch_by_size
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 10000
+DEFAULT_MAX_IN_FLIGHT = 4
+# Stay comfortably below the 48 MB maximum message size accepted by the server.
+DEFAULT_MAX_BATCH_MB = 32
+
+
+async def _settle(writes: set[asyncio.Task], limit: int) -> set[asyncio.Task]:
+    """Wait until at most ``limit`` writes are pending and return those.
+
+    Finished writes are dropped and the first failed one raises its error, so a failure
+    stops the load before more batches are sent.
+    """
+
+    done = {write for write in writes if write.done()}
+    pending = writes - done
+    while True:
+        for write in done:
+            write.result()
+        if len(pending) <= limit:
+            return pending
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
 
 class MongoDBSourceConnector(Connector):
     """MongoDB database source connector."""
@@ -42,10 +67,18 @@ class MongoDBSourceConnector(Connector):
             raise ValueError("Database is required")
 
     async def run(self) -> dict[str, Any]:
+        rows_extracted = 0
+        async for batch in self.read():
+            rows_extracted += len(batch)
+
+        return {"status": "completed", "rows_extracted": rows_extracted}
+
+    async def read(self) -> AsyncIterator[list[dict[str, Any]]]:
         from motor.motor_asyncio import AsyncIOMotorClient
 
         connection_string = self._build_connection_string()
         client = AsyncIOMotorClient(connection_string)
+        batch_size = int(self.config.get("batch_size", DEFAULT_BATCH_SIZE))
 
         try:
             db = client[self.config["database"]]
@@ -54,15 +87,22 @@ class MongoDBSourceConnector(Connector):
             if not collections:
                 collections = await db.list_collection_names()
 
-            rows_extracted = 0
             for collection_name in collections:
                 logger.info(f"Extracting collection: {collection_name}")
-                collection = db[collection_name]
-                documents = await collection.find({}).to_list(length=None)
-                rows_extracted += len(documents)
-                logger.info(f"Extracted {len(documents)} documents from {collection_name}")
+                cursor = db[collection_name].find({}).batch_size(batch_size)
 
-            return {"status": "completed", "rows_extracted": rows_extracted}
+                extracted = 0
+                batch: list[dict[str, Any]] = []
+                async for document in cursor:
+                    batch.append(document)
+                    if len(batch) >= batch_size:
+                        extracted += len(batch)
+                        yield batch
+                        batch = []
+                if batch:
+                    extracted += len(batch)
+                    yield batch
+                logger.info(f"Extracted {extracted} documents from {collection_name}")
 
         finally:
             client.close()
@@ -95,6 +135,35 @@ class MongoDBDestinationConnector(Connector):
             "username": {"type": "string", "title": "Username"},
             "password": {"type": "string", "title": "Password", "format": "password"},
             "tls": {"type": "boolean", "title": "Use TLS", "default": False},
+            "collection": {
+                "type": "string",
+                "title": "Collection",
+                "description": "Target collection for loaded records",
+            },
+            "primary_key": {
+                "type": "array",
+                "title": "Primary Key",
+                "items": {"type": "string"},
+                "description": "Fields identifying a document; matching documents are replaced (upsert)",
+            },
+            "batch_size": {
+                "type": "integer",
+                "title": "Batch Size",
+                "description": "Maximum documents per bulk write",
+                "default": DEFAULT_BATCH_SIZE,
+            },
+            "max_batch_mb": {
+                "type": "integer",
+                "title": "Max Bulk Write Size (MB)",
+                "description": "Upper bound for the encoded size of each bulk write",
+                "default": DEFAULT_MAX_BATCH_MB,
+            },
+            "max_in_flight": {
+                "type": "integer",
+                "title": "Concurrent Bulk Writes",
+                "description": "Number of bulk writes sent to the server at once",
+                "default": DEFAULT_MAX_IN_FLIGHT,
+            },
         },
         "required": ["host", "database"],
     }
@@ -113,12 +182,65 @@ class MongoDBDestinationConnector(Connector):
 
         try:
             db = client[self.config["database"]]
-            logger.info(f"MongoDB destination connector ready - database: {self.config['database']}")
+            logger.info(
+                f"MongoDB destination connector ready - database: {self.config['database']}"
+            )
             return {"status": "completed", "rows_loaded": 0}
 
         finally:
             client.close()
 
+    async def write(self, batches: AsyncIterator[list[dict[str, Any]]]) -> dict[str, Any]:
+        import bson
+        from motor.motor_asyncio import AsyncIOMotorClient
+        from pymongo import InsertOne, ReplaceOne
+
+        collection_name = self.config.get("collection")
+        if not collection_name:
+            raise ValueError("Collection is required to load records")
+
+        primary_key = self.config.get("primary_key") or []
+        batch_size = int(self.config.get("batch_size", DEFAULT_BATCH_SIZE))
+        max_bytes = int(self.config.get("max_batch_mb", DEFAULT_MAX_BATCH_MB)) * 1024 * 1024
+        max_in_flight = max(int(self.config.get("max_in_flight", DEFAULT_MAX_IN_FLIGHT)), 1)
+
+        client = AsyncIOMotorClient(self._build_connection_string())
+        collection = client[self.config["database"]][collection_name]
+        in_flight: set[asyncio.Task] = set()
+        bulk_writes = 0
+        rows_loaded = 0
+
+        try:
+            async for group in rebatch_by_size(
+                batches, batch_size, max_bytes, lambda record: len(bson.encode(record))
+            ):
+                if primary_key:
+                    operations = [
+                        ReplaceOne(
+                            {key: record.get(key) for key in primary_key}, record, upsert=True
+                        )
+                        for record in group
+                    ]
+                else:
+                    operations = [InsertOne(record) for record in group]
+
+                # Waiting for a free slot pauses the source while all slots are busy.
+                in_flight = await _settle(in_flight, max_in_flight - 1)
+                in_flight.add(asyncio.create_task(collection.bulk_write(operations, ordered=False)))
+                bulk_writes += 1
+                rows_loaded += len(operations)
+
+            in_flight = await _settle(in_flight, 0)
+            logger.info(
+                f"Loaded {rows_loaded} documents into {collection_name} with {bulk_writes} bulk writes"
+            )
+            return {"status": "completed", "rows_loaded": rows_loaded}
+
+        finally:
+            for write in in_flight:
+                write.cancel()
+            client.close()
+
     def _build_connection_string(self) -> str:
         username = self.config.get("username")
         password = self.config.get("password")
@@ -1,12 +1,20 @@
 """MySQL connector for data extraction and loading."""
 
+import json
 import logging
+import os
+import tempfile
+from collections.abc import AsyncIterator
 from typing import Any
 
 from app.services.connectors import Connector, registry
+from app.services.connectors.loading import rebatch, record_columns, record_rows
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 10000
+DEFAULT_MAX_PACKET_MB = 16
+
 
 class MySQLSourceConnector(Connector):
     """MySQL database source connector."""
@@ -106,6 +114,36 @@ class MySQLDestinationConnector(Connector):
                 "description": "Truncate tables before loading data",
                 "default": False,
             },
+            "table": {
+                "type": "string",
+                "title": "Table",
+                "description": "Target table for loaded records",
+            },
+            "primary_key": {
+                "type": "array",
+                "title": "Primary Key",
+                "items": {"type": "string"},
+                "description": "Columns identifying a row; existing rows are updated instead of duplicated",
+            },
+            "load_method": {
+                "type": "string",
+                "title": "Load Method",
+                "enum": ["insert", "load_data"],
+                "default": "insert",
+                "description": "Multi-row INSERT ... ON DUPLICATE KEY UPDATE, or LOAD DATA LOCAL INFILE",
+            },
+            "batch_size": {
+                "type": "integer",
+                "title": "Batch Size",
+                "description": "Rows committed per load transaction",
+                "default": DEFAULT_BATCH_SIZE,
+            },
+            "max_packet_mb": {
+                "type": "integer",
+                "title": "Max Statement Size (MB)",
+                "description": "Upper bound for each multi-row INSERT; keep below the server max_allowed_packet",
+                "default": DEFAULT_MAX_PACKET_MB,
+            },
         },
         "required": ["host", "database", "username", "password"],
     }
@@ -138,6 +176,148 @@ class MySQLDestinationConnector(Connector):
             conn.close()
             await conn.wait_closed()
 
+    async def write(self, batches: AsyncIterator[list[dict[str, Any]]]) -> dict[str, Any]:
+        import aiomysql
+
+        table = self.config.get("table")
+        if not table:
+            raise ValueError("Table is required to load records")
+
+        load_method = self.config.get("load_method", "insert")
+        batch_size = int(self.config.get("batch_size", DEFAULT_BATCH_SIZE))
+
+        conn = await aiomysql.connect(
+            host=self.config["host"],
+            port=self.config.get("port", 3306),
+            user=self.config["username"],
+            password=self.config["password"],
+            db=self.config["database"],
+            ssl={} if self.config.get("ssl") else None,
+            local_infile=load_method == "load_data",
+        )
+
+        rows_loaded = 0
+        try:
+            async with conn.cursor() as cur:
+                # executemany() folds INSERT rows into multi-row statements up to this size.
+                cur.max_stmt_length = (
+                    int(self.config.get("max_packet_mb", DEFAULT_MAX_PACKET_MB)) * 1024 * 1024
+                )
+
+                if self.config.get("truncate_before_load"):
+                    await cur.execute(f"TRUNCATE TABLE `{table}`")
+
+                async for batch in rebatch(batches, batch_size):
+                    columns = record_columns(batch)
+                    rows = record_rows(batch, columns)
+                    if load_method == "load_data":
+                        await self._load_data(cur, table, columns, rows)
+                    else:
+                        await cur.executemany(self._insert_sql(table, columns), rows)
+                    await conn.commit()
+                    rows_loaded += len(rows)
+                    logger.info(f"Loaded {rows_loaded} rows into {table}")
+
+            return {"status": "completed", "rows_loaded": rows_loaded}
+
+        finally:
+            conn.close()
+            await conn.wait_closed()
+
+    def _insert_sql(self, table: str, columns: list[str], source: str | None = None) -> str:
+        """Build an INSERT, upserting on duplicate keys when a primary key is configured."""
+
+        column_list = ", ".join(f"`{column}`" for column in columns)
+        if source is None:
+            placeholders = ", ".join(["%s"] * len(columns))
+            sql = f"INSERT INTO `{table}` ({column_list}) VALUES ({placeholders})"
+        else:
+            sql = f"INSERT INTO `{table}` ({column_list}) SELECT {column_list} FROM `{source}`"
+
+        primary_key = set(self.config.get("primary_key") or [])
+        updates = ", ".join(f"`{c}` = VALUES(`{c}`)" for c in columns if c not in primary_key)
+        if primary_key and updates:
+            sql += f" ON DUPLICATE KEY UPDATE {updates}"
+        return sql
+
+    async def _load_data(
+        self, cur: Any, table: str, columns: list[str], rows: list[tuple[Any, ...]]
+    ) -> None:
+        """Bulk load rows with LOAD DATA LOCAL INFILE, via a staging table for upserts."""
+
+        target = table
+        if self.config.get("primary_key"):
+            target = f"_openfuse_stage_{table}"
+            await cur.execute(f"CREATE TEMPORARY TABLE IF NOT EXISTS `{target}` LIKE `{table}`")
+            await cur.execute(f"TRUNCATE TABLE `{target}`")
+
+        # The file is read as utf8mb4 text, so columns holding bytes are written as hex into
+        # user variables and decoded with UNHEX().
+        binary = {
+            index
+            for index in range(len(columns))
+            if any(isinstance(row[index], (bytes, bytearray)) for row in rows)
+        }
+        buffer = tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", newline="", suffix=".tsv", delete=False
+        )
+        try:
+            with buffer:
+                for row in rows:
+                    buffer.write(
+                        "\t".join(
+                            _tsv_value(_hex(value) if index in binary else value)
+                            for index, value in enumerate(row)
+                        )
+                        + "\n"
+                    )
+
+            fields = ", ".join(
+                f"@field{index}" if index in binary else f"`{column}`"
+                for index, column in enumerate(columns)
+            )
+            sql = (
+                f"LOAD DATA LOCAL INFILE %s INTO TABLE `{target}` CHARACTER SET utf8mb4 ({fields})"
+            )
+            if binary:
+                sql += " SET " + ", ".join(
+                    f"`{columns[index]}` = UNHEX(@field{index})" for index in sorted(binary)
+                )
+            await cur.execute(sql, (buffer.name,))
+        finally:
+            os.unlink(buffer.name)
+
+        if target != table:
+            await cur.execute(self._insert_sql(table, columns, source=target))
+
+
+def _tsv_value(value: Any) -> str:
+    """Encode a value using the default LOAD DATA field escaping."""
+
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, default=str)
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+def _hex(value: Any) -> str | None:
+    """Hex-encode a value of a binary column for ``UNHEX()``."""
+
+    if value is None:
+        return None
+    if not isinstance(value, (bytes, bytearray)):
+        value = str(value).encode()
+    return value.hex()
+
 
 registry.register(MySQLSourceConnector)
 registry.register(MySQLDestinationConnector)
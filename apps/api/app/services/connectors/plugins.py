@@ -0,0 +1,170 @@
+"""Third-party connectors discovered through the ``openfuse.connectors`` entry point group.
+
+A plugin distribution declares one entry point per connector, named after the
+connector and pointing at its class::
+
+    [project.entry-points."openfuse.connectors"]
+    netsuite = "acme_connectors.netsuite:NetSuiteConnector"
+
+Discovery reads installed distribution metadata only. Plugins that ship an
+``openfuse_connectors.json`` in their top-level package, in the format of the
+built-in ``manifest.json`` (``module`` may be omitted), are listed from it and
+imported the first time they are used, like the built-in connectors. The rest
+stay unlisted until ``load_plugins`` imports them, which the API does in a
+background thread after startup so a slow plugin does not delay serving.
+
+Every import is timed; plugins taking longer than
+``connector_plugin_import_budget_seconds`` are logged and reported as ``slow``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import logging
+import threading
+from dataclasses import dataclass, fields
+from importlib.metadata import EntryPoint, entry_points
+from pathlib import Path
+from typing import Literal
+
+from .base import ConnectorDefinition, ConnectorRegistry, check_definition
+
+logger = logging.getLogger(__name__)
+
+ENTRY_POINT_GROUP = "openfuse.connectors"
+PLUGIN_MANIFEST = "openfuse_connectors.json"
+
+PluginStatus = Literal["pending", "described", "loaded", "slow", "failed"]
+
+
+@dataclass(slots=True)
+class PluginReport:
+    """Discovery and import outcome for one plugin connector."""
+
+    name: str
+    target: str
+    distribution: str | None
+    status: PluginStatus = "pending"
+    import_seconds: float | None = None
+    error: str | None = None
+
+
+#: Reports of the plugins seen by ``discover_plugins``, keyed by connector name.
+reports: dict[str, PluginReport] = {}
+
+
+def _manifest_definition(name: str, module: str) -> ConnectorDefinition | None:
+    """Read a connector's metadata from its package's manifest without importing it."""
+
+    # find_spec on a top-level name locates the package without executing it.
+    spec = importlib.util.find_spec(module.partition(".")[0])
+    if spec is None:
+        raise ValueError(f"Module '{module}' is not installed")
+    if spec.submodule_search_locations:
+        directory = Path(next(iter(spec.submodule_search_locations)))
+    elif spec.origin:
+        directory = Path(spec.origin).parent
+    else:
+        return None
+
+    try:
+        entries = json.loads((directory / PLUGIN_MANIFEST).read_text())
+    except FileNotFoundError:
+        return None
+    except json.JSONDecodeError as exc:
+        raise ValueError(f"{PLUGIN_MANIFEST} is not valid JSON: {exc}") from exc
+
+    for entry in entries:
+        if isinstance(entry, dict) and entry.get("name") == name:
+            values = {field.name: entry.get(field.name) for field in fields(ConnectorDefinition)}
+            values["description"] = values["description"] or ""
+            definition = ConnectorDefinition(**values)
+            problems = check_definition(definition)
+            if problems:
+                raise ValueError(f"{PLUGIN_MANIFEST} entry is invalid: {'; '.join(problems)}")
+            return definition
+    return None
+
+
+def _discover(entry_point: EntryPoint, registry: ConnectorRegistry) -> PluginReport:
+    distribution = entry_point.dist.name if entry_point.dist else None
+    report = PluginReport(entry_point.name, entry_point.value, distribution)
+    module, _, attr = entry_point.value.partition(":")
+    try:
+        if not attr:
+            raise ValueError("entry point must be of the form 'module:ConnectorClass'")
+        definition = _manifest_definition(entry_point.name, module)
+        registry.register_lazy(entry_point.name, module, definition, attr)
+    except (ValueError, ImportError) as exc:
+        report.status, report.error = "failed", str(exc)
+        logger.error("Ignoring connector plugin %s (%s): %s", report.name, report.target, exc)
+        return report
+
+    if definition is not None:
+        report.status = "described"
+    return report
+
+
+def discover_plugins(registry: ConnectorRegistry) -> list[PluginReport]:
+    """Register installed plugin connectors lazily; no plugin code is imported."""
+
+    discovered = [
+        _discover(entry_point, registry) for entry_point in entry_points(group=ENTRY_POINT_GROUP)
+    ]
+    reports.update((report.name, report) for report in discovered)
+    return discovered
+
+
+def load_plugins(
+    registry: ConnectorRegistry, budget_seconds: float | None = None
+) -> list[PluginReport]:
+    """Import discovered plugins, recording how long each import took."""
+
+    if budget_seconds is None:
+        from app.core.config import settings
+
+        budget_seconds = settings.connector_plugin_import_budget_seconds
+    from app.core import metrics
+
+    loaded = []
+    for report in list(reports.values()):
+        if report.status not in ("pending", "described"):
+            continue
+        try:
+            registry.get(report.name)
+        except Exception as exc:  # noqa: BLE001 - a broken plugin must not take down the others
+            registry.unregister(report.name)
+            report.status, report.error = "failed", f"{type(exc).__name__}: {exc}"
+            logger.error(
+                "Connector plugin %s (%s) failed to load: %s",
+                report.name,
+                report.target,
+                report.error,
+            )
+            continue
+
+        report.import_seconds = registry.import_seconds.get(report.name)
+        report.status = "loaded"
+        if report.import_seconds is not None:
+            metrics.observe_plugin_import(report.name, report.import_seconds)
+            if report.import_seconds > budget_seconds:
+                report.status = "slow"
+                logger.warning(
+                    "Connector plugin %s took %.2fs to import (budget %.2fs)",
+                    report.name,
+                    report.import_seconds,
+                    budget_seconds,
+                )
+        loaded.append(report)
+    return loaded
+
+
+def load_plugins_in_background(registry: ConnectorRegistry) -> threading.Thread:
+    """Run ``load_plugins`` in a daemon thread so startup does not wait for plugins."""
+
+    thread = threading.Thread(
+        target=load_plugins, args=(registry,), name="connector-plugins", daemon=True
+    )
+    thread.start()
+    return thread
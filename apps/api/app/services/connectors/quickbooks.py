@@ -19,7 +19,11 @@ class QuickBooksSourceConnector(Connector):
     config_schema = {
         "type": "object",
         "properties": {
-            "realm_id": {"type": "string", "title": "Realm ID", "description": "QuickBooks Company ID"},
+            "realm_id": {
+                "type": "string",
+                "title": "Realm ID",
+                "description": "QuickBooks Company ID",
+            },
             "access_token": {"type": "string", "title": "Access Token", "format": "password"},
             "refresh_token": {"type": "string", "title": "Refresh Token", "format": "password"},
             "client_id": {"type": "string", "title": "Client ID"},
@@ -44,8 +48,6 @@ class QuickBooksSourceConnector(Connector):
             raise ValueError("Client ID is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
-
         realm_id = self.config["realm_id"]
         access_token = self.config["access_token"]
 
@@ -55,10 +57,12 @@ class QuickBooksSourceConnector(Connector):
         objects = self.config.get("objects", ["Invoice", "Customer", "Payment"])
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             for obj in objects:
                 logger.info(f"Extracting {obj}")
-                response = await client.get(f"{base_url}/query", params={"query": f"SELECT * FROM {obj}"})
+                response = await client.get(
+                    f"{base_url}/query", params={"query": f"SELECT * FROM {obj}"}
+                )
 
                 if response.status_code == 200:
                     data = response.json()
@@ -1,14 +1,24 @@
 """Amazon S3 connector for data extraction and loading."""
 
-import io
-import json
 import logging
+import os
+import tempfile
+from collections.abc import AsyncIterator
 from typing import Any
 
 from app.services.connectors import Connector, registry
+from app.services.connectors.storage import (
+    SUPPORTED_EXTENSIONS,
+    ObjectManifest,
+    detect_format,
+    iter_file_batches,
+)
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 10000
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
 
 class S3SourceConnector(Connector):
     """Amazon S3 source connector for reading files."""
@@ -22,10 +32,23 @@ class S3SourceConnector(Connector):
         "type": "object",
         "properties": {
             "access_key_id": {"type": "string", "title": "Access Key ID"},
-            "secret_access_key": {"type": "string", "title": "Secret Access Key", "format": "password"},
+            "secret_access_key": {
+                "type": "string",
+                "title": "Secret Access Key",
+                "format": "password",
+            },
             "region": {"type": "string", "title": "Region", "default": "us-east-1"},
+            "endpoint_url": {
+                "type": "string",
+                "title": "Endpoint URL",
+                "description": "S3-compatible endpoint (e.g. MinIO); leave empty for AWS",
+            },
             "bucket": {"type": "string", "title": "Bucket Name"},
-            "prefix": {"type": "string", "title": "Prefix", "description": "Folder prefix to filter objects"},
+            "prefix": {
+                "type": "string",
+                "title": "Prefix",
+                "description": "Folder prefix to filter objects",
+            },
             "file_format": {
                 "type": "string",
                 "title": "File Format",
@@ -33,10 +56,24 @@ class S3SourceConnector(Connector):
                 "default": "csv",
             },
             "delimiter": {"type": "string", "title": "CSV Delimiter", "default": ","},
+            "manifest_path": {
+                "type": "string",
+                "title": "Manifest Path",
+                "description": "Local file used to remember ingested objects so unchanged files are skipped",
+            },
+            "append_only": {
+                "type": "boolean",
+                "title": "Append-only Keys",
+                "description": "Object keys only ever increase (e.g. date-partitioned); resume listing after the last ingested key",
+                "default": False,
+            },
         },
         "required": ["access_key_id", "secret_access_key", "bucket"],
     }
 
+    #: Manifest of the last complete read, saved by ``checkpoint``.
+    _manifest: ObjectManifest | None = None
+
     def validate(self) -> None:
         if not self.config.get("access_key_id"):
             raise ValueError("Access Key ID is required")
@@ -46,48 +83,100 @@ class S3SourceConnector(Connector):
             raise ValueError("Bucket name is required")
 
     async def run(self) -> dict[str, Any]:
+        rows_extracted = 0
+        async for batch in self.read():
+            rows_extracted += len(batch)
+
+        return {
+            "status": "completed",
+            "rows_extracted": rows_extracted,
+            "files_processed": self.files_processed,
+            "files_skipped": self.files_skipped,
+        }
+
+    async def read(self) -> AsyncIterator[list[dict[str, Any]]]:
         import aiobotocore.session
-        import aiofiles
 
         session = aiobotocore.session.get_session()
         bucket = self.config["bucket"]
         prefix = self.config.get("prefix", "")
         file_format = self.config.get("file_format", "csv")
+        delimiter = self.config.get("delimiter", ",")
+        batch_size = int(self.config.get("batch_size", DEFAULT_BATCH_SIZE))
+        append_only = bool(self.config.get("append_only", False))
+
+        manifest = ObjectManifest(self.config.get("manifest_path"))
+        self.files_processed = 0
+        self.files_skipped = 0
+
+        list_options: dict[str, Any] = {"Bucket": bucket, "Prefix": prefix}
+        if append_only and manifest.start_after:
+            list_options["StartAfter"] = manifest.start_after
 
         async with session.create_client(
             "s3",
             aws_access_key_id=self.config["access_key_id"],
             aws_secret_access_key=self.config["secret_access_key"],
             region_name=self.config.get("region", "us-east-1"),
+            endpoint_url=self.config.get("endpoint_url") or None,
         ) as client:
             paginator = client.get_paginator("list_objects_v2")
-            pages = paginator.paginate(Bucket=bucket, Prefix=prefix)
+            pages = paginator.paginate(**list_options)
 
             objects = []
             async for page in pages:
-                if "Contents" in page:
-                    for obj in page["Contents"]:
-                        key = obj["Key"]
-                        if key.endswith((".csv", ".json", ".parquet")):
-                            objects.append(key)
-
-            logger.info(f"Found {len(objects)} files in s3://{bucket}/{prefix}")
-
-            rows_extracted = 0
-            for key in objects:
+                for obj in page.get("Contents", []):
+                    key = obj["Key"]
+                    if not key.endswith(SUPPORTED_EXTENSIONS):
+                        continue
+                    fingerprint = self._fingerprint(obj)
+                    if manifest.is_unchanged(key, fingerprint):
+                        self.files_skipped += 1
+                        continue
+                    objects.append((key, fingerprint))
+
+            logger.info(
+                f"Found {len(objects)} new or changed files in s3://{bucket}/{prefix} "
+                f"({self.files_skipped} unchanged files skipped)"
+            )
+
+            for key, fingerprint in objects:
                 logger.info(f"Reading file: {key}")
-                response = await client.get_object(Bucket=bucket, Key=key)
-                async with response["Body"] as stream:
-                    content = await stream.read()
-
-                    if file_format == "json":
-                        data = json.loads(content)
-                        if isinstance(data, list):
-                            rows_extracted += len(data)
-                        else:
-                            rows_extracted += 1
-
-            return {"status": "completed", "rows_extracted": rows_extracted, "files_processed": len(objects)}
+                # Spool the object to disk in chunks and decode it incrementally, so memory
+                # use is bounded by the batch size rather than the object size.
+                spool = tempfile.NamedTemporaryFile(suffix=os.path.splitext(key)[1], delete=False)
+                try:
+                    with spool:
+                        response = await client.get_object(Bucket=bucket, Key=key)
+                        async with response["Body"] as stream:
+                            async for chunk in stream.iter_chunks(DOWNLOAD_CHUNK_SIZE):
+                                spool.write(chunk)
+
+                    for batch in iter_file_batches(
+                        spool.name, detect_format(key, file_format), batch_size, delimiter
+                    ):
+                        yield batch
+                finally:
+                    os.unlink(spool.name)
+
+                manifest.record(key, fingerprint)
+                self.files_processed += 1
+
+        # Saved by checkpoint() once the destination has loaded the records.
+        self._manifest = manifest
+
+    def checkpoint(self) -> None:
+        if self._manifest is not None:
+            self._manifest.save(keep_objects=not self.config.get("append_only", False))
+            self._manifest = None
+
+    @staticmethod
+    def _fingerprint(obj: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "etag": obj["ETag"].strip('"'),
+            "size": obj["Size"],
+            "last_modified": obj["LastModified"].isoformat(),
+        }
 
 
 class S3DestinationConnector(Connector):
@@ -102,7 +191,11 @@ class S3DestinationConnector(Connector):
         "type": "object",
         "properties": {
             "access_key_id": {"type": "string", "title": "Access Key ID"},
-            "secret_access_key": {"type": "string", "title": "Secret Access Key", "format": "password"},
+            "secret_access_key": {
+                "type": "string",
+                "title": "Secret Access Key",
+                "format": "password",
+            },
             "region": {"type": "string", "title": "Region", "default": "us-east-1"},
             "bucket": {"type": "string", "title": "Bucket Name"},
             "prefix": {
@@ -0,0 +1,305 @@
+"""Compile connector ``config_schema`` documents into validation functions.
+
+Connector schemas use a small subset of JSON Schema, so rather than interpreting the
+schema on every request it is turned once into nested closures that only perform the
+checks the schema declares. Validation collects every violation instead of stopping at
+the first, so API clients can fix a configuration in one round trip.
+
+Supported keywords: ``type``, ``properties``, ``required``, ``additionalProperties``,
+``items``, ``enum``, ``const``, ``minimum``, ``maximum``, ``exclusiveMinimum``,
+``exclusiveMaximum``, ``minLength``, ``maxLength``, ``pattern``, ``minItems``,
+``maxItems``, ``allOf``, ``anyOf`` and ``oneOf``. Annotations such as ``title``,
+``description``, ``default`` and ``format`` are ignored; any other keyword is
+rejected when the schema is compiled.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable
+from typing import Any
+
+#: Appends the violations of ``value`` at ``path`` to ``errors``.
+Check = Callable[[Any, str, list[str]], None]
+#: Returns the violations of a configuration, located relative to ``path``.
+ConfigValidator = Callable[[dict[str, Any], str], list[str]]
+
+_TYPES: dict[str, type | tuple[type, ...]] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+    "null": type(None),
+}
+_ANNOTATIONS = frozenset(
+    {
+        "$schema",
+        "$id",
+        "$comment",
+        "title",
+        "description",
+        "default",
+        "examples",
+        "format",
+        "readOnly",
+        "writeOnly",
+    }
+)
+
+
+def _is_type(value: Any, name: str) -> bool:
+    if isinstance(value, bool) and name in ("integer", "number"):
+        return False
+    if name == "integer" and isinstance(value, float):
+        return value.is_integer()
+    return isinstance(value, _TYPES[name])
+
+
+def _at(path: str, key: str | int) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else key
+
+
+def _report(path: str, message: str, errors: list[str]) -> None:
+    errors.append(f"{path or 'config'}: {message}")
+
+
+def _type_check(schema: dict[str, Any]) -> tuple[Callable[[Any], bool], str] | None:
+    if "type" not in schema:
+        return None
+    names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+    unknown = [name for name in names if name not in _TYPES]
+    if unknown:
+        raise ValueError(f"Unsupported type {unknown[0]!r}")
+    text = f"must be of type {' or '.join(names)}"
+    if len(names) == 1:
+        name = names[0]
+        return (lambda value: _is_type(value, name)), text
+    return (lambda value: any(_is_type(value, name) for name in names)), text
+
+
+def _object_checks(schema: dict[str, Any]) -> list[Check]:
+    checks: list[Check] = []
+    required = tuple(schema.get("required", ()))
+    if required:
+
+        def check_required(value: Any, path: str, errors: list[str]) -> None:
+            if isinstance(value, dict):
+                for key in required:
+                    if key not in value:
+                        _report(_at(path, key), "is required", errors)
+
+        checks.append(check_required)
+
+    properties = {
+        key: _compile(subschema) for key, subschema in schema.get("properties", {}).items()
+    }
+    additional = schema.get("additionalProperties", True)
+    extra: Check | None = None
+    if additional is False:
+
+        def extra(value: Any, path: str, errors: list[str]) -> None:
+            _report(path, "is not an allowed property", errors)
+
+    elif isinstance(additional, dict):
+        extra = _compile(additional)
+
+    if properties or extra is not None:
+
+        def check_properties(value: Any, path: str, errors: list[str]) -> None:
+            if not isinstance(value, dict):
+                return
+            for key, item in value.items():
+                check = properties.get(key, extra)
+                if check is not None:
+                    check(item, _at(path, key), errors)
+
+        checks.append(check_properties)
+    return checks
+
+
+def _array_checks(schema: dict[str, Any]) -> list[Check]:
+    checks: list[Check] = []
+    if "items" in schema:
+        item_check = _compile(schema["items"])
+
+        def check_items(value: Any, path: str, errors: list[str]) -> None:
+            if isinstance(value, list):
+                for index, item in enumerate(value):
+                    item_check(item, _at(path, index), errors)
+
+        checks.append(check_items)
+    for keyword, compare, message in (
+        ("minItems", lambda size, bound: size >= bound, "must contain at least {} items"),
+        ("maxItems", lambda size, bound: size <= bound, "must contain at most {} items"),
+    ):
+        if keyword in schema:
+            checks.append(_bound_check(list, len, schema[keyword], compare, message))
+    return checks
+
+
+def _bound_check(
+    kind: type | tuple[type, ...],
+    measure: Callable[[Any], Any],
+    bound: Any,
+    compare: Callable[[Any, Any], bool],
+    message: str,
+) -> Check:
+    text = message.format(bound)
+
+    def check(value: Any, path: str, errors: list[str]) -> None:
+        if (
+            isinstance(value, kind)
+            and not isinstance(value, bool)
+            and not compare(measure(value), bound)
+        ):
+            _report(path, text, errors)
+
+    return check
+
+
+def _scalar_checks(schema: dict[str, Any]) -> list[Check]:
+    checks: list[Check] = []
+    if "enum" in schema:
+        options = list(schema["enum"])
+        text = "must be one of " + ", ".join(repr(option) for option in options)
+
+        def check_enum(value: Any, path: str, errors: list[str]) -> None:
+            if value not in options:
+                _report(path, text, errors)
+
+        checks.append(check_enum)
+    if "const" in schema:
+        expected = schema["const"]
+
+        def check_const(value: Any, path: str, errors: list[str]) -> None:
+            if value != expected:
+                _report(path, f"must be {expected!r}", errors)
+
+        checks.append(check_const)
+
+    number, identity = (int, float), (lambda value: value)
+    for keyword, compare, message in (
+        ("minimum", lambda value, bound: value >= bound, "must be >= {}"),
+        ("maximum", lambda value, bound: value <= bound, "must be <= {}"),
+        ("exclusiveMinimum", lambda value, bound: value > bound, "must be > {}"),
+        ("exclusiveMaximum", lambda value, bound: value < bound, "must be < {}"),
+    ):
+        if keyword in schema:
+            checks.append(_bound_check(number, identity, schema[keyword], compare, message))
+    for keyword, compare, message in (
+        ("minLength", lambda size, bound: size >= bound, "must be at least {} characters long"),
+        ("maxLength", lambda size, bound: size <= bound, "must be at most {} characters long"),
+    ):
+        if keyword in schema:
+            checks.append(_bound_check(str, len, schema[keyword], compare, message))
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(value: Any, path: str, errors: list[str]) -> None:
+            if isinstance(value, str) and not pattern.search(value):
+                _report(path, f"must match pattern {pattern.pattern!r}", errors)
+
+        checks.append(check_pattern)
+    return checks
+
+
+def _options_check(options: list[Check], accept: Callable[[int], bool], message: str) -> Check:
+    def check(value: Any, path: str, errors: list[str]) -> None:
+        matches = 0
+        for option in options:
+            option_errors: list[str] = []
+            option(value, path, option_errors)
+            matches += not option_errors
+        if not accept(matches):
+            _report(path, message, errors)
+
+    return check
+
+
+def _combinator_checks(schema: dict[str, Any]) -> list[Check]:
+    checks = [_compile(subschema) for subschema in schema.get("allOf", ())]
+    if "anyOf" in schema:
+        options = [_compile(subschema) for subschema in schema["anyOf"]]
+        checks.append(
+            _options_check(
+                options, lambda matches: matches > 0, "must match at least one allowed schema"
+            )
+        )
+    if "oneOf" in schema:
+        options = [_compile(subschema) for subschema in schema["oneOf"]]
+        checks.append(
+            _options_check(
+                options, lambda matches: matches == 1, "must match exactly one allowed schema"
+            )
+        )
+    return checks
+
+
+_KEYWORDS = _ANNOTATIONS | {
+    "type",
+    "properties",
+    "required",
+    "additionalProperties",
+    "items",
+    "minItems",
+    "maxItems",
+    "enum",
+    "const",
+    "minimum",
+    "maximum",
+    "exclusiveMinimum",
+    "exclusiveMaximum",
+    "minLength",
+    "maxLength",
+    "pattern",
+    "allOf",
+    "anyOf",
+    "oneOf",
+}
+
+
+def _compile(schema: Any) -> Check:
+    if schema is True or schema == {}:
+        return lambda value, path, errors: None
+    if not isinstance(schema, dict):
+        raise ValueError(f"Schema must be an object, got {schema!r}")
+    unsupported = sorted(set(schema) - _KEYWORDS)
+    if unsupported:
+        raise ValueError(f"Unsupported schema keyword {unsupported[0]!r}")
+
+    typed = _type_check(schema)
+    checks = (
+        _object_checks(schema)
+        + _array_checks(schema)
+        + _scalar_checks(schema)
+        + _combinator_checks(schema)
+    )
+
+    def check(value: Any, path: str, errors: list[str]) -> None:
+        if typed is not None and not typed[0](value):
+            _report(path, typed[1], errors)
+            return  # further checks would only repeat the type mismatch
+        for subcheck in checks:
+            subcheck(value, path, errors)
+
+    return check
+
+
+def compile_schema(schema: dict[str, Any]) -> ConfigValidator:
+    """Compile ``schema`` into a function returning all violations of a configuration.
+
+    Raises ``ValueError`` for schemas using keywords this module does not implement.
+    """
+
+    check = _compile(schema)
+
+    def validate(config: dict[str, Any], path: str = "") -> list[str]:
+        errors: list[str] = []
+        check(config, path, errors)
+        return errors
+
+    return validate
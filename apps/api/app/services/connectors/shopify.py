@@ -19,8 +19,17 @@ class ShopifySourceConnector(Connector):
     config_schema = {
         "type": "object",
         "properties": {
-            "shop_name": {"type": "string", "title": "Shop Name", "description": "Your Shopify store name (without .myshopify.com)"},
-            "api_key": {"type": "string", "title": "API Key", "description": "Shopify Admin API access token", "format": "password"},
+            "shop_name": {
+                "type": "string",
+                "title": "Shop Name",
+                "description": "Your Shopify store name (without .myshopify.com)",
+            },
+            "api_key": {
+                "type": "string",
+                "title": "API Key",
+                "description": "Shopify Admin API access token",
+                "format": "password",
+            },
             "api_version": {"type": "string", "title": "API Version", "default": "2024-01"},
             "objects": {
                 "type": "array",
@@ -40,8 +49,6 @@ class ShopifySourceConnector(Connector):
             raise ValueError("API Key is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
-
         shop_name = self.config["shop_name"]
         api_key = self.config["api_key"]
         api_version = self.config.get("api_version", "2024-01")
@@ -52,7 +59,7 @@ class ShopifySourceConnector(Connector):
         objects = self.config.get("objects", ["orders", "products", "customers"])
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             for obj in objects:
                 logger.info(f"Extracting {obj}")
 
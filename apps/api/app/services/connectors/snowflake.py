@@ -1,12 +1,16 @@
 """Snowflake connector for data loading."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 from app.services.connectors import Connector, registry
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 10000
+
 
 class SnowflakeDestinationConnector(Connector):
     """Snowflake data warehouse destination connector."""
@@ -19,7 +23,11 @@ class SnowflakeDestinationConnector(Connector):
     config_schema = {
         "type": "object",
         "properties": {
-            "account": {"type": "string", "title": "Account", "description": "Snowflake account identifier"},
+            "account": {
+                "type": "string",
+                "title": "Account",
+                "description": "Snowflake account identifier",
+            },
             "user": {"type": "string", "title": "Username"},
             "password": {"type": "string", "title": "Password", "format": "password"},
             "database": {"type": "string", "title": "Database"},
@@ -87,7 +95,11 @@ class SnowflakeSourceConnector(Connector):
     config_schema = {
         "type": "object",
         "properties": {
-            "account": {"type": "string", "title": "Account", "description": "Snowflake account identifier"},
+            "account": {
+                "type": "string",
+                "title": "Account",
+                "description": "Snowflake account identifier",
+            },
             "user": {"type": "string", "title": "Username"},
             "password": {"type": "string", "title": "Password", "format": "password"},
             "database": {"type": "string", "title": "Database"},
@@ -115,8 +127,16 @@ class SnowflakeSourceConnector(Connector):
             raise ValueError("Database is required")
 
     async def run(self) -> dict[str, Any]:
+        rows_extracted = 0
+        async for batch in self.read():
+            rows_extracted += len(batch)
+
+        return {"status": "completed", "rows_extracted": rows_extracted}
+
+    async def read(self) -> AsyncIterator[list[dict[str, Any]]]:
         import snowflake.connector
 
+        batch_size = int(self.config.get("batch_size", DEFAULT_BATCH_SIZE))
         conn = snowflake.connector.connect(
             user=self.config["user"],
             password=self.config["password"],
@@ -145,17 +165,19 @@ class SnowflakeSourceConnector(Connector):
                 result = cursor.fetchall()
                 tables = [r[0] for r in result]
 
-            rows_extracted = 0
             for table in tables:
                 logger.info(f"Extracting table: {table}")
                 cursor.execute(f'SELECT * FROM "{schema}"."{table}"')
-                records = cursor.fetchall()
-                rows_extracted += len(records)
-                logger.info(f"Extracted {len(records)} rows from {table}")
+                columns = [column[0] for column in cursor.description]
 
-            cursor.close()
+                extracted = 0
+                # Fetch off the event loop so the destination keeps writing meanwhile.
+                while rows := await asyncio.to_thread(cursor.fetchmany, batch_size):
+                    extracted += len(rows)
+                    yield [dict(zip(columns, row, strict=True)) for row in rows]
+                logger.info(f"Extracted {extracted} rows from {table}")
 
-            return {"status": "completed", "rows_extracted": rows_extracted}
+            cursor.close()
 
         finally:
             conn.close()
@@ -1,12 +1,17 @@
 """Microsoft SQL Server connector for data extraction and loading."""
 
+import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 from app.services.connectors import Connector, registry
+from app.services.connectors.loading import rebatch, record_columns, record_rows
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_BATCH_SIZE = 10000
+
 
 class SQLServerSourceConnector(Connector):
     """Microsoft SQL Server database source connector."""
@@ -24,7 +29,11 @@ class SQLServerSourceConnector(Connector):
             "database": {"type": "string", "title": "Database"},
             "username": {"type": "string", "title": "Username"},
             "password": {"type": "string", "title": "Password", "format": "password"},
-            "driver": {"type": "string", "title": "ODBC Driver", "default": "ODBC Driver 17 for SQL Server"},
+            "driver": {
+                "type": "string",
+                "title": "ODBC Driver",
+                "default": "ODBC Driver 17 for SQL Server",
+            },
             "encrypt": {"type": "boolean", "title": "Encrypt Connection", "default": True},
             "tables": {
                 "type": "array",
@@ -99,8 +108,30 @@ class SQLServerDestinationConnector(Connector):
             "database": {"type": "string", "title": "Database"},
             "username": {"type": "string", "title": "Username"},
             "password": {"type": "string", "title": "Password", "format": "password"},
-            "driver": {"type": "string", "title": "ODBC Driver", "default": "ODBC Driver 17 for SQL Server"},
+            "driver": {
+                "type": "string",
+                "title": "ODBC Driver",
+                "default": "ODBC Driver 17 for SQL Server",
+            },
             "encrypt": {"type": "boolean", "title": "Encrypt Connection", "default": True},
+            "schema": {"type": "string", "title": "Schema", "default": "dbo"},
+            "table": {
+                "type": "string",
+                "title": "Table",
+                "description": "Target table for loaded records",
+            },
+            "primary_key": {
+                "type": "array",
+                "title": "Primary Key",
+                "items": {"type": "string"},
+                "description": "Columns identifying a row; batches are merged through a staging table",
+            },
+            "batch_size": {
+                "type": "integer",
+                "title": "Batch Size",
+                "description": "Rows sent per bulk insert and committed per transaction",
+                "default": DEFAULT_BATCH_SIZE,
+            },
         },
         "required": ["host", "database", "username", "password"],
     }
@@ -120,6 +151,42 @@ class SQLServerDestinationConnector(Connector):
             logger.info("SQL Server destination connector ready")
             return {"status": "completed", "rows_loaded": 0}
 
+    async def write(self, batches: AsyncIterator[list[dict[str, Any]]]) -> dict[str, Any]:
+        import pyodbc
+
+        table = self.config.get("table")
+        if not table:
+            raise ValueError("Table is required to load records")
+
+        target = f"[{self.config.get('schema', 'dbo')}].[{table}]"
+        batch_size = int(self.config.get("batch_size", DEFAULT_BATCH_SIZE))
+        primary_key = self.config.get("primary_key") or []
+
+        # A pyodbc cursor rather than aioodbc's: only pyodbc exposes fast_executemany, which
+        # sends each batch as a single ODBC parameter array instead of one round trip per row.
+        conn = await asyncio.to_thread(
+            pyodbc.connect, self._build_connection_string(), autocommit=False
+        )
+        rows_loaded = 0
+        try:
+            cursor = conn.cursor()
+            cursor.fast_executemany = True
+
+            async for batch in rebatch(batches, batch_size):
+                if primary_key:
+                    batch = _latest_by_key(batch, primary_key)
+                columns = record_columns(batch)
+                rows = record_rows(batch, columns)
+                await asyncio.to_thread(
+                    _load_batch, conn, cursor, target, columns, rows, primary_key
+                )
+                rows_loaded += len(rows)
+                logger.info(f"Loaded {rows_loaded} rows into {target}")
+        finally:
+            await asyncio.to_thread(conn.close)
+
+        return {"status": "completed", "rows_loaded": rows_loaded}
+
     def _build_connection_string(self) -> str:
         driver = self.config.get("driver", "ODBC Driver 17 for SQL Server")
         host = self.config["host"]
@@ -135,5 +202,61 @@ class SQLServerDestinationConnector(Connector):
         )
 
 
+_STAGE = "#openfuse_stage"
+_STAGE_DROP_SQL = f"IF OBJECT_ID('tempdb..{_STAGE}') IS NOT NULL DROP TABLE {_STAGE}"
+
+
+def _column_list(columns: list[str]) -> str:
+    return ", ".join(f"[{column}]" for column in columns)
+
+
+def _insert_sql(target: str, columns: list[str]) -> str:
+    placeholders = ", ".join(["?"] * len(columns))
+    return f"INSERT INTO {target} ({_column_list(columns)}) VALUES ({placeholders})"
+
+
+def _latest_by_key(batch: list[dict[str, Any]], primary_key: list[str]) -> list[dict[str, Any]]:
+    """Keep the last record of each primary key; MERGE fails when a source row matches twice."""
+
+    latest = {tuple(record.get(column) for column in primary_key): record for record in batch}
+    return list(latest.values())
+
+
+def _load_batch(
+    conn: Any,
+    cursor: Any,
+    target: str,
+    columns: list[str],
+    rows: list[tuple],
+    primary_key: list[str],
+) -> None:
+    """Insert ``rows``, or upsert them through the staging table, and commit."""
+
+    if primary_key:
+        cursor.execute(_STAGE_DROP_SQL)
+        cursor.execute(f"SELECT TOP 0 {_column_list(columns)} INTO {_STAGE} FROM {target}")
+        cursor.executemany(_insert_sql(_STAGE, columns), rows)
+        cursor.execute(_merge_sql(target, columns, primary_key))
+    else:
+        cursor.executemany(_insert_sql(target, columns), rows)
+    conn.commit()
+
+
+def _merge_sql(target: str, columns: list[str], primary_key: list[str]) -> str:
+    """Build a MERGE that upserts the staging table into ``target``."""
+
+    condition = " AND ".join(f"t.[{column}] = s.[{column}]" for column in primary_key)
+    updates = ", ".join(
+        f"t.[{column}] = s.[{column}]" for column in columns if column not in primary_key
+    )
+    values = ", ".join(f"s.[{column}]" for column in columns)
+
+    sql = f"MERGE {target} WITH (HOLDLOCK) AS t USING {_STAGE} AS s ON {condition}"
+    if updates:
+        sql += f" WHEN MATCHED THEN UPDATE SET {updates}"
+    sql += f" WHEN NOT MATCHED THEN INSERT ({_column_list(columns)}) VALUES ({values});"
+    return sql
+
+
 registry.register(SQLServerSourceConnector)
 registry.register(SQLServerDestinationConnector)
@@ -0,0 +1,183 @@
+"""Shared helpers for object storage connectors (S3, GCS)."""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+SUPPORTED_FORMATS = ("csv", "json", "parquet")
+SUPPORTED_EXTENSIONS = tuple(f".{file_format}" for file_format in SUPPORTED_FORMATS)
+
+
+def detect_format(key: str, default: str = "csv") -> str:
+    """Infer the file format of an object from its key, falling back to ``default``."""
+
+    lowered = key.lower()
+    for file_format in SUPPORTED_FORMATS:
+        if lowered.endswith(f".{file_format}"):
+            return file_format
+    return default
+
+
+def decode_records(content: bytes, file_format: str, delimiter: str = ",") -> list[dict[str, Any]]:
+    """Decode the raw bytes of a data file into a list of records."""
+
+    if file_format == "csv":
+        reader = csv.DictReader(io.StringIO(content.decode("utf-8-sig")), delimiter=delimiter)
+        return list(reader)
+    if file_format == "json":
+        return _decode_json(content)
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        return pq.read_table(io.BytesIO(content)).to_pylist()
+    raise ValueError(f"Unsupported file format '{file_format}'")
+
+
+def _decode_json(content: bytes) -> list[dict[str, Any]]:
+    text = content.decode("utf-8-sig").strip()
+    if not text:
+        return []
+
+    try:
+        data = json.loads(text)
+    except json.JSONDecodeError:
+        # Fall back to newline-delimited JSON, one record per line.
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+    if isinstance(data, list):
+        return data
+    return [data]
+
+
+def iter_file_batches(
+    path: str | os.PathLike[str], file_format: str, batch_size: int, delimiter: str = ","
+) -> Iterator[list[dict[str, Any]]]:
+    """Decode a local data file incrementally, yielding at most ``batch_size`` records at a time.
+
+    CSV, newline-delimited JSON and Parquet are read without materialising the whole file.
+    A top-level JSON array still has to be parsed in one piece.
+    """
+
+    if file_format == "parquet":
+        import pyarrow.parquet as pq
+
+        for record_batch in pq.ParquetFile(path).iter_batches(batch_size=batch_size):
+            yield record_batch.to_pylist()
+        return
+
+    with open(path, encoding="utf-8-sig", newline="") as handle:
+        if file_format == "csv":
+            rows: Iterator[dict[str, Any]] = csv.DictReader(handle, delimiter=delimiter)
+        elif file_format == "json":
+            rows = _iter_json(handle)
+        else:
+            raise ValueError(f"Unsupported file format '{file_format}'")
+
+        batch: list[dict[str, Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+def _iter_json(handle: Any) -> Iterator[dict[str, Any]]:
+    """Yield records from an open JSON array, single JSON document or JSON lines file."""
+
+    first_line = handle.readline()
+    while first_line and not first_line.strip():
+        first_line = handle.readline()
+    if not first_line:
+        return
+
+    if not first_line.lstrip().startswith("["):
+        try:
+            record = json.loads(first_line)
+        except json.JSONDecodeError:
+            pass
+        else:
+            yield record
+            yield from (json.loads(line) for line in handle if line.strip())
+            return
+
+    handle.seek(0)
+    data = json.load(handle)
+    if isinstance(data, list):
+        yield from data
+    else:
+        yield data
+
+
+def batched(records: list[dict[str, Any]], batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Split ``records`` into consecutive batches of at most ``batch_size`` items."""
+
+    for start in range(0, len(records), batch_size):
+        yield records[start : start + batch_size]
+
+
+def load_manifest(path: str | os.PathLike[str]) -> dict[str, Any]:
+    """Load a manifest of previously ingested objects, returning an empty one if missing."""
+
+    manifest_path = Path(path)
+    if not manifest_path.exists():
+        return {}
+    return json.loads(manifest_path.read_text())
+
+
+def save_manifest(path: str | os.PathLike[str], entries: dict[str, Any]) -> None:
+    """Atomically persist a manifest of ingested objects."""
+
+    manifest_path = Path(path)
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = manifest_path.with_suffix(manifest_path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(entries, separators=(",", ":"), sort_keys=True))
+    os.replace(tmp_path, manifest_path)
+
+
+class ObjectManifest:
+    """Index of already-ingested objects used to skip unchanged files on later runs.
+
+    Each entry maps an object key to a fingerprint (ETag, size, last-modified or
+    generation). ``start_after`` tracks the greatest ingested key so listings of
+    append-only prefixes can resume after the already-seen key space.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None) -> None:
+        self.path = path
+        data = load_manifest(path) if path else {}
+        self.objects: dict[str, dict[str, Any]] = data.get("objects", {})
+        self.start_after: str | None = data.get("start_after")
+
+    def is_unchanged(self, key: str, fingerprint: dict[str, Any]) -> bool:
+        """Return whether ``key`` was already ingested with the same fingerprint."""
+
+        return self.objects.get(key) == fingerprint
+
+    def record(self, key: str, fingerprint: dict[str, Any]) -> None:
+        """Mark ``key`` as ingested."""
+
+        self.objects[key] = fingerprint
+        if self.start_after is None or key > self.start_after:
+            self.start_after = key
+
+    def save(self, keep_objects: bool = True) -> None:
+        """Persist the manifest.
+
+        Append-only listings never revisit keys before ``start_after``, so they can drop
+        the per-object entries and keep the manifest compact.
+        """
+
+        if not self.path:
+            return
+        save_manifest(
+            self.path,
+            {"objects": self.objects if keep_objects else {}, "start_after": self.start_after},
+        )
@@ -19,7 +19,11 @@ class ZendeskSourceConnector(Connector):
     config_schema = {
         "type": "object",
         "properties": {
-            "subdomain": {"type": "string", "title": "Subdomain", "description": "Your Zendesk subdomain (e.g., company.zendesk.com)"},
+            "subdomain": {
+                "type": "string",
+                "title": "Subdomain",
+                "description": "Your Zendesk subdomain (e.g., company.zendesk.com)",
+            },
             "email": {"type": "string", "title": "Email", "description": "Agent email"},
             "api_token": {"type": "string", "title": "API Token", "format": "password"},
             "objects": {
@@ -42,7 +46,6 @@ class ZendeskSourceConnector(Connector):
             raise ValueError("API Token is required")
 
     async def run(self) -> dict[str, Any]:
-        import httpx
         from base64 import b64encode
 
         subdomain = self.config["subdomain"]
@@ -56,7 +59,7 @@ class ZendeskSourceConnector(Connector):
         objects = self.config.get("objects", ["tickets", "users", "organizations"])
 
         rows_extracted = 0
-        async with httpx.AsyncClient(headers=headers, timeout=60.0) as client:
+        async with self.http_client(headers=headers, timeout=60.0) as client:
             for obj in objects:
                 logger.info(f"Extracting {obj}")
 
@@ -0,0 +1,308 @@
+"""Concurrency control for pipeline jobs.
+
+A pipeline has at most one unfinished (pending or running) job. What a new run does
+while one exists is set by the pipeline's ``concurrency_policy``:
+
+* ``skip``: no job is created and the unfinished one is returned instead, so double
+  clicks and overlapping schedules start a single run.
+* ``queue``: the job is created as ``queued`` and becomes pending when the previous
+  job ends.
+* ``cancel_previous``: unfinished and queued jobs are cancelled and the new one starts.
+  Running jobs notice the cancellation within ``job_cancel_poll_seconds``.
+
+The decision is taken while holding row locks on the pipelines (``SELECT ... FOR
+UPDATE``), so concurrent requests for a pipeline are serialized on PostgreSQL. SQLite
+allows one writer at a time, so there a conflicting request fails instead.
+
+Workers also limit how many jobs extract from one source host at a time. A job records
+its source's ``host:port`` when created. A worker moves the job to running only while
+fewer than the host's limit are running, and the check and update form one statement
+under a per-host advisory lock. Jobs that find their host full are retried later.
+
+A job can also be left unfinished by accident: its message is lost before a worker
+takes it (the broker was down when it was published), or its worker dies. Running jobs
+heartbeat, and jobs waiting for their host refresh the heartbeat on every retry, so a
+running job silent for ``job_heartbeat_timeout_seconds`` or a pending one untouched for
+``job_pending_timeout_seconds`` is stale. Stale jobs are made pending and published
+again, by the next run of their pipeline and by a periodic task, so they neither hold
+their pipeline's run slot forever nor lose the run.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Sequence
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, insert, select, text, update
+from sqlalchemy.orm import aliased
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.db.models import ConcurrencyPolicy, Job, JobStatus, Pipeline
+from app.services.workflows.lanes import job_class
+
+logger = logging.getLogger(__name__)
+
+#: Jobs that hold their pipeline's single run slot.
+UNFINISHED = (JobStatus.PENDING, JobStatus.RUNNING)
+
+# First key of the two-key advisory locks taken per source host.
+_HOST_LOCK_NAMESPACE = 0x0F05E
+
+
+def concurrency_key(source_config: dict[str, Any]) -> str | None:
+    """Return the ``host[:port]`` a source extracts from, if its configuration names one."""
+
+    host = source_config.get("host")
+    if not isinstance(host, str) or not host:
+        return None
+    port = source_config.get("port")
+    return f"{host.lower()}:{port}" if port else host.lower()
+
+
+def host_limit(key: str) -> int:
+    """Most jobs that may run against ``key`` at once; 0 means unlimited."""
+
+    return settings.job_host_concurrency.get(key, settings.job_max_concurrency_per_host)
+
+
+def _lock_pipelines(query: Any, pipeline_ids: Sequence[int]) -> Any:
+    # Locks are taken in id order so that overlapping batches cannot deadlock.
+    return query.where(Pipeline.id.in_(pipeline_ids)).order_by(Pipeline.id).with_for_update()
+
+
+def _last_seen() -> Any:
+    return func.coalesce(Job.heartbeat_at, Job.started_at, Job.created_at)
+
+
+def _orphaned(now: datetime) -> Any:
+    # Running jobs whose worker stopped heartbeating.
+    return (Job.status == JobStatus.RUNNING) & (
+        _last_seen() < now - timedelta(seconds=settings.job_heartbeat_timeout_seconds)
+    )
+
+
+def _stale(now: datetime) -> Any:
+    return _orphaned(now) | (
+        (Job.status == JobStatus.PENDING)
+        & (_last_seen() < now - timedelta(seconds=settings.job_pending_timeout_seconds))
+    )
+
+
+def recover_stale_jobs(session: Session, pipeline_ids: Sequence[int] | None = None) -> list[Job]:
+    """Make stale jobs, of the given pipelines or all of them, pending again.
+
+    Returns the jobs, which the caller commits and enqueues. Pipelines given by the
+    caller must already be locked.
+    """
+
+    now = datetime.utcnow()
+    if pipeline_ids is None:
+        pipeline_ids = session.scalars(select(Job.pipeline_id).where(_stale(now)).distinct()).all()
+        if not pipeline_ids:
+            return []
+        session.execute(_lock_pipelines(select(Pipeline.id), pipeline_ids))
+    # Conditional on staleness, so a job claimed in the meantime is left alone.
+    recovered = session.scalars(
+        update(Job)
+        .where(Job.pipeline_id.in_(pipeline_ids), _stale(now))
+        .values(status=JobStatus.PENDING, heartbeat_at=now)
+        .returning(Job),
+        execution_options={"populate_existing": True},
+    ).all()
+    for job in recovered:
+        logger.warning(
+            f"Job {job.id} of pipeline {job.pipeline_id} lost its worker or message; enqueueing it"
+        )
+    return list(recovered)
+
+
+def start_jobs(
+    session: Session, pipeline_ids: Sequence[int], backfill: bool = False
+) -> tuple[list[Job], list[Job]]:
+    """Create jobs for runs of the pipelines according to their concurrency policies.
+
+    Returns a job per pipeline, in ``pipeline_ids`` order, together with the jobs that
+    are pending and need to be enqueued. Skipped runs return the pipeline's unfinished
+    job, and queued ones a job that is enqueued later. The caller commits.
+
+    Stale unfinished jobs of the pipelines are recovered first and enqueued again.
+    """
+
+    pipelines = {
+        pipeline.id: pipeline
+        for pipeline in session.scalars(_lock_pipelines(select(Pipeline), pipeline_ids))
+    }
+    recovered = recover_stale_jobs(session, pipeline_ids)
+    unfinished = {
+        job.pipeline_id: job
+        for job in session.scalars(
+            select(Job)
+            .where(Job.pipeline_id.in_(pipeline_ids), Job.status.in_(UNFINISHED))
+            .order_by(Job.id)
+        )
+    }
+
+    existing: dict[int, Job] = {}
+    rows = []
+    superseded = []
+    for pipeline_id in pipeline_ids:
+        pipeline = pipelines[pipeline_id]
+        current = unfinished.get(pipeline_id)
+        status = JobStatus.PENDING
+        if current is not None:
+            if pipeline.concurrency_policy == ConcurrencyPolicy.SKIP:
+                existing[pipeline_id] = current
+                continue
+            if pipeline.concurrency_policy == ConcurrencyPolicy.QUEUE:
+                status = JobStatus.QUEUED
+        if pipeline.concurrency_policy == ConcurrencyPolicy.CANCEL_PREVIOUS:
+            superseded.append(pipeline_id)
+        job = Job(
+            pipeline_id=pipeline_id,
+            status=status,
+            job_class=job_class(pipeline, backfill),
+            concurrency_key=concurrency_key(pipeline.source_config),
+        )
+        rows.append(job.model_dump(exclude={"id"}))
+
+    if superseded:
+        session.execute(
+            update(Job)
+            .where(Job.pipeline_id.in_(superseded), Job.status.in_((*UNFINISHED, JobStatus.QUEUED)))
+            .values(
+                status=JobStatus.CANCELLED,
+                completed_at=datetime.utcnow(),
+                error_message="Cancelled by a newer run",
+            )
+        )
+
+    created: dict[int, Job] = {}
+    if rows:
+        # Multi-row INSERT; ids follow VALUES order (see the pipelines batch endpoints).
+        inserted = session.scalars(insert(Job).returning(Job), rows).all()
+        created = {job.pipeline_id: job for job in inserted}
+
+    jobs = [existing.get(pipeline_id) or created[pipeline_id] for pipeline_id in pipeline_ids]
+    pending = [
+        job
+        for job in jobs
+        if job is created.get(job.pipeline_id) and job.status == JobStatus.PENDING
+    ]
+    # Recovered jobs superseded by a cancel_previous run were cancelled above.
+    return jobs, [job for job in recovered if job.status == JobStatus.PENDING] + pending
+
+
+def claim_job(session: Session, job: Job) -> bool:
+    """Move a pending job to running if its source host has a free slot, and commit.
+
+    A running job whose worker stopped heartbeating is taken over the same way, which
+    is how a message redelivered after its worker died runs the job again.
+
+    Returns False and leaves the job alone when it is finished or cancelled, running
+    with a live worker (a duplicate message), or its host is full; the refreshed
+    ``job.status`` tells which. A job waiting for its host has its heartbeat refreshed,
+    as its message is alive.
+    """
+
+    now = datetime.utcnow()
+    claim = update(Job).where(Job.id == job.id, (Job.status == JobStatus.PENDING) | _orphaned(now))
+    limit = host_limit(job.concurrency_key) if job.concurrency_key else 0
+    if limit:
+        if session.get_bind().dialect.name == "postgresql":
+            session.execute(
+                text("SELECT pg_advisory_xact_lock(:namespace, hashtext(:key))"),
+                {"namespace": _HOST_LOCK_NAMESPACE, "key": job.concurrency_key},
+            )
+        other = aliased(Job)
+        running = (
+            select(func.count())
+            .select_from(other)
+            .where(
+                other.concurrency_key == job.concurrency_key,
+                other.status == JobStatus.RUNNING,
+                other.id != job.id,  # an orphaned job taken over keeps its slot
+            )
+            .scalar_subquery()
+        )
+        claim = claim.where(running < limit)
+
+    claimed = (
+        session.execute(
+            claim.values(status=JobStatus.RUNNING, started_at=now, heartbeat_at=now)
+        ).rowcount
+        == 1
+    )
+    if not claimed:
+        session.execute(
+            update(Job)
+            .where(Job.id == job.id, Job.status == JobStatus.PENDING)
+            .values(heartbeat_at=now)
+        )
+    session.commit()
+    session.refresh(job)
+    return claimed
+
+
+def finish_job(session: Session, job: Job, **outcome: Any) -> Job | None:
+    """Record the outcome of a running job, promote the next queued run, and commit.
+
+    ``outcome`` holds the columns to set, such as ``status``. A job cancelled while it
+    ran stays cancelled and only its metrics are recorded. Returns the job promoted to
+    pending, which the caller enqueues.
+    """
+
+    # Pipeline before job, in the same order as start_jobs, so the two cannot deadlock.
+    session.execute(_lock_pipelines(select(Pipeline.id), [job.pipeline_id]))
+    finished = (
+        update(Job).where(Job.id == job.id, Job.status == JobStatus.RUNNING).values(**outcome)
+    )
+    if session.execute(finished).rowcount == 0 and "metrics" in outcome:
+        session.execute(update(Job).where(Job.id == job.id).values(metrics=outcome["metrics"]))
+    promoted = promote_queued(session, job.pipeline_id)
+    session.commit()
+    session.refresh(job)
+    return promoted
+
+
+def cancel_job(session: Session, job: Job) -> Job | None:
+    """Cancel a queued, pending or running job and commit; returns the job promoted instead.
+
+    A job that finished in the meantime keeps its status; ``job`` is refreshed.
+    """
+
+    session.execute(_lock_pipelines(select(Pipeline.id), [job.pipeline_id]))
+    session.execute(
+        update(Job)
+        .where(Job.id == job.id, Job.status.in_((*UNFINISHED, JobStatus.QUEUED)))
+        .values(
+            status=JobStatus.CANCELLED, completed_at=datetime.utcnow(), error_message="Cancelled"
+        )
+    )
+    promoted = promote_queued(session, job.pipeline_id)
+    session.commit()
+    session.refresh(job)
+    return promoted
+
+
+def promote_queued(session: Session, pipeline_id: int) -> Job | None:
+    """Make the oldest queued job of a pipeline pending once nothing else is unfinished."""
+
+    session.execute(_lock_pipelines(select(Pipeline.id), [pipeline_id]))
+    busy = session.scalar(
+        select(Job.id).where(Job.pipeline_id == pipeline_id, Job.status.in_(UNFINISHED)).limit(1)
+    )
+    if busy is not None:
+        return None
+    queued = session.scalar(
+        select(Job)
+        .where(Job.pipeline_id == pipeline_id, Job.status == JobStatus.QUEUED)
+        .order_by(Job.id)
+        .limit(1)
+    )
+    if queued is not None:
+        queued.status = JobStatus.PENDING
+        session.flush()
+    return queued
@@ -0,0 +1,128 @@
+"""Parsing of ``Pipeline.schedule_cron`` expressions and computation of fire times.
+
+Expressions use the five standard fields (minute, hour, day of month, month, day of
+week) with ``*``, lists, ranges, steps and month/weekday names, or one of the
+``@hourly``, ``@daily``, ``@weekly``, ``@monthly`` and ``@yearly`` macros. As in
+cron, when both day fields are restricted a day matching either one fires. Times are
+naive UTC, like every timestamp the API stores.
+"""
+
+from __future__ import annotations
+
+import calendar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+MONTHS = {name.lower(): index for index, name in enumerate(calendar.month_abbr) if name}
+WEEKDAYS = {
+    name: index for index, name in enumerate(["sun", "mon", "tue", "wed", "thu", "fri", "sat"])
+}
+
+#: Schedules such as February 29th fire at least every eight years.
+SEARCH_YEARS = 9
+
+
+def _parse_field(text: str, low: int, high: int, names: dict[str, int]) -> frozenset[int]:
+    values: set[int] = set()
+    for part in text.lower().split(","):
+        span, _, step_text = part.partition("/")
+        step = int(step_text) if step_text.isdigit() else None
+        if step_text and not step:
+            raise ValueError(f"Invalid step in {part!r}")
+
+        if span == "*":
+            start, end = low, high
+        else:
+            first, _, last = span.partition("-")
+            start = names[first] if first in names else int(first)
+            end = (
+                (names[last] if last in names else int(last)) if last else (high if step else start)
+            )
+        if not low <= start <= end <= high:
+            raise ValueError(f"{part!r} is outside {low}-{high}")
+        values.update(range(start, end + 1, step or 1))
+    return frozenset(values)
+
+
+@dataclass(frozen=True)
+class CronSchedule:
+    """A parsed cron expression."""
+
+    expression: str
+    minutes: frozenset[int]
+    hours: frozenset[int]
+    days: frozenset[int]
+    months: frozenset[int]
+    weekdays: frozenset[int]
+    #: Whether the day of month and day of week fields were restricted (not ``*``).
+    days_restricted: bool
+    weekdays_restricted: bool
+
+    @classmethod
+    def parse(cls, expression: str) -> CronSchedule:
+        """Parse ``expression``; raises ``ValueError`` when it is not a valid schedule."""
+
+        fields = MACROS.get(expression.strip().lower(), expression).split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression {expression!r} must have five fields")
+        try:
+            weekdays = _parse_field(fields[4], 0, 7, WEEKDAYS)
+            schedule = cls(
+                expression=expression,
+                minutes=_parse_field(fields[0], 0, 59, {}),
+                hours=_parse_field(fields[1], 0, 23, {}),
+                days=_parse_field(fields[2], 1, 31, {}),
+                months=_parse_field(fields[3], 1, 12, MONTHS),
+                # 7 is an alias for Sunday.
+                weekdays=frozenset(day % 7 for day in weekdays),
+                days_restricted=not fields[2].startswith("*"),
+                weekdays_restricted=not fields[4].startswith("*"),
+            )
+        except (KeyError, ValueError) as exc:
+            raise ValueError(f"Invalid cron expression {expression!r}: {exc}") from exc
+        schedule.next_after(datetime(2000, 1, 1))  # rejects dates that never occur, e.g. 30 2
+        return schedule
+
+    def _day_matches(self, moment: datetime) -> bool:
+        in_days = moment.day in self.days
+        # datetime counts Monday as 0, cron counts Sunday as 0.
+        in_weekdays = (moment.weekday() + 1) % 7 in self.weekdays
+        if self.days_restricted and self.weekdays_restricted:
+            return in_days or in_weekdays
+        return in_days and in_weekdays
+
+    def next_after(self, moment: datetime) -> datetime:
+        """Return the first fire time strictly after ``moment``."""
+
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate.replace(year=candidate.year + SEARCH_YEARS, day=1)
+        # Each step jumps to the next month, day or hour that can match.
+        while candidate < limit:
+            if candidate.month not in self.months:
+                year, month = divmod(candidate.month, 12)
+                candidate = candidate.replace(
+                    year=candidate.year + year, month=month + 1, day=1, hour=0, minute=0
+                )
+            elif not self._day_matches(candidate):
+                candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+            else:
+                hour = min((h for h in self.hours if h >= candidate.hour), default=None)
+                if hour is None:
+                    candidate = (candidate + timedelta(days=1)).replace(hour=0, minute=0)
+                    continue
+                if hour > candidate.hour:
+                    candidate = candidate.replace(hour=hour, minute=0)
+                minute = min((m for m in self.minutes if m >= candidate.minute), default=None)
+                if minute is not None:
+                    return candidate.replace(minute=minute)
+                candidate = (candidate + timedelta(hours=1)).replace(minute=0)
+        raise ValueError(f"Cron expression {self.expression!r} never fires")
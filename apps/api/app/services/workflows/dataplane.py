@@ -0,0 +1,343 @@
+"""In-process data plane moving record batches from a source into a destination."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from app.core import tracing
+from app.core.metrics import observe_batch
+from app.services.connectors import Connector
+
+logger = logging.getLogger(__name__)
+
+#: Records sampled per batch when estimating its in-memory size.
+SIZE_SAMPLE = 32
+
+# Spill file schema metadata listing, per record index, the keys the record lacked.
+_MISSING_KEYS = "openfuse.missing_keys"
+
+
+@dataclass
+class JobMetrics:
+    """Throughput and latency counters for the data moved by a job.
+
+    Comparing the time spent reading, waiting and writing shows whether a slow
+    pipeline is bound by its source, its destination or the hand-off in between.
+    """
+
+    rows_read: int = 0
+    rows_written: int = 0
+    bytes_read: int = 0
+    bytes_written: int = 0
+    batches_read: int = 0
+    batches_written: int = 0
+    #: Time spent waiting on the source for the next batch.
+    source_read_seconds: float = 0.0
+    #: Time spent handling batches between stages (size accounting, spill encode/decode).
+    transform_seconds: float = 0.0
+    #: Time spent inside the destination, excluding waits for the next batch.
+    destination_write_seconds: float = 0.0
+    #: Time the source was paused because the queue was full (destination-bound).
+    reader_wait_seconds: float = 0.0
+    #: Time the destination waited for the queue to fill (source-bound).
+    writer_wait_seconds: float = 0.0
+    peak_buffered_bytes: int = 0
+    spilled_batches: int = 0
+    #: Times the job was put back because its source host was running its limit of jobs.
+    host_waits: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_written / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "rows_per_second": round(self.rows_per_second, 3)}
+
+
+def estimate_batch_bytes(batch: list[dict[str, Any]]) -> int:
+    """Estimate the in-memory footprint of a record batch from an evenly spaced sample."""
+
+    if not batch:
+        return 0
+
+    step = max(len(batch) // SIZE_SAMPLE, 1)
+    sample = batch[::step][:SIZE_SAMPLE]
+    sampled = sum(
+        sys.getsizeof(record) + sum(sys.getsizeof(k) + sys.getsizeof(v) for k, v in record.items())
+        for record in sample
+    )
+    return sampled * len(batch) // len(sample)
+
+
+class SpillStore:
+    """Arrow IPC files holding record batches that overflowed the in-memory budget.
+
+    Files are LZ4-compressed, memory-mapped when read back and deleted once consumed.
+    """
+
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.directory = tempfile.mkdtemp(prefix="openfuse-spill-", dir=directory)
+        self.max_bytes = max_bytes
+        self.disk_bytes = 0
+        self.spilled_batches = 0
+
+    @classmethod
+    def create(cls, directory: str | None, max_bytes: int) -> SpillStore | None:
+        """Return a spill store, or ``None`` when spilling is disabled or pyarrow is unavailable."""
+
+        if not directory or max_bytes <= 0:
+            return None
+        if importlib.util.find_spec("pyarrow") is None:
+            logger.warning("pyarrow is not installed; batch queues will block instead of spilling")
+            return None
+        return cls(directory, max_bytes)
+
+    def write(self, batch: list[dict[str, Any]]) -> str | None:
+        """Spill ``batch`` to disk and return its path.
+
+        Returns ``None`` when the disk budget is used up or the records cannot be
+        represented as Arrow columns, in which case the caller keeps the batch in memory.
+        """
+
+        import pyarrow as pa
+        from pyarrow import ipc
+
+        if self.disk_bytes >= self.max_bytes:
+            return None
+        # One column per key found in any record; from_pylist would only keep the first
+        # record's keys. Keys a record lacks are stored as nulls and listed in the schema
+        # metadata, so that read() returns the records as they were written.
+        keys = list(dict.fromkeys(key for record in batch for key in record))
+        missing = {
+            index: [key for key in keys if key not in record]
+            for index, record in enumerate(batch)
+            if len(record) < len(keys)
+        }
+        try:
+            table = pa.Table.from_pydict(
+                {key: [record.get(key) for record in batch] for key in keys}
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            return None
+        if missing:
+            table = table.replace_schema_metadata({_MISSING_KEYS: json.dumps(missing)})
+
+        path = os.path.join(self.directory, f"{self.spilled_batches:08d}.arrow")
+        options = ipc.IpcWriteOptions(compression="lz4")
+        with (
+            pa.OSFile(path, "wb") as sink,
+            ipc.new_file(sink, table.schema, options=options) as writer,
+        ):
+            writer.write_table(table)
+
+        self.disk_bytes += os.path.getsize(path)
+        self.spilled_batches += 1
+        return path
+
+    def read(self, path: str) -> list[dict[str, Any]]:
+        """Load a spilled batch back into records and delete its file."""
+
+        import pyarrow as pa
+        from pyarrow import ipc
+
+        with pa.memory_map(path) as source:
+            table = ipc.open_file(source).read_all()
+        batch = table.to_pylist()
+        metadata = table.schema.metadata or {}
+        for index, keys in json.loads(metadata.get(_MISSING_KEYS.encode(), b"{}")).items():
+            record = batch[int(index)]
+            for key in keys:
+                del record[key]
+        self.disk_bytes -= os.path.getsize(path)
+        os.unlink(path)
+        return batch
+
+    def cleanup(self) -> None:
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+
+class BatchQueue:
+    """Queue of record batches bounded by their estimated size in bytes.
+
+    ``put`` waits while the buffered batches exceed ``max_bytes``, pausing the reader
+    until the writer catches up. A single batch is always admitted into an empty queue
+    so oversized batches cannot deadlock the pipeline.
+
+    With a :class:`SpillStore`, overflowing batches are written to disk instead so the
+    reader can finish (and release its source cursor) while a slow writer catches up.
+    The queue expects a single reader task.
+    """
+
+    def __init__(self, max_bytes: int, spill: SpillStore | None = None) -> None:
+        self.max_bytes = max_bytes
+        self.spill = spill
+        self.buffered_bytes = 0
+        self.peak_bytes = 0
+        self.put_bytes = 0
+        self.get_bytes = 0
+        self.put_wait_seconds = 0.0
+        self.get_wait_seconds = 0.0
+        self.handling_seconds = 0.0
+        # Entries are in-memory batches, or paths of spilled batches with a size of zero.
+        self._batches: deque[tuple[list[dict[str, Any]] | str, int]] = deque()
+        self._closed = False
+        self._error: BaseException | None = None
+        self._changed = asyncio.Condition()
+
+    def _has_room(self, size: int) -> bool:
+        return not self._batches or self.buffered_bytes + size <= self.max_bytes
+
+    async def put(self, batch: list[dict[str, Any]]) -> None:
+        started = time.perf_counter()
+        size = estimate_batch_bytes(batch)
+        self.put_bytes += size
+
+        if self.spill is not None and not self._has_room(size):
+            path = await asyncio.to_thread(self.spill.write, batch)
+            if path is not None:
+                async with self._changed:
+                    self._batches.append((path, 0))
+                    self._changed.notify_all()
+                self.handling_seconds += time.perf_counter() - started
+                return
+        self.handling_seconds += time.perf_counter() - started
+
+        async with self._changed:
+            waiting = time.perf_counter()
+            await self._changed.wait_for(lambda: self._has_room(size))
+            self.put_wait_seconds += time.perf_counter() - waiting
+            self._batches.append((batch, size))
+            self.buffered_bytes += size
+            self.peak_bytes = max(self.peak_bytes, self.buffered_bytes)
+            self._changed.notify_all()
+
+    async def get(self) -> list[dict[str, Any]] | None:
+        """Return the next batch, or ``None`` once the queue is closed and drained."""
+
+        async with self._changed:
+            waiting = time.perf_counter()
+            await self._changed.wait_for(lambda: self._batches or self._closed)
+            self.get_wait_seconds += time.perf_counter() - waiting
+            if self._error is not None:
+                raise self._error
+            if not self._batches:
+                return None
+            entry, size = self._batches.popleft()
+            self.buffered_bytes -= size
+            self._changed.notify_all()
+
+        if isinstance(entry, str):
+            started = time.perf_counter()
+            entry = await asyncio.to_thread(self.spill.read, entry)
+            self.handling_seconds += time.perf_counter() - started
+            size = estimate_batch_bytes(entry)
+        self.get_bytes += size
+        return entry
+
+    async def close(self, error: BaseException | None = None) -> None:
+        """Signal that no more batches will be added, optionally propagating a reader error."""
+
+        async with self._changed:
+            self._closed = True
+            self._error = error
+            self._changed.notify_all()
+
+    async def __aiter__(self) -> AsyncIterator[list[dict[str, Any]]]:
+        while (batch := await self.get()) is not None:
+            yield batch
+
+
+async def stream_records(
+    source: Connector,
+    destination: Connector,
+    max_bytes: int,
+    spill_dir: str | None = None,
+    spill_max_bytes: int = 0,
+    metrics: JobMetrics | None = None,
+) -> dict[str, Any]:
+    """Run ``source.read()`` and ``destination.write()`` concurrently through a bounded queue.
+
+    When ``metrics`` is given it is filled in as the job progresses, including on failure.
+    """
+
+    metrics = metrics if metrics is not None else JobMetrics()
+    spill = SpillStore.create(spill_dir, spill_max_bytes)
+    queue = BatchQueue(max_bytes, spill)
+
+    async def produce() -> None:
+        reader = aiter(source.read())
+        try:
+            with tracing.span("source.read", **{"openfuse.connector": source.name}):
+                await read_all(reader)
+        except BaseException as exc:
+            await queue.close(exc)
+            raise
+        await queue.close()
+
+    async def read_all(reader: AsyncIterator[list[dict[str, Any]]]) -> None:
+        while True:
+            started = time.perf_counter()
+            try:
+                batch = await anext(reader)
+            except StopAsyncIteration:
+                break
+            metrics.source_read_seconds += time.perf_counter() - started
+            metrics.rows_read += len(batch)
+            metrics.batches_read += 1
+            observe_batch(source.name, len(batch))
+            await queue.put(batch)
+
+    async def deliver() -> AsyncIterator[list[dict[str, Any]]]:
+        async for batch in queue:
+            metrics.batches_written += 1
+            # Covers the destination's handling of the batch, until it asks for the next one.
+            batch_span = tracing.start_span(
+                "batch.write",
+                **{"openfuse.connector": destination.name, "openfuse.batch.rows": len(batch)},
+            )
+            try:
+                yield batch
+            finally:
+                batch_span.end()
+
+    started = time.perf_counter()
+    producer = asyncio.create_task(produce())
+    try:
+        with tracing.span("destination.write", **{"openfuse.connector": destination.name}):
+            result = await destination.write(deliver()) or {}
+    except BaseException:
+        producer.cancel()
+        raise
+    finally:
+        if spill is not None:
+            metrics.spilled_batches = spill.spilled_batches
+            spill.cleanup()
+        writing = time.perf_counter() - started
+        metrics.elapsed_seconds = writing
+        metrics.destination_write_seconds = max(
+            writing - queue.get_wait_seconds - queue.handling_seconds, 0.0
+        )
+        metrics.transform_seconds = queue.handling_seconds
+        metrics.reader_wait_seconds = queue.put_wait_seconds
+        metrics.writer_wait_seconds = queue.get_wait_seconds
+        metrics.bytes_read = queue.put_bytes
+        metrics.bytes_written = queue.get_bytes
+        metrics.peak_buffered_bytes = queue.peak_bytes
+
+    await producer
+    metrics.rows_written = int(result.get("rows_loaded") or 0)
+    return result
@@ -0,0 +1,85 @@
+"""Priority lanes and fair share for pipeline jobs.
+
+Each job class has its own Celery queue (lane). Workers consume the lanes in the order
+of ``LANES`` with Redis' ``priority`` queue order strategy, so a burst of backfills
+cannot hold up incremental syncs waiting behind it. Running jobs are not preempted, so
+workers started with ``-Q workflows.incremental`` keep capacity free for short jobs.
+
+Within a lane, Redis message priorities order pipelines by weighted fair share. A
+pipeline's usage is the worker time its jobs took over the last
+``job_fair_share_window_seconds``, divided by its ``fair_share_weight``. Pipelines
+that used little of their share are served first, and a heavy pipeline cannot starve
+the others in its lane.
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, literal, select
+from sqlalchemy.engine import Connection
+
+from app.core.config import settings
+from app.db.models import Job, JobClass, Pipeline, ReplicationMode
+
+#: Celery queue of each job class, from the most to the least urgent.
+LANES = {
+    JobClass.INCREMENTAL: "workflows.incremental",
+    JobClass.FULL_REFRESH: "workflows.full_refresh",
+    JobClass.BACKFILL: "workflows.backfill",
+}
+#: Queue of maintenance tasks such as job retention, consumed after the lanes.
+MAINTENANCE_QUEUE = "workflows"
+QUEUES = [*LANES.values(), MAINTENANCE_QUEUE]
+
+#: Redis priority steps; 0 is consumed first.
+PRIORITY_LEVELS = 10
+
+
+def job_class(pipeline: Pipeline, backfill: bool = False) -> JobClass:
+    """Classify a run of ``pipeline``."""
+
+    if backfill:
+        return JobClass.BACKFILL
+    if pipeline.replication_mode == ReplicationMode.FULL_TABLE:
+        return JobClass.FULL_REFRESH
+    return JobClass.INCREMENTAL
+
+
+def priority(usage_seconds: float, weight: float) -> int:
+    """Map weighted usage to a priority: 0 for none, one step more per doubling of usage."""
+
+    share = usage_seconds / weight / settings.job_fair_share_quantum_seconds
+    return min(PRIORITY_LEVELS - 1, int(math.log2(1 + share)))
+
+
+def _seconds(connection: Connection, start: Any, end: Any) -> Any:
+    if connection.dialect.name == "sqlite":
+        return (func.julianday(end) - func.julianday(start)) * 86400
+    return func.extract("epoch", end - start)
+
+
+def fair_share_priorities(connection: Connection, pipeline_ids: Iterable[int]) -> dict[int, int]:
+    """Return the message priority of the next job of each pipeline, with one query."""
+
+    now = datetime.utcnow()
+    started = Job.started_at >= now - timedelta(seconds=settings.job_fair_share_window_seconds)
+    usage = func.coalesce(
+        func.sum(
+            _seconds(connection, Job.started_at, func.coalesce(Job.completed_at, literal(now)))
+        ),
+        0,
+    )
+    query = (
+        select(Pipeline.id, Pipeline.fair_share_weight, usage)
+        .outerjoin(Job, (Job.pipeline_id == Pipeline.id) & started)
+        .where(Pipeline.id.in_(set(pipeline_ids)))
+        .group_by(Pipeline.id, Pipeline.fair_share_weight)
+    )
+    return {
+        pipeline_id: priority(float(seconds), weight)
+        for pipeline_id, weight, seconds in connection.execute(query)
+    }
@@ -0,0 +1,114 @@
+"""Opt-in CPU and memory profiling of pipeline runs."""
+
+from __future__ import annotations
+
+import collections
+import json
+import sys
+import threading
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import FrameType
+
+#: Seconds between stack samples.
+SAMPLE_INTERVAL = 0.01
+#: Frames kept per tracemalloc allocation traceback.
+TRACEMALLOC_FRAMES = 10
+#: Allocation sites reported in the memory artifact.
+TOP_ALLOCATIONS = 25
+
+
+class SamplingProfiler:
+    """Periodically sample the call stack of one thread from a background thread.
+
+    Samples are aggregated into the "folded stacks" text format (``root;caller;callee
+    count`` per line) read by flamegraph.pl, speedscope and inferno. Sampling keeps
+    the overhead roughly constant regardless of how many calls the job makes.
+    """
+
+    def __init__(self, thread_id: int | None = None, interval: float = SAMPLE_INTERVAL) -> None:
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.interval = interval
+        self.samples: collections.Counter[str] = collections.Counter()
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name="openfuse-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[_folded_stack(frame)] += 1
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in sorted(self.samples.items()))
+
+
+def _folded_stack(frame: FrameType | None) -> str:
+    names = []
+    while frame is not None:
+        code = frame.f_code
+        names.append(f"{code.co_name} ({code.co_filename}:{code.co_firstlineno})")
+        frame = frame.f_back
+    return ";".join(reversed(names))
+
+
+@dataclass
+class ProfileResult:
+    """Profiling output, ready to be stored as job artifacts."""
+
+    folded_stacks: str = ""
+    allocations: dict = field(default_factory=dict)
+
+    def artifacts(self) -> list[tuple[str, str, str]]:
+        """Return ``(name, content_type, content)`` tuples for each artifact."""
+
+        return [
+            ("profile.folded", "text/plain", self.folded_stacks),
+            ("allocations.json", "application/json", json.dumps(self.allocations)),
+        ]
+
+
+@contextmanager
+def profile_run(top: int = TOP_ALLOCATIONS) -> Iterator[ProfileResult]:
+    """Sample the current thread's stacks and trace its allocations for the duration of the block."""
+
+    result = ProfileResult()
+    owns_tracemalloc = not tracemalloc.is_tracing()
+    if owns_tracemalloc:
+        tracemalloc.start(TRACEMALLOC_FRAMES)
+    tracemalloc.reset_peak()
+    profiler = SamplingProfiler()
+    profiler.start()
+    try:
+        yield result
+    finally:
+        profiler.stop()
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)]
+        )
+        current, peak = tracemalloc.get_traced_memory()
+        if owns_tracemalloc:
+            tracemalloc.stop()
+
+        result.folded_stacks = profiler.folded()
+        result.allocations = {
+            "current_bytes": current,
+            "peak_bytes": peak,
+            "top": [
+                {
+                    "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "size_bytes": stat.size,
+                    "count": stat.count,
+                }
+                for stat in snapshot.statistics("lineno")[:top]
+            ],
+        }
@@ -0,0 +1,259 @@
+"""Scheduler process that starts pipeline runs on their ``schedule_cron``.
+
+Run it with ``python -m app.services.workflows.scheduler``. Active pipelines with a
+schedule are kept in a min-heap keyed by their next fire time, so each wake-up only
+looks at the schedules that are due. The process sleeps until the earliest one, or
+``scheduler_poll_seconds`` at most, and then reads only the pipelines whose
+``updated_at`` moved since the previous poll. Rows updated within
+``scheduler_lookback_seconds`` of the last change seen are read again, because
+transactions can commit out of ``updated_at`` order.
+
+Several replicas can run: on PostgreSQL the leader holds a session-level advisory
+lock and the others wait to take over. A new leader schedules from the current
+time, so runs due while no scheduler was leading are skipped rather than made up.
+Other databases have no advisory locks; run a single scheduler there.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import signal
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import lru_cache
+
+from sqlalchemy import select, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import DBAPIError
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.db.models import Pipeline, PipelineStatus
+from app.services.workflows.concurrency import start_jobs
+from app.services.workflows.cron import CronSchedule
+
+logger = logging.getLogger(__name__)
+
+#: Advisory lock key shared by every scheduler replica ("openfuse" in ASCII).
+LOCK_KEY = int.from_bytes(b"openfuse", "big")
+
+# Many pipelines share a handful of expressions.
+parse_cron = lru_cache(maxsize=1024)(CronSchedule.parse)
+
+
+class LeaderLock:
+    """PostgreSQL advisory lock held on a dedicated connection for as long as it lives.
+
+    On other databases leadership is always granted.
+    """
+
+    def __init__(self, engine: Engine, key: int = LOCK_KEY) -> None:
+        self.engine = engine
+        self.key = key
+        self.held = False
+        self._connection: Connection | None = None
+
+    def hold(self) -> bool:
+        """Take the lock, or check that its connection is still alive if already held."""
+
+        if self.engine.dialect.name != "postgresql":
+            return True
+        try:
+            if self._connection is None:
+                self._connection = self.engine.connect()
+            if self.held:
+                self._connection.execute(text("SELECT 1"))
+            else:
+                query = text("SELECT pg_try_advisory_lock(:key)")
+                self.held = bool(self._connection.execute(query, {"key": self.key}).scalar())
+            # Session-level advisory locks outlive transactions; don't sit idle in one.
+            self._connection.commit()
+        except DBAPIError:
+            logger.warning("Scheduler lock connection failed", exc_info=True)
+            self._close()
+        return self.held
+
+    def release(self) -> None:
+        if self._connection is not None and self.held:
+            try:
+                self._connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": self.key})
+                self._connection.commit()
+            except DBAPIError:
+                pass  # closing the connection releases the lock as well
+        self._close()
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.invalidate()
+            self._connection.close()
+        self._connection = None
+        self.held = False
+
+
+@dataclass(slots=True)
+class _Entry:
+    cron: CronSchedule
+    fire_at: datetime
+    updated_at: datetime
+
+
+class Scheduler:
+    """Heap of the next fire time of every scheduled pipeline."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        poll_seconds: float | None = None,
+        lookback_seconds: float | None = None,
+        clock: Callable[[], datetime] = datetime.utcnow,
+    ) -> None:
+        self.engine = engine
+        self.poll_seconds = (
+            settings.scheduler_poll_seconds if poll_seconds is None else poll_seconds
+        )
+        lookback_seconds = (
+            settings.scheduler_lookback_seconds if lookback_seconds is None else lookback_seconds
+        )
+        self.lookback = timedelta(seconds=lookback_seconds)
+        self.clock = clock
+        self.entries: dict[int, _Entry] = {}
+        # (fire_at, pipeline_id); entries rescheduled or removed leave stale items behind
+        # that are skipped when popped.
+        self.heap: list[tuple[datetime, int]] = []
+        #: Latest ``updated_at`` seen; ``None`` until the first, full load.
+        self.watermark: datetime | None = None
+
+    def reset(self) -> None:
+        self.entries.clear()
+        self.heap.clear()
+        self.watermark = None
+
+    def refresh(self, now: datetime) -> int:
+        """Apply pipeline changes since the previous refresh; returns the rows read."""
+
+        query = select(Pipeline.id, Pipeline.schedule_cron, Pipeline.status, Pipeline.updated_at)
+        if self.watermark is None:
+            query = query.where(
+                Pipeline.schedule_cron.is_not(None), Pipeline.status == PipelineStatus.ACTIVE
+            )
+        else:
+            query = query.where(Pipeline.updated_at >= self.watermark - self.lookback)
+        with self.engine.connect() as connection:
+            rows = connection.execute(query.order_by(Pipeline.updated_at, Pipeline.id)).all()
+
+        # The full load saw every committed change; later ones are newer than ``now`` give
+        # or take the lookback.
+        self.watermark = self.watermark or now
+        for pipeline_id, expression, status, updated_at in rows:
+            self.watermark = max(self.watermark, updated_at)
+            entry = self.entries.get(pipeline_id)
+            if entry is not None and entry.updated_at == updated_at:
+                continue  # read again within the lookback window
+            if status != PipelineStatus.ACTIVE or not expression:
+                self.entries.pop(pipeline_id, None)
+                continue
+            try:
+                cron = parse_cron(expression)
+            except ValueError as exc:
+                logger.warning("Not scheduling pipeline %s: %s", pipeline_id, exc)
+                self.entries.pop(pipeline_id, None)
+                continue
+
+            if entry is not None and entry.cron == cron:
+                entry.updated_at = updated_at
+                continue
+            self._schedule(pipeline_id, _Entry(cron, cron.next_after(now), updated_at))
+        return len(rows)
+
+    def _schedule(self, pipeline_id: int, entry: _Entry) -> None:
+        self.entries[pipeline_id] = entry
+        heapq.heappush(self.heap, (entry.fire_at, pipeline_id))
+
+    def due(self, now: datetime) -> list[int]:
+        """Pop the pipelines due at ``now`` and schedule their next runs."""
+
+        pipeline_ids = []
+        while self.heap and self.heap[0][0] <= now:
+            fire_at, pipeline_id = heapq.heappop(self.heap)
+            entry = self.entries.get(pipeline_id)
+            if entry is None or entry.fire_at != fire_at:
+                continue
+            pipeline_ids.append(pipeline_id)
+            entry.fire_at = entry.cron.next_after(now)
+            heapq.heappush(self.heap, (entry.fire_at, pipeline_id))
+        return pipeline_ids
+
+    def start_runs(self, pipeline_ids: list[int]) -> list[int]:
+        """Start runs of the pipelines under their concurrency policies; returns the jobs enqueued."""
+
+        if not pipeline_ids:
+            return []
+        with Session(self.engine, expire_on_commit=False) as session:
+            _, pending = start_jobs(session, pipeline_ids)
+            session.commit()
+        job_ids = [job.id for job in pending]
+
+        from app.services.workflows import tasks
+
+        try:
+            tasks.enqueue_runs(pending)
+        except Exception:
+            # The jobs stay pending, as for runs started through the API without a broker.
+            logger.exception("Could not enqueue scheduled jobs %s", job_ids)
+        return job_ids
+
+    def tick(self) -> float:
+        """Refresh, start due runs and return the seconds to sleep before the next tick."""
+
+        now = self.clock()
+        self.refresh(now)
+        started = self.start_runs(self.due(now))
+        if started:
+            logger.info("Started %d scheduled runs", len(started))
+        if not self.heap:
+            return self.poll_seconds
+        until_due = (self.heap[0][0] - self.clock()).total_seconds()
+        return max(0.0, min(self.poll_seconds, until_due))
+
+    def run(self, stop: threading.Event) -> None:
+        """Schedule runs while holding leadership, until ``stop`` is set."""
+
+        lock = LeaderLock(self.engine)
+        try:
+            while not stop.is_set():
+                if not lock.hold():
+                    if self.watermark is not None:
+                        logger.warning("Lost scheduler leadership")
+                        self.reset()
+                    stop.wait(self.poll_seconds)
+                    continue
+                if self.watermark is None:
+                    logger.info("Leading the scheduler")
+                try:
+                    delay = self.tick()
+                except DBAPIError:
+                    logger.exception("Scheduler tick failed")
+                    delay = self.poll_seconds
+                stop.wait(delay)
+        finally:
+            lock.release()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO)
+
+    from app.db import engine
+    from app.db.migrations import verify_schema
+
+    verify_schema(engine)
+    stop = threading.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, lambda *_: stop.set())
+    Scheduler(engine).run(stop)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,122 @@
 """Community workflow task definitions."""
 
-import logging
 import asyncio
+import logging
+import threading
+import time
+from collections.abc import Coroutine
 from datetime import datetime
+from pathlib import Path
+from typing import Any
 
+from celery import group
+from celery.exceptions import Retry
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.core import metrics as prometheus
+from app.core import tracing
+from app.core.config import settings
+from app.db import engine, get_session
+from app.db.models import Job, JobArtifact, JobStatus, Pipeline, ReplicationMode
+from app.db.partitions import enforce_retention
+from app.services.workflows.concurrency import claim_job, finish_job, recover_stale_jobs
+from app.services.workflows.dataplane import JobMetrics, stream_records
+from app.services.workflows.lanes import LANES, fair_share_priorities
+from app.services.workflows.profiling import ProfileResult, profile_run
 from app.services.workflows.worker import celery_app
-from app.db import get_session
-from app.db.models import Job, JobStatus, Pipeline
 
 logger = logging.getLogger(__name__)
 
 
+class JobCancelled(Exception):
+    """Raised in a running job once it has been cancelled, e.g. by a newer run."""
+
+
+def _heartbeat(job_id: int) -> bool:
+    """Record that the job's worker is alive; returns whether the job was cancelled."""
+
+    with Session(engine) as session:
+        session.exec(
+            update(Job)
+            .where(Job.id == job_id, Job.status == JobStatus.RUNNING)
+            .values(heartbeat_at=datetime.utcnow())
+        )
+        session.commit()
+        return (
+            session.exec(select(Job.status).where(Job.id == job_id)).first() == JobStatus.CANCELLED
+        )
+
+
+def _run_until_cancelled(job_id: int, work: Coroutine[Any, Any, Any]) -> Any:
+    """Run ``work``, heartbeating and checking for cancellation every ``job_cancel_poll_seconds``.
+
+    The heartbeat runs in its own thread, so a connector blocking the event loop does not
+    make its job look like one whose worker died.
+    """
+
+    stopped = threading.Event()
+    cancelled = threading.Event()
+
+    async def watch() -> Any:
+        loop = asyncio.get_running_loop()
+        task = asyncio.ensure_future(work)
+
+        def heartbeat() -> None:
+            while not stopped.wait(settings.job_cancel_poll_seconds):
+                try:
+                    if _heartbeat(job_id):
+                        cancelled.set()
+                        loop.call_soon_threadsafe(task.cancel)
+                        return
+                except Exception:
+                    logger.exception(f"Could not heartbeat job {job_id}")
+
+        thread = threading.Thread(target=heartbeat, name=f"job-{job_id}-heartbeat", daemon=True)
+        thread.start()
+        try:
+            return await task
+        except asyncio.CancelledError:
+            if cancelled.is_set():
+                raise JobCancelled(f"Job {job_id} was cancelled") from None
+            raise
+        finally:
+            stopped.set()
+            thread.join()
+
+    return asyncio.run(watch())
+
+
+def _source_config(pipeline: Pipeline) -> dict[str, Any]:
+    """Return the source configuration with per-pipeline runtime defaults applied."""
+
+    from app.services.connectors import registry
+
+    config = dict(pipeline.source_config)
+    properties = registry.definition(pipeline.source_connector).config_schema.get("properties", {})
+
+    # Incremental object storage pipelines only ingest files missing from their manifest.
+    if "manifest_path" in properties and pipeline.replication_mode != ReplicationMode.FULL_TABLE:
+        config.setdefault(
+            "manifest_path", str(Path(settings.manifest_dir) / f"pipeline-{pipeline.id}.json")
+        )
+    return config
+
+
+def _destination_config(pipeline: Pipeline) -> dict[str, Any]:
+    """Return the destination configuration with per-pipeline runtime defaults applied."""
+
+    from app.services.connectors import registry
+
+    config = dict(pipeline.destination_config)
+    properties = registry.definition(pipeline.destination_connector).config_schema.get(
+        "properties", {}
+    )
+    if "batch_size" in properties:
+        config.setdefault("batch_size", pipeline.batch_size)
+    return config
+
+
 @celery_app.task(name="app.services.workflows.tasks.refresh_connector")
 def refresh_connector(connector_id: str) -> str:
     """Placeholder task for refreshing connector metadata."""
@@ -18,10 +124,89 @@ def refresh_connector(connector_id: str) -> str:
     return f"refreshed:{connector_id}"
 
 
+@celery_app.task(name="app.services.workflows.tasks.enforce_job_retention")
+def enforce_job_retention_task() -> dict:
+    """Remove jobs past the retention period and create upcoming job partitions."""
+
+    return enforce_retention(engine)
+
+
+@celery_app.task(name="app.services.workflows.tasks.recover_stale_jobs")
+def recover_stale_jobs_task() -> dict:
+    """Enqueue again the jobs whose worker died or whose message was lost."""
+
+    with Session(engine, expire_on_commit=False) as session:
+        jobs = recover_stale_jobs(session)
+        session.commit()
+    enqueue_runs(jobs)
+    return {"job_ids": [job.id for job in jobs]}
+
+
 @celery_app.task(name="app.services.workflows.tasks.run_pipeline")
-def run_pipeline_task(job_id: int) -> dict:
-    """Execute a pipeline job."""
+def run_pipeline_task(job_id: int, profile: bool = False, host_waits: int = 0) -> dict:
+    """Execute a pipeline job, optionally profiling it.
+
+    ``host_waits`` counts the earlier attempts that found the job's source host full.
+    """
+
+    with tracing.span("pipeline.job", **{"openfuse.job.id": job_id}) as job_span:
+        if profile:
+            retrying = False
+            try:
+                with profile_run() as profile_result:
+                    result = _run_pipeline(job_id, host_waits)
+            except Retry:
+                # The job has not run yet; its next attempt is profiled instead.
+                retrying = True
+                raise
+            finally:
+                # Failed and aborted runs are the ones worth profiling, so they keep theirs too.
+                if not retrying:
+                    _save_profile(job_id, profile_result)
+        else:
+            result = _run_pipeline(job_id, host_waits)
+        job_span.set_attribute("openfuse.job.status", result["status"])
+        return result
+
+
+def run_options(jobs: list[Job]) -> dict[int, dict[str, Any]]:
+    """Return the queue (lane) and fair share priority to publish each job with."""
+
+    with engine.connect() as connection:
+        priorities = fair_share_priorities(connection, {job.pipeline_id for job in jobs})
+    return {
+        job.id: {"queue": LANES[job.job_class], "priority": priorities.get(job.pipeline_id, 0)}
+        for job in jobs
+    }
+
+
+def enqueue_runs(jobs: list[Job], profile: bool = False) -> None:
+    """Publish run messages for many jobs through a single broker connection."""
+
+    if jobs:
+        options = run_options(jobs)
+        group(
+            run_pipeline_task.si(job.id, profile=profile).set(**options[job.id]) for job in jobs
+        ).apply_async()
+
+
+def _save_profile(job_id: int, profile_result: ProfileResult) -> None:
+    """Attach profiling output to the job as artifacts."""
 
+    session = next(get_session())
+    try:
+        if not session.get(Job, job_id):
+            return
+        for name, content_type, content in profile_result.artifacts():
+            session.add(
+                JobArtifact(job_id=job_id, name=name, content_type=content_type, content=content)
+            )
+        session.commit()
+    finally:
+        session.close()
+
+
+def _run_pipeline(job_id: int, host_waits: int = 0) -> dict:
     session = next(get_session())
 
     try:
@@ -39,38 +224,104 @@ def run_pipeline_task(job_id: int) -> dict:
             session.commit()
             return {"status": "failed", "message": "Pipeline not found", "job_id": job_id}
 
-        job.status = JobStatus.RUNNING
-        job.started_at = datetime.utcnow()
-        session.commit()
+        if not claim_job(session, job):
+            if job.status == JobStatus.PENDING:
+                # The source host is running as many jobs as it may; try again later.
+                raise run_pipeline_task.retry(
+                    kwargs={
+                        **(run_pipeline_task.request.kwargs or {}),
+                        "host_waits": host_waits + 1,
+                    },
+                    countdown=settings.job_host_retry_seconds,
+                    max_retries=None,
+                )
+            if job.status == JobStatus.RUNNING:
+                # Redelivered while the job looks alive, e.g. right after its worker died.
+                # Check again once a live worker would have heartbeated.
+                raise run_pipeline_task.retry(
+                    countdown=settings.job_heartbeat_timeout_seconds, max_retries=None
+                )
+            # Finished or cancelled.
+            return {"status": job.status.value, "message": "Job is not pending", "job_id": job_id}
 
+        metrics = JobMetrics(host_waits=host_waits)
         try:
             from app.services.connectors import registry
 
-            source = registry.create(pipeline.source_connector, **pipeline.source_config)
+            source = registry.create(pipeline.source_connector, **_source_config(pipeline))
             destination = registry.create(
-                pipeline.destination_connector, **pipeline.destination_config
+                pipeline.destination_connector, **_destination_config(pipeline)
             )
 
-            source_result = asyncio.run(source.run()) or {}
-            destination_result = asyncio.run(destination.run()) or {}
+            if source.supports("read") and destination.supports("write"):
+                # Stream record batches into the destination loader through a bounded buffer.
+                budget_mb = pipeline.memory_budget_mb or settings.job_memory_budget_mb
+                destination_result = _run_until_cancelled(
+                    job_id,
+                    stream_records(
+                        source,
+                        destination,
+                        budget_mb * 1024 * 1024,
+                        spill_dir=settings.job_spill_dir,
+                        spill_max_bytes=settings.job_spill_max_mb * 1024 * 1024,
+                        metrics=metrics,
+                    ),
+                )
+                rows_synced = destination_result.get("rows_loaded") or 0
+            else:
+                started = time.perf_counter()
+                with tracing.span("source.run", **{"openfuse.connector": source.name}):
+                    source_result = _run_until_cancelled(job_id, source.run()) or {}
+                metrics.source_read_seconds = time.perf_counter() - started
+                with tracing.span("destination.run", **{"openfuse.connector": destination.name}):
+                    destination_result = _run_until_cancelled(job_id, destination.run()) or {}
+                metrics.elapsed_seconds = time.perf_counter() - started
+                metrics.destination_write_seconds = (
+                    metrics.elapsed_seconds - metrics.source_read_seconds
+                )
 
-            rows_synced = (
-                source_result.get("rows_extracted")
-                or destination_result.get("rows_loaded")
-                or 0
-            )
+                rows_synced = (
+                    source_result.get("rows_extracted")
+                    or destination_result.get("rows_loaded")
+                    or 0
+                )
+                metrics.rows_read = int(source_result.get("rows_extracted") or 0)
+                metrics.rows_written = int(destination_result.get("rows_loaded") or 0)
 
-            job.status = JobStatus.COMPLETED
-            job.completed_at = datetime.utcnow()
-            job.rows_synced = int(rows_synced)
-            job.error_message = None
+            outcome = {
+                "status": JobStatus.COMPLETED,
+                "rows_synced": int(rows_synced),
+                "error_message": None,
+            }
+        except JobCancelled:
+            # The job is already marked cancelled; only its metrics are recorded.
+            logger.info(f"Job {job_id} of pipeline {pipeline.id} was cancelled")
+            outcome = {}
         except Exception as exc:
             logger.exception(f"Pipeline {pipeline.id} failed")
-            job.status = JobStatus.FAILED
-            job.completed_at = datetime.utcnow()
-            job.error_message = str(exc)
+            outcome = {"status": JobStatus.FAILED, "error_message": str(exc)}
 
-        session.commit()
+        promoted = finish_job(
+            session, job, completed_at=datetime.utcnow(), metrics=metrics.to_dict(), **outcome
+        )
+        if job.status == JobStatus.COMPLETED and source.supports("checkpoint"):
+            try:
+                source.checkpoint()
+            except Exception:
+                # The loaded files are read again by the next run rather than skipped.
+                logger.exception(f"Could not save the progress of job {job_id}")
+        if promoted is not None:
+            try:
+                enqueue_runs([promoted])
+            except Exception:
+                # Like runs started through the API, the job stays pending without a broker.
+                logger.exception(f"Could not enqueue queued job {promoted.id}")
+        prometheus.observe_job(
+            pipeline.source_connector,
+            pipeline.destination_connector,
+            job.status.value,
+            job.metrics,
+        )
 
         return {
             "status": job.status.value,
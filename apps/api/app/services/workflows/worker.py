@@ -1,8 +1,14 @@
 """Celery app configuration for background workflows."""
 
+import os
+
 from celery import Celery
+from celery.signals import worker_init, worker_process_shutdown, worker_ready
+from kombu import Queue
 
+from app.core import metrics, tracing
 from app.core.config import settings
+from app.services.workflows.lanes import MAINTENANCE_QUEUE, PRIORITY_LEVELS, QUEUES
 
 celery_app = Celery(
     "openfuse-worker",
@@ -10,10 +16,59 @@ celery_app = Celery(
     backend=settings.redis_url,
 )
 
-celery_app.conf.task_routes = {
-    "app.services.workflows.tasks.*": {"queue": "workflows"}
+# Pipeline runs are published to the lane of their job class (see lanes.py); everything
+# else goes to the maintenance queue. Workers started without -Q consume every lane,
+# always taking from the most urgent non-empty one.
+celery_app.conf.task_queues = [Queue(name) for name in QUEUES]
+celery_app.conf.task_default_queue = MAINTENANCE_QUEUE
+celery_app.conf.task_routes = {"app.services.workflows.tasks.*": {"queue": MAINTENANCE_QUEUE}}
+celery_app.conf.broker_transport_options = {
+    "queue_order_strategy": "priority",
+    "priority_steps": list(range(PRIORITY_LEVELS)),
+    "sep": ":",
+    "visibility_timeout": settings.worker_visibility_timeout_seconds,
+}
+# Jobs run for minutes to hours: reserve one message at a time so a busy worker does not
+# hold short jobs that an idle worker could start, and acknowledge only once a job ends
+# so a worker that dies returns its job to the queue. The redelivered message runs the
+# job again once its heartbeat lapses, while a duplicate of a live job does not run it
+# twice (see concurrency.claim_job).
+celery_app.conf.worker_prefetch_multiplier = 1
+celery_app.conf.task_acks_late = True
+celery_app.conf.task_reject_on_worker_lost = True
+
+celery_app.conf.beat_schedule = {
+    "enforce-job-retention": {
+        "task": "app.services.workflows.tasks.enforce_job_retention",
+        "schedule": 24 * 60 * 60,
+    },
+    "recover-stale-jobs": {
+        "task": "app.services.workflows.tasks.recover_stale_jobs",
+        "schedule": settings.job_heartbeat_timeout_seconds,
+    },
 }
 
+tracing.instrument_celery(celery_app)
+
+
+@worker_init.connect
+def configure_worker_tracing(**_: object) -> None:
+    # Span processors restart their export threads in forked pool processes.
+    tracing.configure_tracing("openfuse-worker")
+
+
+@worker_ready.connect
+def start_metrics_exporter(**_: object) -> None:
+    """Expose worker metrics, including the depth of the queues this worker consumes."""
+
+    metrics.register_collector(metrics.QueueDepthCollector(celery_app, QUEUES))
+    metrics.start_exporter(settings.worker_metrics_port)
+
+
+@worker_process_shutdown.connect
+def release_process_metrics(pid: int | None = None, **_: object) -> None:
+    metrics.mark_process_dead(pid or os.getpid())
+
 
 @celery_app.task(name="app.services.workflows.tasks.example")
 def example_task(name: str) -> str:
@@ -0,0 +1,11 @@
+"""Synthetic throughput benchmarks for connectors and the data plane.
+
+Run ``python -m benchmarks --help`` from ``apps/api``. Each case runs in a fresh
+process against local stand-ins and reports rows/sec, MB/sec, peak RSS and batch
+latency percentiles as JSON that can be compared across commits.
+"""
+
+import os
+
+# The workflow package opens the metadata database on import; benchmarks never touch it.
+os.environ.setdefault("OPENFUSE_DATABASE_URL", "sqlite://")
@@ -0,0 +1,85 @@
+"""Command-line entry point: ``python -m benchmarks [cases] [options]``."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from dataclasses import asdict, fields
+
+from benchmarks.cases import CASES, Options
+from benchmarks.harness import compare, environment, run_cases
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    defaults = Options()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Measure connector and data plane throughput against local stand-ins.",
+    )
+    parser.add_argument("cases", nargs="*", help=f"any of {', '.join(CASES)} (default: all)")
+    parser.add_argument("--rows", type=int, default=defaults.rows)
+    parser.add_argument("--width", type=int, default=defaults.width, help="columns per row")
+    parser.add_argument("--batch-size", type=int, default=defaults.batch_size)
+    parser.add_argument("--memory-budget-mb", type=int, default=defaults.memory_budget_mb)
+    parser.add_argument(
+        "--workdir", default=defaults.workdir, help="where generated files are cached"
+    )
+    parser.add_argument("--postgres-url", help="postgresql:// URL of a scratch database")
+    parser.add_argument(
+        "--s3-endpoint", help="S3-compatible endpoint, e.g. http://localhost:9000 for MinIO"
+    )
+    parser.add_argument("--s3-bucket", default=defaults.s3_bucket)
+    parser.add_argument("--s3-access-key-id", default=defaults.s3_access_key_id)
+    parser.add_argument("--s3-secret-access-key", default=defaults.s3_secret_access_key)
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="runs per case; the median is reported"
+    )
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    parser.add_argument("--compare", help="previous JSON results to compare rows/sec against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        help="exit non-zero when rows/sec drops by more than this fraction versus --compare",
+    )
+    args = parser.parse_args(argv)
+    unknown = sorted(set(args.cases) - set(CASES))
+    if unknown:
+        parser.error(f"unknown cases: {', '.join(unknown)}")
+    return args
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    options = Options(**{f.name: getattr(args, f.name) for f in fields(Options)})
+
+    results = [
+        asdict(result) for result in run_cases(args.cases or list(CASES), options, args.repeat)
+    ]
+    report = {"environment": environment(), "options": asdict(options), "results": results}
+
+    regressions = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            report["comparison"] = compare(results, json.load(handle)["results"])
+        if args.max_regression is not None:
+            regressions = [c for c in report["comparison"] if c["change"] < -args.max_regression]
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        print(payload)
+
+    for regression in regressions:
+        print(
+            f"{regression['name']}: {regression['change']:.1%} rows/sec versus baseline",
+            file=sys.stderr,
+        )
+    failed = [result["name"] for result in results if result["status"] == "failed"]
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
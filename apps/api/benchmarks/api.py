@@ -0,0 +1,345 @@
+"""Latency benchmarks for the API's hot endpoints with regression gates.
+
+``python -m benchmarks.api`` seeds a database with synthetic pipelines and jobs,
+times the pipeline, job and connector endpoints in-process and reports p50/p99
+latency and database queries per request. With ``--compare`` it exits non-zero
+when a result is slower than the baseline by more than ``--max-regression`` or
+issues more queries per request.
+
+Seeding 100k pipelines and 10M jobs takes minutes; point ``--database-url`` at a
+persistent database to seed once and reuse it across runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import Any
+
+#: Share of all jobs that belong to pipeline 1, the "busy" pipeline.
+HOT_PIPELINE_SHARE = 0.1
+#: Rows inserted per statement when no set-based seeding is available.
+SEED_CHUNK = 50_000
+
+
+@dataclass
+class EndpointResult:
+    name: str
+    requests: int
+    p50_ms: float
+    p99_ms: float
+    queries_per_request: float
+
+
+def seed(engine: Any, pipelines: int, jobs: int) -> None:
+    """Insert synthetic pipelines and jobs unless the database already holds them."""
+
+    from app.db.migrations import verify_schema
+    from app.db.models import Job, JobStatus, Pipeline, PipelineStatus, ReplicationMode
+    from sqlalchemy import func, select, text
+
+    verify_schema(engine, migrate=True)
+    with engine.begin() as connection:
+        have_pipelines = connection.execute(select(func.count()).select_from(Pipeline)).scalar()
+        have_jobs = connection.execute(select(func.count()).select_from(Job)).scalar()
+        if (have_pipelines, have_jobs) == (pipelines, jobs):
+            return
+        connection.execute(Job.__table__.delete())
+        connection.execute(Pipeline.__table__.delete())
+
+        hot_jobs = int(jobs * HOT_PIPELINE_SHARE)
+        values = {
+            "active": PipelineStatus.ACTIVE.name,
+            "full_table": ReplicationMode.FULL_TABLE.name,
+            "completed": JobStatus.COMPLETED.name,
+            "pipelines": pipelines,
+            "jobs": jobs,
+            "hot_jobs": hot_jobs,
+        }
+        dialect = engine.dialect.name
+        if dialect == "sqlite":
+            series = "WITH RECURSIVE seq(n) AS (SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < {count}) "
+            timestamp = "datetime('2024-01-01', '+' || n || ' seconds')"
+            source = "seq"
+        elif dialect == "postgresql":
+            series = ""
+            timestamp = "timestamp '2024-01-01' + n * interval '1 second'"
+            source = "generate_series(1, {count}) AS seq(n)"
+        else:
+            _seed_rows(connection, pipelines, jobs, hot_jobs)
+            return
+
+        connection.execute(
+            text(
+                series.format(count=":pipelines")
+                + "INSERT INTO pipelines (id, name, source_connector, destination_connector, status, "
+                "replication_mode, batch_size, source_config, destination_config, created_at, updated_at) "
+                f"SELECT n, 'pipeline-' || n, 'postgres', 'snowflake', :active, :full_table, 10000, "
+                f"'{{}}', '{{}}', {timestamp}, {timestamp} FROM {source.format(count=':pipelines')}"
+            ),
+            values,
+        )
+        connection.execute(
+            text(
+                series.format(count=":jobs")
+                + "INSERT INTO jobs (id, pipeline_id, status, rows_synced, created_at) "
+                f"SELECT n, CASE WHEN n <= :hot_jobs THEN 1 ELSE n % :pipelines + 1 END, "
+                f":completed, n % 1000, {timestamp} FROM {source.format(count=':jobs')}"
+            ),
+            values,
+        )
+        if dialect == "postgresql":
+            for table in ("pipelines", "jobs"):
+                connection.execute(
+                    text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), :last)"),
+                    {"last": pipelines if table == "pipelines" else jobs},
+                )
+                connection.execute(text(f"ANALYZE {table}"))
+
+
+def _seed_rows(connection: Any, pipelines: int, jobs: int, hot_jobs: int) -> None:
+    from app.db.models import Job, JobStatus, Pipeline, PipelineStatus
+
+    start = datetime(2024, 1, 1)
+    for first in range(1, pipelines + 1, SEED_CHUNK):
+        connection.execute(
+            Pipeline.__table__.insert(),
+            [
+                {
+                    "id": n,
+                    "name": f"pipeline-{n}",
+                    "source_connector": "postgres",
+                    "destination_connector": "snowflake",
+                    "status": PipelineStatus.ACTIVE,
+                    "batch_size": 10000,
+                    "source_config": {},
+                    "destination_config": {},
+                    "created_at": start + timedelta(seconds=n),
+                    "updated_at": start + timedelta(seconds=n),
+                }
+                for n in range(first, min(first + SEED_CHUNK, pipelines + 1))
+            ],
+        )
+    for first in range(1, jobs + 1, SEED_CHUNK):
+        connection.execute(
+            Job.__table__.insert(),
+            [
+                {
+                    "id": n,
+                    "pipeline_id": 1 if n <= hot_jobs else n % pipelines + 1,
+                    "status": JobStatus.COMPLETED,
+                    "rows_synced": n % 1000,
+                    "created_at": start + timedelta(seconds=n),
+                }
+                for n in range(first, min(first + SEED_CHUNK, jobs + 1))
+            ],
+        )
+
+
+def endpoints(pipelines: int) -> dict[str, tuple[str, str, dict[str, Any] | None]]:
+    """Return the requests to time, keyed by result name."""
+
+    from types import SimpleNamespace
+
+    from app.api.v1.pagination import encode_cursor
+
+    # The seed gives row ``n`` a created_at of 2024-01-01 plus ``n`` seconds, so the cursor
+    # of the last full page is known without querying.
+    last = min(51, pipelines)
+    deep = encode_cursor(
+        SimpleNamespace(id=last, created_at=datetime(2024, 1, 1) + timedelta(seconds=last))
+    )
+    batch_pipeline = {
+        "name": "Batch",
+        "source_connector": "example",
+        "source_config": {"endpoint": "https://api.example.com"},
+        "destination_connector": "postgres_destination",
+        "destination_config": {
+            "host": "db",
+            "database": "openfuse",
+            "username": "openfuse",
+            "password": "pw",
+        },
+    }
+    return {
+        "list_pipelines": ("GET", "/api/v1/pipelines?limit=50", None),
+        "list_pipelines_deep": ("GET", f"/api/v1/pipelines?cursor={deep}&limit=50", None),
+        "list_jobs": ("GET", "/api/v1/jobs?limit=50", None),
+        "list_jobs_by_status": ("GET", "/api/v1/jobs?status_filter=completed&limit=50", None),
+        "list_pipeline_jobs": ("GET", "/api/v1/pipelines/1/jobs?limit=20", None),
+        "list_connectors": ("GET", "/api/v1/connectors", None),
+        "run_pipeline": ("POST", "/api/v1/pipelines/2/run", None),
+        "create_pipelines_batch": (
+            "POST",
+            "/api/v1/pipelines:batch",
+            {"pipelines": [batch_pipeline] * 100},
+        ),
+        "run_pipelines_batch": (
+            "POST",
+            "/api/v1/pipelines:batch/run",
+            {"pipeline_ids": list(range(2, min(102, pipelines + 1)))},
+        ),
+    }
+
+
+def measure(
+    pipelines: int,
+    jobs: int,
+    iterations: int = 200,
+    warmup: int = 20,
+    names: list[str] | None = None,
+) -> list[EndpointResult]:
+    """Seed the configured database and time each endpoint in-process."""
+
+    from app.db import async_engine, engine
+    from app.db.models import Job, Pipeline
+    from app.main import app
+    from app.services.workflows import tasks
+    from app.services.workflows.tasks import run_pipeline_task
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    from benchmarks.harness import percentile
+
+    seed(engine, pipelines, jobs)
+
+    queries = 0
+
+    def count_query(*_: Any) -> None:
+        nonlocal queries
+        queries += 1
+
+    # Jobs queued by run_pipeline stay pending instead of reaching a broker.
+    delay = run_pipeline_task.delay
+    run_pipeline_task.delay = lambda *args, **kwargs: None
+    enqueue_runs, tasks.enqueue_runs = tasks.enqueue_runs, lambda *args, **kwargs: None
+    # Endpoints query through the async engine; count the sync one too in case any still use it.
+    engines = [engine, async_engine.sync_engine]
+    for counted in engines:
+        event.listen(counted, "before_cursor_execute", count_query)
+    results = []
+    try:
+        with TestClient(app) as client:
+            for name, (method, path, body) in endpoints(pipelines).items():
+                if names and name not in names:
+                    continue
+                for _ in range(warmup):
+                    client.request(method, path, json=body).raise_for_status()
+                latencies = []
+                queries = 0
+                for _ in range(iterations):
+                    started = time.perf_counter()
+                    client.request(method, path, json=body).raise_for_status()
+                    latencies.append(time.perf_counter() - started)
+                results.append(
+                    EndpointResult(
+                        name=name,
+                        requests=iterations,
+                        p50_ms=round(percentile(latencies, 0.50) * 1000, 3),
+                        p99_ms=round(percentile(latencies, 0.99) * 1000, 3),
+                        queries_per_request=round(queries / iterations, 2),
+                    )
+                )
+    finally:
+        for counted in engines:
+            event.remove(counted, "before_cursor_execute", count_query)
+        run_pipeline_task.delay, tasks.enqueue_runs = delay, enqueue_runs
+        # Drop the jobs and pipelines the requests created so the next run can reuse the seed.
+        with engine.begin() as connection:
+            connection.execute(Job.__table__.delete().where(Job.id > jobs))
+            connection.execute(Pipeline.__table__.delete().where(Pipeline.id > pipelines))
+    return results
+
+
+def regressions(
+    current: list[dict[str, Any]], baseline: list[dict[str, Any]], max_regression: float
+) -> list[str]:
+    """Describe every endpoint that got slower than allowed or issues more queries."""
+
+    previous = {result["name"]: result for result in baseline}
+    failures = []
+    for result in current:
+        before = previous.get(result["name"])
+        if before is None:
+            continue
+        for metric in ("p50_ms", "p99_ms"):
+            limit = before[metric] * (1 + max_regression)
+            if result[metric] > limit:
+                failures.append(
+                    f"{result['name']}: {metric} {result[metric]} exceeds {limit:.3f} "
+                    f"(baseline {before[metric]} + {max_regression:.0%})"
+                )
+        if result["queries_per_request"] > before["queries_per_request"]:
+            failures.append(
+                f"{result['name']}: {result['queries_per_request']} queries per request "
+                f"(baseline {before['queries_per_request']})"
+            )
+    return failures
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.api", description=__doc__.splitlines()[0]
+    )
+    parser.add_argument("endpoints", nargs="*", help="endpoints to time (default: all)")
+    parser.add_argument(
+        "--database-url", help="database to seed and query (default: a local SQLite file)"
+    )
+    parser.add_argument("--pipelines", type=int, default=100_000)
+    parser.add_argument("--jobs", type=int, default=10_000_000)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--output", help="write JSON results to this file instead of stdout")
+    parser.add_argument("--compare", help="previous JSON results to gate against")
+    parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=0.2,
+        help="allowed latency increase as a fraction of the baseline (default: 0.2)",
+    )
+    args = parser.parse_args(argv)
+
+    # Must happen before anything imports ``app.db``, which opens the engine on import.
+    os.environ["OPENFUSE_DATABASE_URL"] = (
+        args.database_url or "sqlite:///.openfuse/api-benchmark.db"
+    )
+    os.makedirs(".openfuse", exist_ok=True)
+
+    from benchmarks.harness import environment
+
+    results = [
+        asdict(result)
+        for result in measure(
+            args.pipelines, args.jobs, args.iterations, args.warmup, args.endpoints
+        )
+    ]
+    report = {
+        "environment": environment(),
+        "seed": {"pipelines": args.pipelines, "jobs": args.jobs},
+        "results": results,
+    }
+
+    failures = []
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            failures = regressions(results, json.load(handle)["results"], args.max_regression)
+        report["regressions"] = failures
+
+    payload = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            handle.write(payload + "\n")
+    else:
+        print(payload)
+    for failure in failures:
+        print(failure, file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
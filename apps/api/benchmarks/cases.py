@@ -0,0 +1,383 @@
+"""Benchmark cases.
+
+Each case prepares its inputs in ``setup`` (not measured) and moves the data in
+``run``, returning the bytes moved and the latency of every batch or page.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from benchmarks.synthetic import (
+    NullDestination,
+    SyntheticSource,
+    column_names,
+    iter_batches,
+    make_rows,
+)
+
+
+class SkipCase(Exception):
+    """Raised when a case's stand-in or optional dependency is unavailable."""
+
+
+@dataclass
+class Options:
+    rows: int = 100_000
+    width: int = 20
+    batch_size: int = 10_000
+    memory_budget_mb: int = 256
+    workdir: str = ".openfuse/benchmarks"
+    postgres_url: str | None = None
+    s3_endpoint: str | None = None
+    s3_bucket: str = "openfuse-benchmarks"
+    s3_access_key_id: str = "minioadmin"
+    s3_secret_access_key: str = "minioadmin"
+
+
+@dataclass
+class Outcome:
+    rows: int
+    bytes: int
+    batch_latencies: list[float] = field(default_factory=list)
+
+
+class Case:
+    """Base class of benchmark cases; ``setup`` and ``teardown`` are optional hooks."""
+
+    name: str = ""
+
+    def __init__(self, options: Options) -> None:
+        self.options = options
+
+    async def setup(self) -> None:
+        """Prepare the case's inputs; not measured."""
+
+    async def run(self) -> Outcome:
+        """Move the case's data and report what was moved."""
+
+        raise NotImplementedError(f"Benchmark case '{self.name}' does not run")
+
+    async def teardown(self) -> None:
+        """Release what ``setup`` acquired."""
+
+
+CASES: dict[str, Callable[[Options], Case]] = {}
+
+
+def case(cls: type[Case]) -> type[Case]:
+    CASES[cls.name] = cls
+    return cls
+
+
+@case
+class DataPlaneCase(Case):
+    """Generated records streamed through the bounded batch queue into a null destination."""
+
+    name = "dataplane"
+    spill = False
+
+    async def setup(self) -> None:
+        self.batch = make_rows(0, self.options.batch_size, self.options.width)
+
+    async def run(self) -> Outcome:
+        from app.services.workflows.dataplane import JobMetrics, stream_records
+
+        source = SyntheticSource(rows=self.options.rows, batch=self.batch)
+        destination = NullDestination()
+        metrics = JobMetrics()
+        await stream_records(
+            source,
+            destination,
+            (1 if self.spill else self.options.memory_budget_mb) * 1024 * 1024,
+            spill_dir=os.path.join(self.options.workdir, "spill") if self.spill else None,
+            spill_max_bytes=1 << 40 if self.spill else 0,
+            metrics=metrics,
+        )
+        return Outcome(metrics.rows_written, metrics.bytes_written, destination.batch_latencies)
+
+
+@case
+class DataPlaneSpillCase(DataPlaneCase):
+    """As ``dataplane`` with a 1 MB budget, so batches overflow to Arrow spill files."""
+
+    name = "dataplane_spill"
+    spill = True
+
+
+class FileCase(Case, ABC):
+    """Decode a generated local file with the object storage readers."""
+
+    file_format = ""
+    suffix = ""
+
+    @property
+    def path(self) -> str:
+        return os.path.join(
+            self.options.workdir, f"{self.options.rows}x{self.options.width}{self.suffix}"
+        )
+
+    async def setup(self) -> None:
+        os.makedirs(self.options.workdir, exist_ok=True)
+        if not os.path.exists(self.path):
+            self.write(self.path)
+
+    @abstractmethod
+    def write(self, path: str) -> None:
+        """Generate the input file at ``path``."""
+
+    async def run(self) -> Outcome:
+        from app.services.connectors.storage import iter_file_batches
+
+        rows = 0
+        latencies = []
+        last = time.perf_counter()
+        for batch in iter_file_batches(self.path, self.file_format, self.options.batch_size, ","):
+            now = time.perf_counter()
+            latencies.append(now - last)
+            last = now
+            rows += len(batch)
+        return Outcome(rows, os.path.getsize(self.path), latencies)
+
+    def batches(self):
+        return iter_batches(self.options.rows, self.options.width, self.options.batch_size)
+
+
+@case
+class CsvFileCase(FileCase):
+    name = "file_csv"
+    file_format = "csv"
+    suffix = ".csv"
+
+    def write(self, path: str) -> None:
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            writer = csv.DictWriter(handle, fieldnames=column_names(self.options.width))
+            writer.writeheader()
+            for batch in self.batches():
+                writer.writerows(batch)
+
+
+@case
+class JsonLinesFileCase(FileCase):
+    name = "file_jsonl"
+    file_format = "json"
+    suffix = ".jsonl"
+
+    def write(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as handle:
+            for batch in self.batches():
+                handle.writelines(json.dumps(record) + "\n" for record in batch)
+
+
+@case
+class ParquetFileCase(FileCase):
+    name = "file_parquet"
+    file_format = "parquet"
+    suffix = ".parquet"
+
+    async def setup(self) -> None:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError as exc:
+            raise SkipCase("pyarrow is not installed") from exc
+        await super().setup()
+
+    def write(self, path: str) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        writer = None
+        for batch in self.batches():
+            table = pa.Table.from_pylist(batch)
+            writer = writer or pq.ParquetWriter(path, table.schema)
+            writer.write_table(table)
+        if writer is not None:
+            writer.close()
+
+
+class HttpCase(Case):
+    """Run a REST API source connector against the local fake API."""
+
+    connector = ""
+    config: dict[str, Any] = {}
+
+    async def setup(self) -> None:
+        from benchmarks.fakeapi import FakeAPIServer, route_connectors_to
+
+        self.server = FakeAPIServer(self.options.rows, self.options.width).__enter__()
+        route_connectors_to(self.server.port)
+
+    async def run(self) -> Outcome:
+        from app.services.connectors import registry
+
+        from benchmarks.fakeapi import LocalTransport
+
+        result = await registry.create(self.connector, **self.config).run()
+        return Outcome(
+            result["rows_extracted"], LocalTransport.bytes_received, LocalTransport.latencies
+        )
+
+    async def teardown(self) -> None:
+        self.server.__exit__(None, None, None)
+
+
+@case
+class GitHubCase(HttpCase):
+    name = "http_github"
+    connector = "github"
+    config = {"token": "bench", "owner": "openfuse", "repo": "bench", "objects": ["issues"]}
+
+
+@case
+class HubSpotCase(HttpCase):
+    name = "http_hubspot"
+    connector = "hubspot"
+    config = {"api_key": "bench", "objects": ["contacts"]}
+
+
+@case
+class ZendeskCase(HttpCase):
+    name = "http_zendesk"
+    connector = "zendesk"
+    config = {
+        "subdomain": "bench",
+        "email": "bench@example.com",
+        "api_token": "bench",
+        "objects": ["tickets"],
+    }
+
+
+@case
+class PostgresCase(Case):
+    """Extract a seeded table through the Postgres source (needs ``--postgres-url``)."""
+
+    name = "postgres"
+    table = "openfuse_benchmark"
+
+    async def setup(self) -> None:
+        if not self.options.postgres_url:
+            raise SkipCase("--postgres-url was not given")
+        try:
+            import asyncpg
+        except ImportError as exc:
+            raise SkipCase("asyncpg is not installed") from exc
+
+        columns = column_names(self.options.width)
+        connection = await asyncpg.connect(self.options.postgres_url)
+        try:
+            await connection.execute(f"DROP TABLE IF EXISTS {self.table}")
+            await connection.execute(
+                f"CREATE TABLE {self.table} (id bigint PRIMARY KEY, "
+                + ", ".join(f"{name} text" for name in columns[1:])
+                + ")"
+            )
+            for batch in iter_batches(
+                self.options.rows, self.options.width, self.options.batch_size
+            ):
+                await connection.copy_records_to_table(
+                    self.table,
+                    records=[
+                        (row["id"], *(str(row[name]) for name in columns[1:])) for row in batch
+                    ],
+                    columns=columns,
+                )
+            self.table_bytes = await connection.fetchval("SELECT pg_relation_size($1)", self.table)
+        finally:
+            await connection.close()
+
+    async def run(self) -> Outcome:
+        from urllib.parse import urlsplit
+
+        from app.services.connectors import registry
+
+        url = urlsplit(self.options.postgres_url)
+        connector = registry.create(
+            "postgres",
+            host=url.hostname,
+            port=url.port or 5432,
+            database=url.path.lstrip("/"),
+            username=url.username,
+            password=url.password or "",
+            tables=[self.table],
+        )
+        result = await connector.run()
+        return Outcome(result["rows_extracted"], self.table_bytes)
+
+
+@case
+class S3Case(Case):
+    """Read generated CSV objects through the S3 source from an S3-compatible endpoint
+    such as MinIO (needs ``--s3-endpoint``)."""
+
+    name = "s3"
+    objects = 4
+
+    @property
+    def connector_config(self) -> dict[str, Any]:
+        return {
+            "endpoint_url": self.options.s3_endpoint,
+            "access_key_id": self.options.s3_access_key_id,
+            "secret_access_key": self.options.s3_secret_access_key,
+            "bucket": self.options.s3_bucket,
+            "prefix": f"{self.options.rows}x{self.options.width}/",
+            "file_format": "csv",
+            "batch_size": self.options.batch_size,
+        }
+
+    async def setup(self) -> None:
+        if not self.options.s3_endpoint:
+            raise SkipCase("--s3-endpoint was not given")
+        try:
+            import aiobotocore.session
+        except ImportError as exc:
+            raise SkipCase("aiobotocore is not installed") from exc
+
+        config = self.connector_config
+        per_object = -(-self.options.rows // self.objects)
+        self.total_bytes = 0
+        async with aiobotocore.session.get_session().create_client(
+            "s3",
+            endpoint_url=config["endpoint_url"],
+            aws_access_key_id=config["access_key_id"],
+            aws_secret_access_key=config["secret_access_key"],
+            region_name="us-east-1",
+        ) as client:
+            try:
+                await client.create_bucket(Bucket=config["bucket"])
+            except client.exceptions.BucketAlreadyOwnedByYou:
+                pass
+            for index, start in enumerate(range(0, self.options.rows, per_object)):
+                count = min(per_object, self.options.rows - start)
+                buffer = io.StringIO()
+                writer = csv.DictWriter(buffer, fieldnames=column_names(self.options.width))
+                writer.writeheader()
+                writer.writerows(make_rows(start, count, self.options.width))
+                body = buffer.getvalue().encode()
+                self.total_bytes += len(body)
+                await client.put_object(
+                    Bucket=config["bucket"],
+                    Key=f"{config['prefix']}part-{index:04d}.csv",
+                    Body=body,
+                )
+
+    async def run(self) -> Outcome:
+        from app.services.connectors import registry
+
+        connector = registry.create("s3", **self.connector_config)
+        rows = 0
+        latencies = []
+        last = time.perf_counter()
+        async for batch in connector.read():
+            now = time.perf_counter()
+            latencies.append(now - last)
+            last = now
+            rows += len(batch)
+        return Outcome(rows, self.total_bytes, latencies)
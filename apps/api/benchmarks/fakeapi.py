@@ -0,0 +1,148 @@
+"""Local HTTP server mimicking the pagination styles of popular SaaS APIs.
+
+* ``github``: page numbers with RFC 5988 ``Link: <...>; rel="next"`` headers.
+* ``hubspot``: cursors in ``paging.next.after`` with a ready-made ``paging.next.link``.
+* ``zendesk``: absolute ``next_page`` URLs in the response body.
+
+Pages are generated on request from the row number, so serving millions of rows
+needs no memory. The server runs in its own process so encoding responses does
+not compete with the connector being measured.
+"""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+from app.core import tracing
+
+from benchmarks.synthetic import make_rows
+
+PAGE_SIZE = 100
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; Nagle would delay every keep-alive response.
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        headers: dict[str, str] = {}
+
+        if url.path.startswith("/repos/"):
+            page = int(query.get("page", 1))
+            body: Any = self._rows((page - 1) * PAGE_SIZE)
+            if page * PAGE_SIZE < self.server.rows:
+                headers["Link"] = (
+                    f"<https://api.github.com{url.path}?state=all&per_page={PAGE_SIZE}"
+                    f'&page={page + 1}>; rel="next"'
+                )
+        elif url.path.startswith("/crm/v3/objects/"):
+            start = int(query.get("after", 0))
+            body = {"results": self._rows(start)}
+            if start + PAGE_SIZE < self.server.rows:
+                after = start + PAGE_SIZE
+                body["paging"] = {
+                    "next": {
+                        "after": str(after),
+                        "link": f"https://api.hubapi.com{url.path}?limit={PAGE_SIZE}&after={after}",
+                    }
+                }
+        elif url.path.startswith("/api/v2/"):
+            page = int(query.get("page", 1))
+            key = url.path.rsplit("/", 1)[-1].removesuffix(".json")
+            body = {key: self._rows((page - 1) * PAGE_SIZE), "next_page": None}
+            if page * PAGE_SIZE < self.server.rows:
+                body["next_page"] = (
+                    f"https://bench.zendesk.com{url.path}?per_page={PAGE_SIZE}&page={page + 1}"
+                )
+        else:
+            self.send_error(404)
+            return
+
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _rows(self, start: int) -> list[dict[str, Any]]:
+        count = max(min(PAGE_SIZE, self.server.rows - start), 0)
+        return make_rows(start, count, self.server.width)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, rows: int, width: int) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.rows = rows
+        self.width = width
+
+
+def _serve(rows: int, width: int, ports: multiprocessing.Queue) -> None:
+    server = _Server(rows, width)
+    ports.put(server.server_address[1])
+    server.serve_forever()
+
+
+class FakeAPIServer:
+    """Run the fake API in a child process for the duration of a ``with`` block."""
+
+    def __init__(self, rows: int, width: int) -> None:
+        self.rows = rows
+        self.width = width
+
+    def __enter__(self) -> FakeAPIServer:
+        context = multiprocessing.get_context("spawn")
+        ports = context.Queue()
+        self.process = context.Process(
+            target=_serve, args=(self.rows, self.width, ports), daemon=True
+        )
+        self.process.start()
+        self.port = ports.get(timeout=30)
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.process.terminate()
+        self.process.join()
+
+
+class LocalTransport(tracing.TracedTransport):
+    """Send every request to the fake API, timing each page and counting response bytes."""
+
+    port: int = 0
+    latencies: list[float] = []
+    bytes_received: int = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=self.port)
+        started = time.perf_counter()
+        response = await super().handle_async_request(request)
+        await response.aread()
+        LocalTransport.latencies.append(time.perf_counter() - started)
+        LocalTransport.bytes_received += len(response.content)
+        return response
+
+
+def route_connectors_to(port: int) -> None:
+    """Make HTTP connectors, whose ``Connector.http_client`` uses ``TracedTransport``, talk to the fake API."""
+
+    LocalTransport.port = port
+    LocalTransport.latencies = []
+    LocalTransport.bytes_received = 0
+    tracing.TracedTransport = LocalTransport
@@ -0,0 +1,158 @@
+"""Run benchmark cases in isolated processes and summarise their results."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import multiprocessing
+import os
+import platform
+import queue
+import resource
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+from benchmarks.cases import CASES, Options, SkipCase
+
+
+@dataclass
+class Result:
+    name: str
+    status: str = "ok"
+    reason: str | None = None
+    rows: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    rows_per_second: float = 0.0
+    mb_per_second: float = 0.0
+    peak_rss_mb: float = 0.0
+    batches: int = 0
+    batch_latency_p50_ms: float = 0.0
+    batch_latency_p99_ms: float = 0.0
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile; 0 for an empty sample."""
+
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = math.ceil(fraction * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in kilobytes on Linux and bytes on macOS.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+async def _measure(name: str, options: Options) -> Result:
+    case = CASES[name](options)
+    try:
+        await case.setup()
+    except SkipCase as exc:
+        return Result(name=name, status="skipped", reason=str(exc))
+
+    try:
+        started = time.perf_counter()
+        outcome = await case.run()
+        seconds = time.perf_counter() - started
+    finally:
+        await case.teardown()
+
+    latencies = outcome.batch_latencies
+    return Result(
+        name=name,
+        rows=outcome.rows,
+        bytes=outcome.bytes,
+        seconds=round(seconds, 4),
+        rows_per_second=round(outcome.rows / seconds, 1) if seconds else 0.0,
+        mb_per_second=round(outcome.bytes / (1024 * 1024) / seconds, 3) if seconds else 0.0,
+        peak_rss_mb=round(_peak_rss_mb(), 1),
+        batches=len(latencies),
+        batch_latency_p50_ms=round(percentile(latencies, 0.50) * 1000, 3),
+        batch_latency_p99_ms=round(percentile(latencies, 0.99) * 1000, 3),
+    )
+
+
+def _child(name: str, options: Options, results: multiprocessing.Queue) -> None:
+    try:
+        results.put(asdict(asyncio.run(_measure(name, options))))
+    except Exception as exc:  # noqa: BLE001 - reported as a failed case
+        results.put(
+            asdict(Result(name=name, status="failed", reason=f"{type(exc).__name__}: {exc}"))
+        )
+
+
+def run_case(name: str, options: Options) -> Result:
+    """Run one case in a fresh interpreter so peak RSS and warm caches are not shared."""
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    process = context.Process(target=_child, args=(name, options, results))
+    process.start()
+    while True:
+        try:
+            result = Result(**results.get(timeout=1))
+            break
+        except queue.Empty:
+            if not process.is_alive():
+                reason = f"benchmark process exited with code {process.exitcode}"
+                result = Result(name=name, status="failed", reason=reason)
+                break
+    process.join()
+    return result
+
+
+def run_cases(names: list[str], options: Options, repeat: int = 1) -> list[Result]:
+    """Run each case ``repeat`` times and keep the run with the median duration."""
+
+    results = []
+    for name in names:
+        runs = [run_case(name, options) for _ in range(repeat)]
+        ok = sorted((run for run in runs if run.status == "ok"), key=lambda run: run.seconds)
+        results.append(ok[(len(ok) - 1) // 2] if ok else runs[0])
+    return results
+
+
+def environment() -> dict[str, Any]:
+    """Describe where the results came from, so runs can be matched across commits."""
+
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def compare(current: list[dict[str, Any]], baseline: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Return the relative rows/sec change of each case present in both result sets."""
+
+    previous = {result["name"]: result for result in baseline if result["status"] == "ok"}
+    changes = []
+    for result in current:
+        before = previous.get(result["name"])
+        if result["status"] != "ok" or not before or not before["rows_per_second"]:
+            continue
+        changes.append(
+            {
+                "name": result["name"],
+                "baseline_rows_per_second": before["rows_per_second"],
+                "rows_per_second": result["rows_per_second"],
+                "change": round(result["rows_per_second"] / before["rows_per_second"] - 1, 4),
+            }
+        )
+    return changes
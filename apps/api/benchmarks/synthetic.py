@@ -0,0 +1,87 @@
+"""Deterministic synthetic records and in-memory endpoints for the data plane."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+from app.services.connectors import Connector
+
+
+def column_names(width: int) -> list[str]:
+    return ["id"] + [f"col_{index:03d}" for index in range(1, width)]
+
+
+def make_rows(start: int, count: int, width: int) -> list[dict[str, Any]]:
+    """Return ``count`` records with ``width`` columns cycling through common value types.
+
+    Values are derived from the row number, so every run produces identical data.
+    """
+
+    names = column_names(width)
+    rows = []
+    for number in range(start, start + count):
+        row: dict[str, Any] = {"id": number}
+        for index, name in enumerate(names[1:], start=1):
+            kind = index % 5
+            if kind == 0:
+                row[name] = number * index
+            elif kind == 1:
+                row[name] = f"value-{number:010d}-{index:03d}"
+            elif kind == 2:
+                row[name] = number / (index + 1)
+            elif kind == 3:
+                row[name] = number % 2 == 0
+            else:
+                row[name] = f"2024-01-01T00:00:{number % 60:02d}+00:00"
+        rows.append(row)
+    return rows
+
+
+def iter_batches(rows: int, width: int, batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    for start in range(0, rows, batch_size):
+        yield make_rows(start, min(batch_size, rows - start), width)
+
+
+class SyntheticSource(Connector):
+    """Source replaying a pre-generated batch up to ``rows`` records, so the data plane
+    rather than record generation is measured. Not registered with the connector registry."""
+
+    name = "benchmark_source"
+    title = "Benchmark Source"
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict[str, Any]:
+        return {}
+
+    async def read(self) -> AsyncIterator[list[dict[str, Any]]]:
+        template = self.config["batch"]
+        for start in range(0, self.config["rows"], len(template)):
+            yield template[: self.config["rows"] - start]
+
+
+class NullDestination(Connector):
+    """Destination discarding records while timing the gap between batches."""
+
+    name = "benchmark_destination"
+    title = "Benchmark Destination"
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict[str, Any]:
+        return {}
+
+    async def write(self, batches: AsyncIterator[list[dict[str, Any]]]) -> dict[str, Any]:
+        self.batch_latencies: list[float] = []
+        rows = 0
+        last = time.perf_counter()
+        async for batch in batches:
+            now = time.perf_counter()
+            self.batch_latencies.append(now - last)
+            last = now
+            rows += len(batch)
+        return {"status": "completed", "rows_loaded": rows}
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import os
 import sys
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
 from fastapi.testclient import TestClient
@@ -24,9 +26,23 @@ os.environ.setdefault("OPENFUSE_DATABASE_URL", f"sqlite:///{ROOT / 'test.db'}")
 os.environ.setdefault("OPENFUSE_REDIS_URL", "redis://localhost:6379/15")
 os.environ.setdefault("OPENFUSE_ENVIRONMENT", "test")
 
-from app.db import engine
-from app.main import app
-from app.services.workflows.tasks import run_pipeline_task
+# The application reads the settings above when it is imported, so its imports follow them.
+from alembic import command  # noqa: E402
+from app.db import engine, get_session  # noqa: E402
+from app.db.migrations import alembic_config  # noqa: E402
+from app.db.models import Pipeline, PipelineStatus  # noqa: E402
+from app.main import app  # noqa: E402
+from app.services.connectors import Connector, registry  # noqa: E402
+from app.services.workflows import tasks  # noqa: E402
+from app.services.workflows.tasks import run_pipeline_task  # noqa: E402
+
+
+@pytest.fixture(autouse=True, scope="session")
+def stamp_database() -> None:
+    """Record the test database as migrated; tables are rebuilt from the models per test."""
+
+    with engine.begin() as connection:
+        command.stamp(alembic_config(connection), "head")
 
 
 @pytest.fixture(autouse=True)
@@ -43,6 +59,7 @@ def disable_celery_dispatch(monkeypatch: pytest.MonkeyPatch) -> None:
     """Prevent broker calls during tests."""
 
     monkeypatch.setattr(run_pipeline_task, "delay", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(tasks, "enqueue_runs", lambda *_args, **_kwargs: None)
 
 
 @pytest.fixture
@@ -51,3 +68,66 @@ def client() -> TestClient:
 
     with TestClient(app) as test_client:
         yield test_client
+
+
+@pytest.fixture
+def add_pipeline() -> Callable[..., Pipeline]:
+    """Factory storing an active gcs to MySQL pipeline; keyword arguments override its fields."""
+
+    def add(**fields: Any) -> Pipeline:
+        fields = {
+            "name": "Pipeline",
+            "source_connector": "gcs",
+            "destination_connector": "mysql_destination",
+            "status": PipelineStatus.ACTIVE,
+            **fields,
+        }
+        session = next(get_session())
+        pipeline = Pipeline(**fields)
+        session.add(pipeline)
+        session.commit()
+        session.refresh(pipeline)
+        session.close()
+        return pipeline
+
+    return add
+
+
+class StreamingSource(Connector):
+    name = "streaming_source"
+    title = "Streaming Source"
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict[str, Any]:
+        raise AssertionError("run() should not be called when streaming")
+
+    async def read(self):
+        yield [{"id": 1}, {"id": 2}]
+        yield [{"id": 3}]
+
+
+class CollectingDestination(Connector):
+    name = "collecting_destination"
+    title = "Collecting Destination"
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict[str, Any]:
+        raise AssertionError("run() should not be called when streaming")
+
+    async def write(self, batches) -> dict[str, Any]:
+        self.loaded = [record async for batch in batches for record in batch]
+        return {"status": "completed", "rows_loaded": len(self.loaded)}
+
+
+@pytest.fixture
+def streaming_connectors(monkeypatch: pytest.MonkeyPatch) -> CollectingDestination:
+    """Run gcs to MySQL pipelines through in-memory connectors and return the destination."""
+
+    destination = CollectingDestination()
+    connectors = {"gcs": StreamingSource(), "mysql_destination": destination}
+    monkeypatch.setattr(registry, "create", lambda name, **config: connectors[name])
+    return destination
@@ -0,0 +1,77 @@
+"""Tests for the synthetic benchmark harness."""
+
+from benchmarks.cases import Options
+from benchmarks.harness import compare, percentile, run_case
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.50) == 50.0
+    assert percentile(values, 0.99) == 99.0
+    assert percentile([], 0.99) == 0.0
+
+
+def test_compare_reports_relative_throughput() -> None:
+    baseline = [{"name": "dataplane", "status": "ok", "rows_per_second": 1000.0}]
+    current = [{"name": "dataplane", "status": "ok", "rows_per_second": 800.0}]
+
+    assert compare(current, baseline)[0]["change"] == -0.2
+
+
+def test_dataplane_case_reports_throughput(tmp_path) -> None:
+    result = run_case("dataplane", Options(rows=1000, batch_size=100, workdir=str(tmp_path)))
+
+    assert result.status == "ok"
+    assert result.rows == 1000
+    assert result.batches == 10
+    assert result.rows_per_second > 0
+    assert result.peak_rss_mb > 0
+
+
+def test_http_case_follows_fake_api_pagination(tmp_path) -> None:
+    result = run_case("http_hubspot", Options(rows=250, width=5, workdir=str(tmp_path)))
+
+    assert result.status == "ok", result.reason
+    assert result.rows == 250
+    assert result.batches == 3
+
+
+def test_cases_without_stand_ins_are_skipped(tmp_path) -> None:
+    result = run_case("postgres", Options(workdir=str(tmp_path)))
+
+    assert result.status == "skipped"
+
+
+def test_api_benchmark_reports_latency_and_queries() -> None:
+    from benchmarks.api import measure
+
+    results = {
+        result.name: result for result in measure(pipelines=20, jobs=200, iterations=3, warmup=1)
+    }
+
+    assert set(results) >= {
+        "list_pipelines",
+        "list_jobs",
+        "list_pipeline_jobs",
+        "list_connectors",
+        "run_pipeline",
+    }
+    assert results["create_pipelines_batch"].queries_per_request <= 3
+    assert results["list_jobs"].p99_ms >= results["list_jobs"].p50_ms > 0
+    assert results["list_pipelines"].queries_per_request >= 1
+    assert results["list_connectors"].queries_per_request == 0
+
+
+def test_api_benchmark_flags_slower_endpoints_and_extra_queries() -> None:
+    from benchmarks.api import regressions
+
+    baseline = [{"name": "list_jobs", "p50_ms": 10.0, "p99_ms": 20.0, "queries_per_request": 2.0}]
+    slower = [{"name": "list_jobs", "p50_ms": 11.0, "p99_ms": 30.0, "queries_per_request": 3.0}]
+
+    failures = regressions(slower, baseline, max_regression=0.2)
+
+    assert len(failures) == 2
+    assert failures[0].startswith("list_jobs: p99_ms")
+    assert "queries per request" in failures[1]
+    assert regressions(baseline, baseline, max_regression=0.2) == []
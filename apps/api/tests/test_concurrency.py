@@ -0,0 +1,228 @@
+"""Tests for pipeline run concurrency policies and per-host limits."""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from app.core.config import settings
+from app.db import get_session
+from app.db.models import ConcurrencyPolicy, Job, JobStatus
+from app.services.workflows import tasks
+from app.services.workflows.concurrency import (
+    claim_job,
+    concurrency_key,
+    finish_job,
+    recover_stale_jobs,
+)
+from app.services.workflows.tasks import JobCancelled, run_pipeline_task
+
+
+def job_statuses(pipeline_id: int) -> list[JobStatus]:
+    session = next(get_session())
+    statuses = [
+        job.status for job in session.query(Job).filter_by(pipeline_id=pipeline_id).order_by(Job.id)
+    ]
+    session.close()
+    return statuses
+
+
+def add_job(pipeline_id: int, status: JobStatus, age: timedelta) -> int:
+    session = next(get_session())
+    seen = datetime.utcnow() - age
+    started_at = seen if status == JobStatus.RUNNING else None
+    job = Job(pipeline_id=pipeline_id, status=status, created_at=seen, started_at=started_at)
+    session.add(job)
+    session.commit()
+    job_id = job.id
+    session.close()
+    return job_id
+
+
+@pytest.fixture
+def delayed(monkeypatch) -> list[int]:
+    calls = []
+    monkeypatch.setattr(
+        tasks, "enqueue_runs", lambda jobs, profile=False: calls.extend(job.id for job in jobs)
+    )
+    return calls
+
+
+def test_skip_returns_the_unfinished_run(client, add_pipeline, delayed) -> None:
+    pipeline_id = add_pipeline().id
+
+    first = client.post(f"/api/v1/pipelines/{pipeline_id}/run").json()
+    second = client.post(f"/api/v1/pipelines/{pipeline_id}/run").json()
+
+    assert second["id"] == first["id"]
+    assert delayed == [first["id"]]
+    assert job_statuses(pipeline_id) == [JobStatus.PENDING]
+
+
+def test_runs_are_published_off_the_event_loop(client, add_pipeline, monkeypatch) -> None:
+    loops = []
+
+    def enqueue_runs(jobs, profile=False) -> None:
+        try:
+            loops.append(asyncio.get_running_loop())
+        except RuntimeError:
+            loops.append(None)
+
+    monkeypatch.setattr(tasks, "enqueue_runs", enqueue_runs)
+    pipeline_id = add_pipeline(concurrency_policy=ConcurrencyPolicy.QUEUE).id
+    job_id = client.post(f"/api/v1/pipelines/{pipeline_id}/run").json()["id"]
+    client.post("/api/v1/pipelines:batch/run", json={"pipeline_ids": [pipeline_id]})
+    client.post(f"/api/v1/jobs/{job_id}/cancel")  # starts the queued run
+
+    assert loops == [None, None, None]
+
+
+def test_queued_run_starts_when_the_previous_one_finishes(
+    client, add_pipeline, delayed, streaming_connectors
+) -> None:
+    pipeline_id = add_pipeline(concurrency_policy=ConcurrencyPolicy.QUEUE).id
+
+    first = client.post(f"/api/v1/pipelines/{pipeline_id}/run").json()
+    queued = client.post(f"/api/v1/pipelines/{pipeline_id}/run").json()
+    assert queued["status"] == "queued"
+    assert delayed == [first["id"]]
+
+    assert run_pipeline_task(first["id"])["status"] == "completed"
+
+    assert delayed == [first["id"], queued["id"]]
+    assert job_statuses(pipeline_id) == [JobStatus.COMPLETED, JobStatus.PENDING]
+
+
+def test_cancel_previous_replaces_unfinished_runs(client, add_pipeline) -> None:
+    pipeline_id = add_pipeline(concurrency_policy=ConcurrencyPolicy.CANCEL_PREVIOUS).id
+    client.post(f"/api/v1/pipelines/{pipeline_id}/run")
+
+    response = client.post("/api/v1/pipelines:batch/run", json={"pipeline_ids": [pipeline_id]})
+
+    assert response.json()["jobs"][0]["status"] == "pending"
+    assert job_statuses(pipeline_id) == [JobStatus.CANCELLED, JobStatus.PENDING]
+
+
+def test_running_job_stops_once_cancelled(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "job_cancel_poll_seconds", 0.01)
+    checks = iter([False, True])
+    monkeypatch.setattr(tasks, "_heartbeat", lambda job_id: next(checks))
+    stopped = []
+
+    async def long_extraction() -> None:
+        try:
+            await asyncio.sleep(60)
+        finally:
+            stopped.append(True)
+
+    with pytest.raises(JobCancelled):
+        tasks._run_until_cancelled(1, long_extraction())
+    assert stopped == [True]
+
+
+def test_jobs_heartbeat_while_a_connector_blocks_the_event_loop(add_pipeline, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "job_cancel_poll_seconds", 0.01)
+    monkeypatch.setattr(settings, "job_heartbeat_timeout_seconds", 0.2)
+    job_id = add_job(add_pipeline().id, JobStatus.RUNNING, timedelta(0))
+    recovered = []
+
+    async def blocking_load() -> None:
+        time.sleep(0.5)  # a synchronous client call, e.g. a long COPY
+        session = next(get_session())
+        recovered.extend(job.id for job in recover_stale_jobs(session))
+        session.close()
+
+    tasks._run_until_cancelled(job_id, blocking_load())
+    assert recovered == []
+
+
+def test_cancel_endpoint(client, add_pipeline) -> None:
+    pipeline_id = add_pipeline().id
+    job_id = client.post(f"/api/v1/pipelines/{pipeline_id}/run").json()["id"]
+
+    cancelled = client.post(f"/api/v1/jobs/{job_id}/cancel")
+    assert cancelled.status_code == 200
+    assert cancelled.json()["status"] == "cancelled"
+
+    again = client.post(f"/api/v1/jobs/{job_id}/cancel")
+    assert again.status_code == 422
+    assert client.post("/api/v1/jobs/999/cancel").status_code == 404
+
+
+def test_jobs_wait_for_a_slot_on_their_source_host(client, add_pipeline, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "job_host_concurrency", {"db.internal:5432": 1})
+    first = add_pipeline(source_config={"host": "DB.internal", "port": 5432}).id
+    second = add_pipeline(source_config={"host": "db.internal", "port": 5432}).id
+    other = add_pipeline(source_config={"host": "replica.internal", "port": 5432}).id
+    jobs = client.post(
+        "/api/v1/pipelines:batch/run", json={"pipeline_ids": [first, second, other]}
+    ).json()["jobs"]
+
+    session = next(get_session())
+    first_job, second_job, other_job = (session.get(Job, job["id"]) for job in jobs)
+    assert (
+        first_job.concurrency_key
+        == concurrency_key({"host": "db.internal", "port": 5432})
+        == "db.internal:5432"
+    )
+
+    assert claim_job(session, first_job)
+    assert not claim_job(session, second_job)
+    assert second_job.status == JobStatus.PENDING
+    assert claim_job(session, other_job)
+
+    finish_job(session, first_job, status=JobStatus.COMPLETED)
+    assert claim_job(session, second_job)
+    assert second_job.status == JobStatus.RUNNING
+    assert not claim_job(session, second_job)  # a redelivered message does not run it twice
+    session.close()
+
+
+def test_skip_enqueues_a_stale_pending_job_again(client, add_pipeline, delayed) -> None:
+    pipeline_id = add_pipeline().id
+    lost = add_job(
+        pipeline_id, JobStatus.PENDING, timedelta(seconds=settings.job_pending_timeout_seconds + 60)
+    )
+
+    assert client.post(f"/api/v1/pipelines/{pipeline_id}/run").json()["id"] == lost
+    assert delayed == [lost]
+    # Its heartbeat is refreshed, so the next run does not publish it once more.
+    assert client.post(f"/api/v1/pipelines/{pipeline_id}/run").json()["id"] == lost
+    assert delayed == [lost]
+
+
+def test_jobs_whose_worker_died_are_enqueued_again(add_pipeline, delayed) -> None:
+    timeout = timedelta(seconds=settings.job_heartbeat_timeout_seconds)
+    orphaned = add_job(add_pipeline().id, JobStatus.RUNNING, timeout * 2)
+    alive = add_job(add_pipeline().id, JobStatus.RUNNING, timeout / 2)
+    waiting = add_job(add_pipeline().id, JobStatus.PENDING, timeout * 2)
+
+    assert tasks.recover_stale_jobs_task() == {"job_ids": [orphaned]}
+    assert delayed == [orphaned]
+    session = next(get_session())
+    assert [session.get(Job, job_id).status for job_id in (orphaned, alive, waiting)] == [
+        JobStatus.PENDING,
+        JobStatus.RUNNING,
+        JobStatus.PENDING,
+    ]
+    session.close()
+
+
+def test_redelivered_message_takes_over_a_job_whose_worker_died(add_pipeline, monkeypatch) -> None:
+    monkeypatch.setattr(settings, "job_host_concurrency", {"db.internal:5432": 1})
+    timeout = timedelta(seconds=settings.job_heartbeat_timeout_seconds)
+    pipeline_id = add_pipeline(source_config={"host": "db.internal", "port": 5432}).id
+    orphaned = add_job(pipeline_id, JobStatus.RUNNING, timeout * 2)
+    alive = add_job(add_pipeline().id, JobStatus.RUNNING, timeout / 2)
+
+    session = next(get_session())
+    orphaned_job, alive_job = session.get(Job, orphaned), session.get(Job, alive)
+    orphaned_job.concurrency_key = "db.internal:5432"
+    session.commit()
+
+    assert claim_job(session, orphaned_job)  # its own stale run does not use up the host
+    assert orphaned_job.heartbeat_at > datetime.utcnow() - timedelta(seconds=5)
+    assert not claim_job(session, orphaned_job)
+    assert not claim_job(session, alive_job)
+    assert alive_job.status == JobStatus.RUNNING
+    session.close()
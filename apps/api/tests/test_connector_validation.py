@@ -44,3 +44,62 @@ def test_get_connector_contains_capabilities(client) -> None:
     payload = response.json()
     assert payload["name"] == "snowflake"
     assert "destination" in payload["capabilities"]
+
+
+def test_validate_connector_reports_every_schema_violation(client) -> None:
+    response = client.post(
+        "/api/v1/connectors/bigquery/validate",
+        json={"config": {"dataset": 7, "file_format": "XML"}},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == [
+        "project_id: is required",
+        "dataset: must be of type string",
+        "file_format: must be one of 'CSV', 'NEWLINE_DELIMITED_JSON', 'PARQUET'",
+    ]
+
+
+def test_config_validators_are_compiled_once_per_connector() -> None:
+    validator = registry.validator("slack")
+
+    assert registry.validator("slack") is validator
+    assert registry.validate_config("slack", {"token": "xoxb"}) == []
+    assert registry.validate_config("slack", {}, "source_config") == [
+        "source_config.token: is required"
+    ]
+
+
+def test_compiled_schema_checks() -> None:
+    import pytest
+    from app.services.connectors.schema import compile_schema
+
+    validate = compile_schema(
+        {
+            "type": "object",
+            "properties": {
+                "port": {"type": "integer", "minimum": 1, "maximum": 65535},
+                "tables": {
+                    "type": "array",
+                    "items": {"type": "string", "minLength": 1},
+                    "maxItems": 2,
+                },
+                "mode": {
+                    "anyOf": [{"const": "full"}, {"type": "string", "pattern": "^incremental:"}]
+                },
+            },
+            "additionalProperties": False,
+        }
+    )
+
+    assert validate({"port": 5432, "tables": ["a"], "mode": "incremental:id"}) == []
+    assert validate({"port": True, "tables": ["", 3, "c"], "mode": "partial", "extra": 1}) == [
+        "port: must be of type integer",
+        "tables[0]: must be at least 1 characters long",
+        "tables[1]: must be of type string",
+        "tables: must contain at most 2 items",
+        "mode: must match at least one allowed schema",
+        "extra: is not an allowed property",
+    ]
+    with pytest.raises(ValueError, match="'\\$ref'"):
+        compile_schema({"type": "object", "properties": {"a": {"$ref": "#/definitions/a"}}})
@@ -1,7 +1,12 @@
 """Tests for connector registry and API endpoints."""
 
+from pathlib import Path
+
+import pytest
 from app.services.connectors import registry
 
+ROOT = Path(__file__).resolve().parents[1]
+
 
 def test_registry_lists_example_connector() -> None:
     connectors = registry.list()
@@ -52,3 +57,186 @@ def test_validate_connector_missing_field(client) -> None:
     response = client.post("/api/v1/connectors/example/validate", json={"config": {}})
 
     assert response.status_code == 422
+
+
+def test_connector_catalog_is_revalidated_with_etag(client) -> None:
+    response = client.get("/api/v1/connectors?capability=source")
+    etag = response.headers["etag"]
+
+    assert response.headers["cache-control"].startswith("public")
+    assert client.get("/api/v1/connectors?capability=source").headers["etag"] == etag
+    assert client.get("/api/v1/connectors").headers["etag"] != etag
+
+    cached = client.get("/api/v1/connectors?capability=source", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+
+
+def test_connector_detail_uses_catalog_cache(client) -> None:
+    response = client.get("/api/v1/connectors/example")
+    assert response.status_code == 200
+    assert response.json()["name"] == "example"
+
+    cached = client.get(
+        "/api/v1/connectors/example", headers={"If-None-Match": f"W/{response.headers['etag']}"}
+    )
+    assert cached.status_code == 304
+    assert client.get("/api/v1/connectors/unknown").status_code == 404
+
+
+def test_connector_catalog_cache_follows_registrations(client) -> None:
+    from app.services.connectors import Connector
+
+    class Late(Connector):
+        name = "late"
+        title = "Late"
+
+        def validate(self) -> None:
+            pass
+
+        async def run(self) -> dict:
+            return {}
+
+    before = client.get("/api/v1/connectors").headers["etag"]
+    original = registry._registry.copy(), registry.version
+    try:
+        registry.register(Late)
+        response = client.get("/api/v1/connectors")
+        assert response.headers["etag"] != before
+        assert any(connector["name"] == "late" for connector in response.json()["connectors"])
+    finally:
+        registry._registry, registry.version = original
+
+
+def test_connector_manifest_matches_connector_modules() -> None:
+    import json
+
+    from app.services.connectors.manifest import MANIFEST_PATH, build_manifest
+
+    # Regenerate with `python3 scripts/generate_connector_catalog.py` when this fails.
+    assert json.loads(MANIFEST_PATH.read_text()) == build_manifest()
+
+
+def test_connector_modules_are_imported_on_first_use() -> None:
+    import subprocess
+    import sys
+
+    script = (
+        "import sys\n"
+        "from app.services.connectors import registry\n"
+        "module = 'app.services.connectors.snowflake'\n"
+        "assert 'snowflake' in registry.list() and module not in sys.modules\n"
+        "assert 'destination' in registry.definition('snowflake').tags and module not in sys.modules\n"
+        "assert registry.get('snowflake').__module__ == module and module in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", script], check=True, cwd=ROOT)
+
+
+@pytest.fixture
+def plugin_package(tmp_path, monkeypatch):
+    """An installed-looking plugin package exposing entry points for ``names``."""
+
+    from importlib.metadata import EntryPoint
+
+    from app.services.connectors import plugins
+
+    package = tmp_path / "acme_plugins"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(plugins, "reports", {})
+    original = registry._registry.copy(), registry._lazy.copy(), registry.version
+
+    def install(modules: dict[str, str], manifest: list | None = None) -> list:
+        import json
+
+        for module, source in modules.items():
+            (package / f"{module}.py").write_text(source)
+        if manifest is not None:
+            (package / plugins.PLUGIN_MANIFEST).write_text(json.dumps(manifest))
+        entry_points = [
+            EntryPoint(module, f"acme_plugins.{module}:Plugin", plugins.ENTRY_POINT_GROUP)
+            for module in modules
+        ]
+        monkeypatch.setattr(plugins, "entry_points", lambda group: entry_points)
+        return plugins.discover_plugins(registry)
+
+    yield install
+    registry._registry, registry._lazy, registry.version = original
+    import sys
+
+    for module in [name for name in sys.modules if name.startswith("acme_plugins")]:
+        del sys.modules[module]
+
+
+PLUGIN_SOURCE = """
+{prelude}
+from app.services.connectors import Connector
+
+
+class Plugin(Connector):
+    name = "{name}"
+    title = "{name} plugin"
+    tags = {tags}
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict:
+        return {{}}
+"""
+
+
+def test_plugins_are_listed_from_their_manifest_without_import(plugin_package) -> None:
+    import sys
+
+    from app.services.connectors.plugins import load_plugins
+
+    manifest = [
+        {
+            "name": "netsuite",
+            "title": "NetSuite",
+            "tags": ["source"],
+            "config_schema": {"type": "object"},
+        }
+    ]
+    reports = plugin_package(
+        {"netsuite": PLUGIN_SOURCE.format(prelude="", name="netsuite", tags=["source"])}, manifest
+    )
+
+    assert [report.status for report in reports] == ["described"]
+    assert registry.definition("netsuite").title == "NetSuite"
+    assert "netsuite" in registry.list() and "acme_plugins.netsuite" not in sys.modules
+
+    [report] = load_plugins(registry, budget_seconds=60)
+    assert report.status == "loaded" and report.import_seconds is not None
+    assert registry.get("netsuite").__module__ == "acme_plugins.netsuite"
+
+
+def test_invalid_and_slow_plugins_are_reported(plugin_package) -> None:
+    from app.services.connectors.plugins import load_plugins, reports
+
+    plugin_package(
+        {
+            "slow": PLUGIN_SOURCE.format(
+                prelude="import time\ntime.sleep(0.05)", name="slow", tags=["destination"]
+            ),
+            "untagged": PLUGIN_SOURCE.format(prelude="", name="untagged", tags=[]),
+            "broken": "raise ImportError('missing client library')",
+        }
+    )
+    # Without a manifest nothing is listed until the plugins are imported.
+    assert not {"slow", "untagged", "broken"} & set(registry.list())
+
+    load_plugins(registry, budget_seconds=0.01)
+
+    assert reports["slow"].status == "slow" and reports["slow"].import_seconds >= 0.05
+    assert "slow" in registry.list()
+    assert reports["untagged"].status == "failed" and "source" in reports["untagged"].error
+    assert (
+        reports["broken"].status == "failed" and "missing client library" in reports["broken"].error
+    )
+    for name in ("untagged", "broken"):
+        with pytest.raises(LookupError):
+            registry.get(name)
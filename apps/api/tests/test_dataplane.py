@@ -0,0 +1,195 @@
+"""Tests for the byte-bounded batch queue between pipeline stages."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from app.services.connectors import Connector
+from app.services.workflows.dataplane import (
+    BatchQueue,
+    JobMetrics,
+    SpillStore,
+    estimate_batch_bytes,
+    stream_records,
+)
+
+
+class ListSource(Connector):
+    name = "list_source"
+    title = "List Source"
+
+    def __init__(self, *batches: list[dict[str, Any]], error: Exception | None = None) -> None:
+        super().__init__()
+        self.batches = batches
+        self.error = error
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict[str, Any]:
+        return {}
+
+    async def read(self):
+        for batch in self.batches:
+            yield batch
+        if self.error:
+            raise self.error
+
+
+class ListDestination(Connector):
+    name = "list_destination"
+    title = "List Destination"
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict[str, Any]:
+        return {}
+
+    async def write(self, batches) -> dict[str, Any]:
+        self.loaded = [record async for batch in batches for record in batch]
+        return {"status": "completed", "rows_loaded": len(self.loaded)}
+
+
+def make_batch(rows: int) -> list[dict]:
+    return [{"id": i, "payload": "x" * 100} for i in range(rows)]
+
+
+def test_estimate_batch_bytes_scales_with_rows() -> None:
+    assert estimate_batch_bytes([]) == 0
+    small = estimate_batch_bytes(make_batch(10))
+    large = estimate_batch_bytes(make_batch(1000))
+    assert small > 0
+    assert large == pytest.approx(small * 100, rel=0.05)
+
+
+def test_batch_queue_pauses_reader_when_budget_exceeded() -> None:
+    batch = make_batch(100)
+    budget = estimate_batch_bytes(batch) * 2
+
+    async def scenario():
+        queue = BatchQueue(budget)
+        await queue.put(batch)
+        await queue.put(batch)
+
+        blocked = asyncio.create_task(queue.put(batch))
+        await asyncio.sleep(0.01)
+        assert not blocked.done()
+
+        await queue.get()
+        await asyncio.wait_for(blocked, timeout=1)
+        assert queue.peak_bytes <= budget
+
+    asyncio.run(scenario())
+
+
+def test_batch_queue_admits_oversized_batch_when_empty() -> None:
+    async def scenario():
+        queue = BatchQueue(1)
+        await asyncio.wait_for(queue.put(make_batch(10)), timeout=1)
+        await queue.close()
+        assert len(await queue.get()) == 10
+        assert await queue.get() is None
+
+    asyncio.run(scenario())
+
+
+def test_batch_queue_propagates_reader_errors() -> None:
+    async def scenario():
+        queue = BatchQueue(1024)
+        await queue.close(RuntimeError("source failed"))
+        with pytest.raises(RuntimeError, match="source failed"):
+            await queue.get()
+
+    asyncio.run(scenario())
+
+
+def test_stream_records_moves_all_batches() -> None:
+    destination = ListDestination()
+    source = ListSource(make_batch(2), make_batch(1))
+    metrics = JobMetrics()
+    result = asyncio.run(stream_records(source, destination, 1024 * 1024, metrics=metrics))
+
+    assert result["rows_loaded"] == 3
+    assert metrics.peak_buffered_bytes > 0
+
+
+def test_stream_records_records_job_metrics() -> None:
+    source = ListSource(make_batch(2), make_batch(1))
+    metrics = JobMetrics()
+    asyncio.run(stream_records(source, ListDestination(), 1024 * 1024, metrics=metrics))
+
+    assert (metrics.rows_read, metrics.rows_written) == (3, 3)
+    assert (metrics.batches_read, metrics.batches_written) == (2, 2)
+    assert metrics.bytes_read == metrics.bytes_written > 0
+    assert metrics.elapsed_seconds >= metrics.destination_write_seconds >= 0
+    assert metrics.to_dict()["rows_per_second"] > 0
+
+
+def test_stream_records_fails_when_source_fails() -> None:
+    source = ListSource(make_batch(2), error=RuntimeError("connection reset"))
+    metrics = JobMetrics()
+
+    with pytest.raises(RuntimeError, match="connection reset"):
+        asyncio.run(stream_records(source, ListDestination(), 1024 * 1024, metrics=metrics))
+    assert metrics.rows_read == 2
+
+
+def test_batch_queue_spills_overflow_to_disk(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    batch = make_batch(100)
+    spill = SpillStore(str(tmp_path), 1024 * 1024 * 1024)
+
+    async def scenario():
+        queue = BatchQueue(estimate_batch_bytes(batch), spill)
+        for _ in range(5):
+            await asyncio.wait_for(queue.put(batch), timeout=1)
+        await queue.close()
+        return [b async for b in queue]
+
+    batches = asyncio.run(scenario())
+
+    assert spill.spilled_batches == 4
+    assert batches == [batch] * 5
+    assert spill.disk_bytes == 0
+    assert list((tmp_path).glob("openfuse-spill-*/*.arrow")) == []
+
+
+def test_spill_store_declines_unrepresentable_batches(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    spill = SpillStore(str(tmp_path), 1)
+
+    assert spill.write([{"value": 1}, {"value": "text"}]) is None
+    assert spill.write(make_batch(10)) is not None
+    assert spill.write(make_batch(10)) is None  # disk budget exhausted
+
+
+def test_spill_store_round_trips_records_with_differing_keys(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    spill = SpillStore(str(tmp_path), 1024 * 1024)
+    batch = [{"id": 1}, {"id": 2, "email": "a@example.com"}, {"name": None, "id": 3}]
+
+    path = spill.write(batch)
+
+    assert path is not None
+    assert spill.read(path) == batch
+
+
+def test_stream_records_removes_spill_directory(tmp_path) -> None:
+    pytest.importorskip("pyarrow")
+    source = ListSource(*[make_batch(50) for _ in range(4)])
+    metrics = JobMetrics()
+    result = asyncio.run(
+        stream_records(
+            source,
+            ListDestination(),
+            1,
+            spill_dir=str(tmp_path),
+            spill_max_bytes=1 << 30,
+            metrics=metrics,
+        )
+    )
+
+    assert result["rows_loaded"] == 200
+    assert metrics.spilled_batches > 0
+    assert list(tmp_path.iterdir()) == []
@@ -52,7 +52,7 @@ def test_soft_delete_hides_pipeline_from_list(client):
     delete_response = client.delete(f"/api/v1/pipelines/{pipeline_id}")
     assert delete_response.status_code == 204
 
-    list_response = client.get("/api/v1/pipelines")
+    list_response = client.get("/api/v1/pipelines?include_total=true")
     assert list_response.status_code == 200
     payload = list_response.json()
     assert payload["total"] == 0
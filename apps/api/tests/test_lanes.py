@@ -0,0 +1,69 @@
+"""Tests for job lanes and fair share priorities."""
+
+from datetime import datetime, timedelta
+
+from app.db import engine, get_session
+from app.db.models import Job, JobClass, JobStatus, Pipeline, ReplicationMode
+from app.services.workflows import tasks
+from app.services.workflows.lanes import LANES, fair_share_priorities, job_class
+from app.services.workflows.worker import celery_app
+
+
+def add_usage(pipeline: Pipeline, *used_minutes: tuple[int, int]) -> Pipeline:
+    session = next(get_session())
+    now = datetime.utcnow()
+    for started_minutes_ago, minutes in used_minutes:
+        started_at = now - timedelta(minutes=started_minutes_ago)
+        session.add(
+            Job(
+                pipeline_id=pipeline.id,
+                status=JobStatus.COMPLETED,
+                started_at=started_at,
+                completed_at=started_at + timedelta(minutes=minutes),
+            )
+        )
+    session.commit()
+    session.close()
+    return pipeline
+
+
+def test_runs_are_classified_into_lanes(client, add_pipeline) -> None:
+    incremental = add_pipeline(replication_mode=ReplicationMode.INCREMENTAL_KEY)
+    full = add_pipeline(replication_mode=ReplicationMode.FULL_TABLE)
+
+    assert job_class(incremental) == JobClass.INCREMENTAL
+    assert job_class(full) == JobClass.FULL_REFRESH
+    assert job_class(incremental, backfill=True) == JobClass.BACKFILL
+
+    response = client.post(
+        "/api/v1/pipelines:batch/run",
+        json={"pipeline_ids": [incremental.id, full.id], "backfill": True},
+    )
+    assert [job["job_class"] for job in response.json()["jobs"]] == ["backfill", "backfill"]
+
+
+def test_priorities_follow_weighted_recent_usage(add_pipeline) -> None:
+    idle = add_usage(add_pipeline(), (600, 300))  # outside the one hour window
+    busy = add_usage(add_pipeline(), (30, 10), (15, 10))
+    weighted = add_usage(add_pipeline(fair_share_weight=15), (30, 10), (15, 10))
+
+    with engine.connect() as connection:
+        priorities = fair_share_priorities(connection, [idle.id, busy.id, weighted.id])
+
+    # 20 minutes are 20 one minute quanta, log2(1 + 20) ~ 4.4; weighted, log2(1 + 20 / 15) ~ 1.2.
+    assert priorities == {idle.id: 0, busy.id: 4, weighted.id: 1}
+
+
+def test_jobs_are_published_to_their_lane_with_priority(add_pipeline) -> None:
+    busy = add_usage(add_pipeline(), (30, 4))
+    jobs = [
+        Job(id=1, pipeline_id=busy.id, job_class=JobClass.INCREMENTAL),
+        Job(id=2, pipeline_id=busy.id, job_class=JobClass.BACKFILL),
+    ]
+
+    assert tasks.run_options(jobs) == {
+        1: {"queue": LANES[JobClass.INCREMENTAL], "priority": 2},
+        2: {"queue": LANES[JobClass.BACKFILL], "priority": 2},
+    }
+    assert celery_app.conf.worker_prefetch_multiplier == 1
+    assert celery_app.conf.task_acks_late
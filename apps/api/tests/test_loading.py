@@ -0,0 +1,342 @@
+"""Tests for destination bulk loading helpers and source-to-destination streaming."""
+
+import asyncio
+import gzip
+import threading
+from typing import Any
+
+import pytest
+from app.db import get_session
+from app.db.models import Job, JobStatus
+from app.services.connectors import Connector, registry
+from app.services.connectors.loading import rebatch, rebatch_by_size, record_columns, record_rows
+from app.services.connectors.mongodb import _settle
+from app.services.connectors.mysql import _tsv_value
+from app.services.connectors.redshift import RedshiftDestinationConnector
+from app.services.connectors.sqlserver import _latest_by_key, _merge_sql
+from app.services.workflows.tasks import run_pipeline_task
+
+
+async def _batches(*batches: list[dict[str, Any]]):
+    for batch in batches:
+        yield batch
+
+
+def test_rebatch_regroups_to_batch_size() -> None:
+    async def collect():
+        source = _batches([{"id": i} for i in range(3)], [{"id": i} for i in range(3, 8)])
+        return [len(batch) async for batch in rebatch(source, 4)]
+
+    assert asyncio.run(collect()) == [4, 4]
+
+
+def test_rebatch_splits_a_large_batch_in_order() -> None:
+    async def collect():
+        return [group async for group in rebatch(_batches([{"id": i} for i in range(10)]), 3)]
+
+    groups = asyncio.run(collect())
+    assert [[record["id"] for record in group] for group in groups] == [
+        [0, 1, 2],
+        [3, 4, 5],
+        [6, 7, 8],
+        [9],
+    ]
+
+
+def test_rebatch_by_size_caps_rows_and_bytes() -> None:
+    async def collect(max_rows: int, max_bytes: int):
+        source = _batches([{"v": "x" * 10}] * 5, [{"v": "x" * 40}])
+        groups = rebatch_by_size(source, max_rows, max_bytes, lambda record: len(record["v"]))
+        return [[len(record["v"]) for record in group] async for group in groups]
+
+    assert asyncio.run(collect(10, 25)) == [[10, 10], [10, 10], [10], [40]]
+    assert asyncio.run(collect(3, 1000)) == [[10, 10, 10], [10, 10, 40]]
+
+
+def test_record_rows_fill_missing_columns() -> None:
+    records = [{"id": 1, "name": "a"}, {"id": 2, "email": "b@example.com"}]
+    columns = record_columns(records)
+
+    assert columns == ["id", "name", "email"]
+    assert record_rows(records, columns) == [(1, "a", None), (2, None, "b@example.com")]
+
+
+def test_mysql_insert_sql_upserts_on_primary_key() -> None:
+    connector = registry.create("mysql_destination", table="users", primary_key=["id"])
+    sql = connector._insert_sql("users", ["id", "name"])
+
+    assert sql == (
+        "INSERT INTO `users` (`id`, `name`) VALUES (%s, %s) "
+        "ON DUPLICATE KEY UPDATE `name` = VALUES(`name`)"
+    )
+    assert connector._insert_sql("users", ["id", "name"], source="stage").startswith(
+        "INSERT INTO `users` (`id`, `name`) SELECT `id`, `name` FROM `stage`"
+    )
+
+
+def test_mysql_tsv_values_are_escaped() -> None:
+    assert _tsv_value(None) == "\\N"
+    assert _tsv_value(True) == "1"
+    assert _tsv_value("a\tb\nc\\d") == "a\\tb\\nc\\\\d"
+    assert (
+        _tsv_value({"tags": ["a"], "ok": True, "note": None})
+        == '{"tags": ["a"], "ok": true, "note": null}'
+    )
+
+
+class LoadDataCursor:
+    async def execute(self, sql: str, args: tuple = ()) -> None:
+        self.sql = sql
+        with open(args[0], encoding="utf-8") as handle:
+            self.lines = handle.read().splitlines()
+
+
+def test_mysql_load_data_decodes_binary_columns_from_hex() -> None:
+    connector = registry.create("mysql_destination", table="files")
+    cursor = LoadDataCursor()
+    rows = [(1, b"\x00\tbin"), (2, None)]
+
+    asyncio.run(connector._load_data(cursor, "files", ["id", "content"], rows))
+
+    assert cursor.sql.endswith("(`id`, @field1) SET `content` = UNHEX(@field1)")
+    assert cursor.lines == ["1\t000962696e", "2\t\\N"]
+
+
+def test_sqlserver_merge_sql_updates_non_key_columns() -> None:
+    sql = _merge_sql("[dbo].[users]", ["id", "name"], ["id"])
+
+    assert "ON t.[id] = s.[id]" in sql
+    assert "WHEN MATCHED THEN UPDATE SET t.[name] = s.[name]" in sql
+    assert sql.endswith("WHEN NOT MATCHED THEN INSERT ([id], [name]) VALUES (s.[id], s.[name]);")
+
+
+def test_sqlserver_upserts_keep_the_last_record_of_each_key() -> None:
+    batch = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 1, "name": "c"}]
+
+    assert _latest_by_key(batch, ["id"]) == [{"id": 1, "name": "c"}, {"id": 2, "name": "b"}]
+
+
+def test_mongodb_bulk_writes_stop_at_the_first_failure() -> None:
+    async def scenario() -> tuple[int, bool]:
+        async def write(delay: float, error: Exception | None = None) -> None:
+            await asyncio.sleep(delay)
+            if error:
+                raise error
+
+        finished = asyncio.create_task(write(0))
+        slow = asyncio.create_task(write(60))
+        await asyncio.sleep(0.01)
+        pending = await _settle({finished, slow}, 1)  # finished writes are dropped
+
+        failing = asyncio.create_task(write(0.01, ConnectionError("bulk write failed")))
+        with pytest.raises(ConnectionError):
+            await _settle({*pending, failing}, 1)
+        slow.cancel()
+        return len(pending), finished in pending
+
+    assert asyncio.run(scenario()) == (1, False)
+
+
+def test_redshift_spool_slices_records_evenly(tmp_path) -> None:
+    source = _batches([{"id": i} for i in range(5)], [{"id": i} for i in range(5, 10)])
+    paths, rows = asyncio.run(RedshiftDestinationConnector._spool(source, str(tmp_path), 4))
+
+    assert rows == 10
+    line_counts = []
+    for path in paths:
+        with gzip.open(path, "rt") as handle:
+            line_counts.append(len(handle.readlines()))
+    assert line_counts == [3, 3, 2, 2]
+
+
+class RecordingCursor:
+    def __init__(self) -> None:
+        self.statements: list[str] = []
+
+    def execute(self, sql: str) -> None:
+        self.statements.append(sql)
+
+
+def test_redshift_copy_uses_manifest_and_delete_insert_for_upserts() -> None:
+    connector = registry.create("redshift", iam_role="arn:aws:iam::1:role/copy", primary_key=["id"])
+    cursor = RecordingCursor()
+    connector._copy(cursor, '"public"."users"', "s3://bucket/run/manifest.json")
+
+    copy = cursor.statements[1]
+    assert copy.startswith("COPY openfuse_stage FROM 's3://bucket/run/manifest.json'")
+    assert "IAM_ROLE 'arn:aws:iam::1:role/copy'" in copy
+    assert "GZIP MANIFEST" in copy
+    assert cursor.statements[2] == (
+        'DELETE FROM "public"."users" USING openfuse_stage '
+        'WHERE "public"."users"."id" = openfuse_stage."id"'
+    )
+
+
+class FlakyS3Client:
+    def __init__(self, failing_key: str) -> None:
+        self.failing_key = failing_key
+        self.deleted: list[str] = []
+
+    async def put_object(self, Bucket: str, Key: str, Body: bytes) -> None:
+        await asyncio.sleep(0)
+        if Key == self.failing_key:
+            raise ConnectionError("upload failed")
+
+    async def delete_objects(self, Bucket: str, Delete: dict) -> None:
+        self.deleted = sorted(obj["Key"] for obj in Delete["Objects"])
+
+
+def test_redshift_deletes_the_staged_slices_when_an_upload_fails(tmp_path) -> None:
+    connector = registry.create("redshift", iam_role="arn:aws:iam::1:role/copy")
+    source = _batches([{"id": i} for i in range(3)])
+    paths, _ = asyncio.run(RedshiftDestinationConnector._spool(source, str(tmp_path), 3))
+    client = FlakyS3Client("run/part-0001.json.gz")
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(
+            connector._stage_and_copy(client, None, RecordingCursor(), "bucket", "run", paths, "t")
+        )
+
+    assert client.deleted == ["run/part-0000.json.gz", "run/part-0002.json.gz"]
+
+
+class RecordingConnection:
+    def __init__(self) -> None:
+        self.threads: list[threading.Thread] = []
+
+    def commit(self) -> None:
+        self.threads.append(threading.current_thread())
+
+
+def test_redshift_runs_the_copy_off_the_event_loop(tmp_path) -> None:
+    connector = registry.create("redshift", iam_role="arn:aws:iam::1:role/copy")
+    source = _batches([{"id": i} for i in range(2)])
+    paths, _ = asyncio.run(RedshiftDestinationConnector._spool(source, str(tmp_path), 2))
+    conn, cursor = RecordingConnection(), RecordingCursor()
+    cursor.execute = lambda sql: conn.threads.append(threading.current_thread())
+
+    asyncio.run(
+        connector._stage_and_copy(FlakyS3Client(""), conn, cursor, "bucket", "run", paths, "t")
+    )
+
+    assert len(conn.threads) == 2  # the COPY and the commit
+    assert threading.main_thread() not in conn.threads
+
+
+def test_run_pipeline_task_streams_source_into_destination(
+    add_pipeline, streaming_connectors
+) -> None:
+    session = next(get_session())
+    job = Job(pipeline_id=add_pipeline(name="Streaming").id)
+    session.add(job)
+    session.commit()
+
+    result = run_pipeline_task(job.id)
+
+    assert result["status"] == JobStatus.COMPLETED.value
+    assert result["rows_synced"] == 3
+    assert [record["id"] for record in streaming_connectors.loaded] == [1, 2, 3]
+
+    session.refresh(job)
+    assert job.metrics["rows_read"] == 3
+    assert job.metrics["batches_written"] == 2
+    assert job.metrics["host_waits"] == 0
+
+
+class ExtractingSource(Connector):
+    name = "extracting_source"
+    title = "Extracting Source"
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict[str, Any]:
+        return {"status": "completed", "rows_extracted": 5}
+
+
+class SilentDestination(Connector):
+    name = "silent_destination"
+    title = "Silent Destination"
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict[str, Any]:
+        return {"status": "completed"}
+
+
+def test_run_pipeline_task_records_only_rows_the_destination_reports(
+    add_pipeline, monkeypatch
+) -> None:
+    connectors = {"gcs": ExtractingSource(), "mysql_destination": SilentDestination()}
+    monkeypatch.setattr(registry, "create", lambda name, **config: connectors[name])
+
+    session = next(get_session())
+    job = Job(pipeline_id=add_pipeline(name="Run based").id)
+    session.add(job)
+    session.commit()
+
+    assert run_pipeline_task(job.id, host_waits=2)["rows_synced"] == 5
+
+    session.refresh(job)
+    assert job.metrics["rows_read"] == 5
+    assert job.metrics["rows_written"] == 0
+    assert job.metrics["host_waits"] == 2
+
+
+class CheckpointingSource(Connector):
+    name = "checkpointing_source"
+    title = "Checkpointing Source"
+    checkpoints = 0
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict[str, Any]:
+        raise AssertionError("run() should not be called when streaming")
+
+    async def read(self):
+        yield [{"id": 1}]
+
+    def checkpoint(self) -> None:
+        self.checkpoints += 1
+
+
+class FailingDestination(Connector):
+    name = "failing_destination"
+    title = "Failing Destination"
+    failing = True
+
+    def validate(self) -> None:
+        pass
+
+    async def run(self) -> dict[str, Any]:
+        raise AssertionError("run() should not be called when streaming")
+
+    async def write(self, batches) -> dict[str, Any]:
+        rows = 0
+        async for batch in batches:
+            if self.failing:
+                raise ConnectionError("load failed")
+            rows += len(batch)
+        return {"status": "completed", "rows_loaded": rows}
+
+
+def test_sources_checkpoint_only_once_the_destination_loaded(add_pipeline, monkeypatch) -> None:
+    source, destination = CheckpointingSource(), FailingDestination()
+    connectors = {"gcs": source, "mysql_destination": destination}
+    monkeypatch.setattr(registry, "create", lambda name, **config: connectors[name])
+    pipeline_id = add_pipeline(name="Checkpointed").id
+
+    session = next(get_session())
+    failed, completed = Job(pipeline_id=pipeline_id), Job(pipeline_id=pipeline_id)
+    session.add_all([failed, completed])
+    session.commit()
+
+    assert run_pipeline_task(failed.id)["status"] == JobStatus.FAILED.value
+    assert source.checkpoints == 0
+
+    destination.failing = False
+    assert run_pipeline_task(completed.id)["status"] == JobStatus.COMPLETED.value
+    assert source.checkpoints == 1
+    session.close()
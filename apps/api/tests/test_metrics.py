@@ -0,0 +1,74 @@
+"""Tests for the Prometheus metrics surface."""
+
+from types import SimpleNamespace
+
+import pytest
+
+prometheus_client = pytest.importorskip("prometheus_client")
+
+from app.core import metrics  # noqa: E402
+
+
+def test_metrics_endpoint_reports_route_latency_and_pool(client):
+    client.get("/api/v1/pipelines/12345")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert 'route="/api/v1/pipelines/{pipeline_id}"' in body
+    assert "/api/v1/pipelines/12345" not in body
+    assert "openfuse_db_pool_connections" in body
+
+
+def test_observe_job_counts_rows_and_failures():
+    registry = prometheus_client.REGISTRY
+    labels = {"connector": "metrics_source", "direction": "read"}
+    before = registry.get_sample_value("openfuse_connector_rows_total", labels) or 0
+
+    metrics.observe_job(
+        "metrics_source", "metrics_destination", "failed", {"rows_read": 7, "elapsed_seconds": 1.0}
+    )
+
+    assert registry.get_sample_value("openfuse_connector_rows_total", labels) == before + 7
+    assert (
+        registry.get_sample_value(
+            "openfuse_connector_errors_total",
+            {"source": "metrics_source", "destination": "metrics_destination"},
+        )
+        >= 1
+    )
+
+
+def test_pool_collector_reports_sqlite_singleton_pools():
+    from sqlalchemy import create_engine
+
+    engine = create_engine("sqlite://")
+    (family,) = metrics.PoolCollector({"memory": engine}).collect()
+
+    assert [(s.labels, s.value) for s in family.samples] == [
+        ({"engine": "memory", "state": "size"}, 5)
+    ]
+
+
+class FakeChannel:
+    def queue_declare(self, queue, passive):
+        assert passive
+        return SimpleNamespace(message_count={"workflows": 3}[queue])
+
+
+class FakeConnection:
+    default_channel = FakeChannel()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+def test_queue_depth_collector_reads_broker_queues():
+    celery_app = SimpleNamespace(connection_for_read=FakeConnection)
+    (family,) = metrics.QueueDepthCollector(celery_app, ["workflows"]).collect()
+
+    assert [(s.labels, s.value) for s in family.samples] == [({"queue": "workflows"}, 3)]
@@ -61,3 +61,59 @@ def test_job_belongs_to_pipeline():
     assert job.id is not None
     assert job.pipeline_id == pipeline.id
     assert job.status == JobStatus.PENDING
+
+
+def test_retention_deletes_expired_jobs_and_their_artifacts():
+    from datetime import timedelta
+
+    from app.db import engine
+    from app.db.models import JobArtifact
+    from app.db.partitions import enforce_retention
+    from sqlmodel import select
+
+    session = next(get_session())
+    pipeline = Pipeline(
+        name="Retention", source_connector="slack", destination_connector="snowflake"
+    )
+    session.add(pipeline)
+    session.commit()
+    old = Job(pipeline_id=pipeline.id, created_at=datetime.utcnow() - timedelta(days=40))
+    recent = Job(pipeline_id=pipeline.id)
+    session.add_all([old, recent])
+    session.commit()
+    session.add(
+        JobArtifact(job_id=old.id, name="profile.folded", content_type="text/plain", content="")
+    )
+    session.commit()
+    recent_id = recent.id
+    session.close()
+
+    summary = enforce_retention(engine, retention_days=30)
+
+    assert summary == {"partitions_dropped": [], "jobs_deleted": 1}
+    session = next(get_session())
+    assert [job.id for job in session.exec(select(Job)).all()] == [recent_id]
+    assert session.exec(select(JobArtifact)).all() == []
+
+
+def test_retention_is_disabled_by_default():
+    from app.db import engine
+    from app.db.partitions import enforce_retention
+
+    assert enforce_retention(engine) == {"partitions_dropped": [], "jobs_deleted": 0}
+
+
+def test_async_database_url_swaps_in_async_drivers():
+    from app.db import async_database_url
+
+    assert (
+        async_database_url("postgresql://u:p@db/openfuse") == "postgresql+psycopg://u:p@db/openfuse"
+    )
+    assert (
+        async_database_url("postgresql+psycopg://u:p@db/openfuse")
+        == "postgresql+psycopg://u:p@db/openfuse"
+    )
+    assert (
+        async_database_url("postgresql+asyncpg://db/openfuse") == "postgresql+asyncpg://db/openfuse"
+    )
+    assert async_database_url("sqlite:///test.db") == "sqlite+aiosqlite:///test.db"
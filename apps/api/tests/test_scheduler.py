@@ -0,0 +1,127 @@
+"""Tests for cron parsing and the pipeline scheduler."""
+
+from datetime import datetime, timedelta
+
+import pytest
+from app.db import engine, get_session
+from app.db.models import Job, Pipeline, PipelineStatus
+from app.services.workflows.cron import CronSchedule
+from app.services.workflows.scheduler import LeaderLock, Scheduler
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("*/15 * * * *", [datetime(2026, 10, 19, 12, 45), datetime(2026, 10, 19, 13, 0)]),
+        ("0 9 * * mon-fri", [datetime(2026, 10, 20, 9, 0), datetime(2026, 10, 21, 9, 0)]),
+        ("0 0 29 2 *", [datetime(2028, 2, 29), datetime(2032, 2, 29)]),
+        # Both day fields restricted: the 1st of the month or any Monday.
+        ("30 2 1 * 1", [datetime(2026, 10, 26, 2, 30), datetime(2026, 11, 1, 2, 30)]),
+        ("@hourly", [datetime(2026, 10, 19, 13, 0), datetime(2026, 10, 19, 14, 0)]),
+    ],
+)
+def test_cron_fire_times(expression, expected) -> None:
+    schedule = CronSchedule.parse(expression)
+    first = schedule.next_after(datetime(2026, 10, 19, 12, 34, 56))
+
+    assert [first, schedule.next_after(first)] == expected
+
+
+@pytest.mark.parametrize(
+    "expression", ["* * *", "61 * * * *", "*/0 * * * *", "0 0 * * funday", "0 0 30 2 *"]
+)
+def test_invalid_cron_expressions_are_rejected(expression) -> None:
+    with pytest.raises(ValueError):
+        CronSchedule.parse(expression)
+
+
+def test_pipeline_api_rejects_invalid_schedules(client) -> None:
+    payload = {
+        "name": "Scheduled",
+        "source_connector": "slack",
+        "destination_connector": "snowflake",
+    }
+
+    response = client.post("/api/v1/pipelines", json={**payload, "schedule_cron": "every day"})
+
+    assert response.status_code == 422
+
+
+def update_pipeline(pipeline_id: int, **changes) -> None:
+    session = next(get_session())
+    pipeline = session.get(Pipeline, pipeline_id)
+    for field, value in changes.items():
+        setattr(pipeline, field, value)
+    session.commit()
+    session.close()
+
+
+def test_scheduler_starts_due_runs_and_sleeps_until_the_next(add_pipeline, monkeypatch) -> None:
+    from app.services.workflows import tasks
+
+    enqueued = []
+    monkeypatch.setattr(
+        tasks, "enqueue_runs", lambda jobs, profile=False: enqueued.append([job.id for job in jobs])
+    )
+    every_minute = add_pipeline(name="Every minute", schedule_cron="* * * * *").id
+    hourly = add_pipeline(name="Hourly", schedule_cron="0 * * * *").id
+    add_pipeline(name="Unscheduled", schedule_cron=None)
+    add_pipeline(name="Draft", schedule_cron="* * * * *", status=PipelineStatus.DRAFT)
+    add_pipeline(name="Broken", schedule_cron="not a schedule")
+
+    now = datetime.utcnow().replace(minute=30, second=0, microsecond=0)
+    clock = [now]
+    scheduler = Scheduler(engine, poll_seconds=15, clock=lambda: clock[0])
+
+    assert scheduler.tick() == 15  # the next run is a minute away, so poll first
+    assert set(scheduler.entries) == {every_minute, hourly}
+    assert enqueued == []
+
+    clock[0] = now + timedelta(minutes=1)
+    assert scheduler.tick() == 15
+    session = next(get_session())
+    jobs = session.query(Job).all()
+    assert [job.pipeline_id for job in jobs] == [every_minute]
+    assert enqueued == [[jobs[0].id]]
+
+    clock[0] = now + timedelta(minutes=1, seconds=50)
+    assert scheduler.tick() == 10  # wakes when the next run is due
+
+
+def test_scheduler_applies_pipeline_changes_incrementally(add_pipeline) -> None:
+    from sqlalchemy import event
+
+    first = add_pipeline(name="First", schedule_cron="0 * * * *").id
+    second = add_pipeline(name="Second", schedule_cron="0 * * * *").id
+    now = datetime.utcnow()
+    scheduler = Scheduler(engine, lookback_seconds=60, clock=lambda: now)
+    assert scheduler.refresh(now) == 2
+
+    update_pipeline(first, schedule_cron="*/5 * * * *")
+    update_pipeline(second, status=PipelineStatus.PAUSED)
+    new = add_pipeline(name="New", schedule_cron="@daily").id
+
+    statements = []
+    listener = lambda *args: statements.append(args[2])  # noqa: E731
+    event.listen(engine, "before_cursor_execute", listener)
+    try:
+        scheduler.refresh(now)
+    finally:
+        event.remove(engine, "before_cursor_execute", listener)
+
+    assert "updated_at >=" in statements[0]
+    assert set(scheduler.entries) == {first, new}
+    assert scheduler.entries[first].cron.expression == "*/5 * * * *"
+    assert scheduler.entries[first].fire_at == CronSchedule.parse("*/5 * * * *").next_after(now)
+
+    # Rows read again within the lookback window keep their schedule.
+    fire_at = scheduler.entries[new].fire_at
+    scheduler.refresh(now)
+    assert scheduler.entries[new].fire_at == fire_at
+
+
+def test_leader_lock_is_always_granted_without_advisory_locks() -> None:
+    lock = LeaderLock(engine)
+
+    assert lock.hold() and lock.hold()
+    lock.release()
@@ -0,0 +1,98 @@
+"""Tests for OpenTelemetry spans and trace propagation."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("opentelemetry.sdk")
+
+from app.core import tracing  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.services.workflows.dataplane import stream_records  # noqa: E402
+from celery import signals  # noqa: E402
+from tests.test_dataplane import ListDestination, ListSource, make_batch  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def span_file(tmp_path_factory):
+    path = tmp_path_factory.mktemp("traces") / "spans.jsonl"
+    overrides = {"otel_exporter": "file", "otel_file_path": str(path)}
+    previous = {key: getattr(settings, key) for key in overrides}
+    for key, value in overrides.items():
+        setattr(settings, key, value)
+    tracing.configure_tracing("openfuse-tests")
+    yield path
+    for key, value in previous.items():
+        setattr(settings, key, value)
+
+
+@pytest.fixture
+def exported(span_file):
+    span_file.write_text("")
+
+    def read():
+        return [json.loads(line) for line in span_file.read_text().splitlines()]
+
+    return read
+
+
+def test_api_request_span_uses_route_template_and_parents_db_queries(client, exported):
+    client.get("/api/v1/pipelines/12345")
+
+    spans = exported()
+    (server,) = [s for s in spans if s["kind"] == "SpanKind.SERVER"]
+    assert server["name"] == "GET /api/v1/pipelines/{pipeline_id}"
+    queries = [s for s in spans if s["name"] == "db.query"]
+    assert queries
+    assert {q["context"]["trace_id"] for q in queries} == {server["context"]["trace_id"]}
+
+
+def test_celery_headers_carry_trace_context_to_tasks(exported):
+    headers: dict = {}
+    with tracing.span("publish") as parent:
+        signals.before_task_publish.send(sender="run_pipeline", headers=headers)
+    assert "traceparent" in headers
+
+    task = type("FakeTask", (), {"request": SimpleNamespace(**headers)})
+    signals.task_prerun.send(sender=task, task_id="task-1", task=task)
+    with tracing.span("pipeline.job"):
+        pass
+    signals.task_postrun.send(sender=task, task_id="task-1", task=task)
+
+    (job,) = [s for s in exported() if s["name"] == "pipeline.job"]
+    assert job["context"]["trace_id"] == f"0x{parent.get_span_context().trace_id:032x}"
+
+
+def test_stream_records_traces_connector_phases_and_batches(exported):
+    source = ListSource(make_batch(2), make_batch(1))
+    with tracing.span("pipeline.job"):
+        asyncio.run(stream_records(source, ListDestination(), 1024 * 1024))
+
+    spans = exported()
+    names = [s["name"] for s in spans]
+    assert names.count("batch.write") == 2
+    assert {"source.read", "destination.write"} <= set(names)
+    assert len({s["context"]["trace_id"] for s in spans}) == 1
+
+
+def test_connector_http_clients_trace_every_request(exported, monkeypatch):
+    import httpx
+    from app.services.connectors import Connector
+
+    async def respond(self, request):
+        return httpx.Response(200, request=request)
+
+    monkeypatch.setattr(httpx.AsyncHTTPTransport, "handle_async_request", respond)
+
+    async def fetch():
+        async with Connector.http_client(timeout=5.0) as client:
+            await client.get("https://api.example.com/items?page=2")
+
+    asyncio.run(fetch())
+
+    (span,) = exported()
+    assert span["name"] == "HTTP GET"
+    assert span["attributes"]["server.address"] == "api.example.com"
+    assert span["attributes"]["http.response.status_code"] == 200
@@ -6,6 +6,7 @@ import { listJobs, type JobStatus } from "@/app/lib/api";
 
 const FILTERS: Array<{ value: "all" | JobStatus; label: string }> = [
   { value: "all", label: "All statuses" },
+  { value: "queued", label: "Queued" },
   { value: "pending", label: "Pending" },
   { value: "running", label: "Running" },
   { value: "completed", label: "Completed" },
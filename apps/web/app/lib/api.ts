@@ -2,7 +2,8 @@ import { getApiUrl, type Connector, type ConnectorCapability, type ConnectorSche
 
 export type PipelineStatus = "draft" | "active" | "paused" | "failed" | "deleted";
 export type ReplicationMode = "full_table" | "incremental_key" | "log_based";
-export type JobStatus = "pending" | "running" | "completed" | "failed" | "cancelled";
+export type JobStatus = "queued" | "pending" | "running" | "completed" | "failed" | "cancelled";
+export type JobClass = "incremental" | "full_refresh" | "backfill";
 
 export type PipelineSummary = {
   id: number;
@@ -23,15 +24,36 @@ export type PipelineSummary = {
 
 export type PipelineDetail = PipelineSummary;
 
+export type JobMetrics = {
+  rows_read: number;
+  rows_written: number;
+  rows_per_second: number;
+  bytes_read: number;
+  bytes_written: number;
+  batches_read: number;
+  batches_written: number;
+  source_read_seconds: number;
+  transform_seconds: number;
+  destination_write_seconds: number;
+  reader_wait_seconds: number;
+  writer_wait_seconds: number;
+  peak_buffered_bytes: number;
+  spilled_batches: number;
+  retries: number;
+  elapsed_seconds: number;
+};
+
 export type JobSummary = {
   id: number;
   pipeline_id: number;
   status: JobStatus;
+  job_class: JobClass;
   rows_synced: number;
   error_message?: string | null;
   started_at?: string | null;
   completed_at?: string | null;
   created_at: string;
+  metrics?: JobMetrics | null;
 };
 
 export type JobDetail = JobSummary;
@@ -96,8 +118,11 @@ const apiFetch = async <T>(path: string, init?: RequestInit): Promise<T> => {
   if (!response.ok) {
     let message = response.statusText;
     try {
-      const payload = (await response.json()) as { detail?: string };
-      if (payload.detail) {
+      const payload = (await response.json()) as { detail?: string | Array<string | { msg: string }> };
+      if (Array.isArray(payload.detail)) {
+        // Config validation reports every violation at once.
+        message = payload.detail.map((item) => (typeof item === "string" ? item : item.msg)).join("; ");
+      } else if (payload.detail) {
         message = payload.detail;
       }
     } catch {
@@ -116,13 +141,19 @@ const apiFetch = async <T>(path: string, init?: RequestInit): Promise<T> => {
 export const listConnectors = async (capability?: ConnectorCapability): Promise<Connector[]> =>
   loadConnectors(fetch, capability);
 
-export const listPipelines = async (statusFilter?: PipelineStatus): Promise<{ pipelines: PipelineSummary[]; total: number }> => {
+export type Page = {
+  total: number | null;
+  total_estimated: boolean;
+  next_cursor: string | null;
+};
+
+export const listPipelines = async (statusFilter?: PipelineStatus): Promise<Page & { pipelines: PipelineSummary[] }> => {
   const params = new URLSearchParams();
   if (statusFilter) {
     params.set("status_filter", statusFilter);
   }
   const suffix = params.toString().length > 0 ? `?${params.toString()}` : "";
-  return apiFetch<{ pipelines: PipelineSummary[]; total: number }>(`/api/v1/pipelines${suffix}`);
+  return apiFetch<Page & { pipelines: PipelineSummary[] }>(`/api/v1/pipelines${suffix}`);
 };
 
 export const getPipeline = async (pipelineId: number): Promise<PipelineDetail> =>
@@ -154,15 +185,15 @@ export const runPipeline = async (pipelineId: number): Promise<JobDetail> =>
     body: JSON.stringify({}),
   });
 
-export const listPipelineJobs = async (pipelineId: number): Promise<{ jobs: JobSummary[]; total: number }> =>
-  apiFetch<{ jobs: JobSummary[]; total: number }>(`/api/v1/pipelines/${pipelineId}/jobs`);
+export const listPipelineJobs = async (pipelineId: number): Promise<Page & { jobs: JobSummary[] }> =>
+  apiFetch<Page & { jobs: JobSummary[] }>(`/api/v1/pipelines/${pipelineId}/jobs`);
 
 export const listJobs = async (options?: {
   status?: JobStatus;
   pipelineId?: number;
-  skip?: number;
+  cursor?: string;
   limit?: number;
-}): Promise<{ jobs: JobSummary[]; total: number }> => {
+}): Promise<Page & { jobs: JobSummary[] }> => {
   const params = new URLSearchParams();
   if (options?.status) {
     params.set("status_filter", options.status);
@@ -170,14 +201,14 @@ export const listJobs = async (options?: {
   if (typeof options?.pipelineId === "number") {
     params.set("pipeline_id", String(options.pipelineId));
   }
-  if (typeof options?.skip === "number") {
-    params.set("skip", String(options.skip));
+  if (options?.cursor) {
+    params.set("cursor", options.cursor);
   }
   if (typeof options?.limit === "number") {
     params.set("limit", String(options.limit));
   }
   const suffix = params.toString().length > 0 ? `?${params.toString()}` : "";
-  return apiFetch<{ jobs: JobSummary[]; total: number }>(`/api/v1/jobs${suffix}`);
+  return apiFetch<Page & { jobs: JobSummary[] }>(`/api/v1/jobs${suffix}`);
 };
 
 export const validateConnectorConfig = async (
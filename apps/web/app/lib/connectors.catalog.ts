@@ -377,6 +377,34 @@ export const fallbackConnectorCatalog = [
             "parquet"
           ],
           "default": "csv"
+        },
+        "delimiter": {
+          "type": "string",
+          "title": "CSV Delimiter",
+          "default": ","
+        },
+        "max_concurrency": {
+          "type": "integer",
+          "title": "Max Concurrent Downloads",
+          "description": "Number of object ranges downloaded in parallel",
+          "default": 8
+        },
+        "chunk_size_mb": {
+          "type": "integer",
+          "title": "Download Chunk Size (MB)",
+          "description": "Objects larger than this are fetched as parallel byte ranges",
+          "default": 16
+        },
+        "manifest_path": {
+          "type": "string",
+          "title": "Manifest Path",
+          "description": "Local file used to remember ingested blobs so unchanged objects are skipped"
+        },
+        "append_only": {
+          "type": "boolean",
+          "title": "Append-only Keys",
+          "description": "Object names only ever increase (e.g. date-partitioned); resume listing after the last ingested name",
+          "default": false
         }
       },
       "required": [
@@ -929,6 +957,37 @@ export const fallbackConnectorCatalog = [
           "type": "boolean",
           "title": "Use TLS",
           "default": false
+        },
+        "collection": {
+          "type": "string",
+          "title": "Collection",
+          "description": "Target collection for loaded records"
+        },
+        "primary_key": {
+          "type": "array",
+          "title": "Primary Key",
+          "items": {
+            "type": "string"
+          },
+          "description": "Fields identifying a document; matching documents are replaced (upsert)"
+        },
+        "batch_size": {
+          "type": "integer",
+          "title": "Batch Size",
+          "description": "Maximum documents per bulk write",
+          "default": 10000
+        },
+        "max_batch_mb": {
+          "type": "integer",
+          "title": "Max Bulk Write Size (MB)",
+          "description": "Upper bound for the encoded size of each bulk write",
+          "default": 32
+        },
+        "max_in_flight": {
+          "type": "integer",
+          "title": "Concurrent Bulk Writes",
+          "description": "Number of bulk writes sent to the server at once",
+          "default": 4
         }
       },
       "required": [
@@ -1047,6 +1106,41 @@ export const fallbackConnectorCatalog = [
           "title": "Truncate Before Load",
           "description": "Truncate tables before loading data",
           "default": false
+        },
+        "table": {
+          "type": "string",
+          "title": "Table",
+          "description": "Target table for loaded records"
+        },
+        "primary_key": {
+          "type": "array",
+          "title": "Primary Key",
+          "items": {
+            "type": "string"
+          },
+          "description": "Columns identifying a row; existing rows are updated instead of duplicated"
+        },
+        "load_method": {
+          "type": "string",
+          "title": "Load Method",
+          "enum": [
+            "insert",
+            "load_data"
+          ],
+          "default": "insert",
+          "description": "Multi-row INSERT ... ON DUPLICATE KEY UPDATE, or LOAD DATA LOCAL INFILE"
+        },
+        "batch_size": {
+          "type": "integer",
+          "title": "Batch Size",
+          "description": "Rows committed per load transaction",
+          "default": 10000
+        },
+        "max_packet_mb": {
+          "type": "integer",
+          "title": "Max Statement Size (MB)",
+          "description": "Upper bound for each multi-row INSERT; keep below the server max_allowed_packet",
+          "default": 16
         }
       },
       "required": [
@@ -1304,6 +1398,53 @@ export const fallbackConnectorCatalog = [
           "type": "string",
           "title": "IAM Role",
           "description": "IAM role for S3 access"
+        },
+        "schema": {
+          "type": "string",
+          "title": "Schema",
+          "default": "public"
+        },
+        "table": {
+          "type": "string",
+          "title": "Table",
+          "description": "Target table for loaded records"
+        },
+        "primary_key": {
+          "type": "array",
+          "title": "Primary Key",
+          "items": {
+            "type": "string"
+          },
+          "description": "Columns identifying a row; staged rows replace matching rows (delete-insert)"
+        },
+        "s3_bucket": {
+          "type": "string",
+          "title": "Staging Bucket",
+          "description": "S3 bucket for COPY staging files"
+        },
+        "s3_prefix": {
+          "type": "string",
+          "title": "Staging Prefix",
+          "default": "openfuse/staging"
+        },
+        "region": {
+          "type": "string",
+          "title": "Region",
+          "default": "us-east-1"
+        },
+        "access_key_id": {
+          "type": "string",
+          "title": "Access Key ID"
+        },
+        "secret_access_key": {
+          "type": "string",
+          "title": "Secret Access Key",
+          "format": "password"
+        },
+        "slice_count": {
+          "type": "integer",
+          "title": "Slice Count",
+          "description": "Number of staging files per load (defaults to the cluster slice count)"
         }
       },
       "required": [
@@ -1401,6 +1542,11 @@ export const fallbackConnectorCatalog = [
           "title": "Region",
           "default": "us-east-1"
         },
+        "endpoint_url": {
+          "type": "string",
+          "title": "Endpoint URL",
+          "description": "S3-compatible endpoint (e.g. MinIO); leave empty for AWS"
+        },
         "bucket": {
           "type": "string",
           "title": "Bucket Name"
@@ -1424,6 +1570,17 @@ export const fallbackConnectorCatalog = [
           "type": "string",
           "title": "CSV Delimiter",
           "default": ","
+        },
+        "manifest_path": {
+          "type": "string",
+          "title": "Manifest Path",
+          "description": "Local file used to remember ingested objects so unchanged files are skipped"
+        },
+        "append_only": {
+          "type": "boolean",
+          "title": "Append-only Keys",
+          "description": "Object keys only ever increase (e.g. date-partitioned); resume listing after the last ingested key",
+          "default": false
         }
       },
       "required": [
@@ -1995,6 +2152,30 @@ export const fallbackConnectorCatalog = [
           "type": "boolean",
           "title": "Encrypt Connection",
           "default": true
+        },
+        "schema": {
+          "type": "string",
+          "title": "Schema",
+          "default": "dbo"
+        },
+        "table": {
+          "type": "string",
+          "title": "Table",
+          "description": "Target table for loaded records"
+        },
+        "primary_key": {
+          "type": "array",
+          "title": "Primary Key",
+          "items": {
+            "type": "string"
+          },
+          "description": "Columns identifying a row; batches are merged through a staging table"
+        },
+        "batch_size": {
+          "type": "integer",
+          "title": "Batch Size",
+          "description": "Rows sent per bulk insert and committed per transaction",
+          "default": 10000
         }
       },
       "required": [
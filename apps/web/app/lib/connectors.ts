@@ -174,8 +174,9 @@ export async function loadConnectors(
   try {
     const runtimeApiUrl = getRuntimeApiUrl();
     const query = capability ? `?capability=${capability}` : "";
+    // Revalidate with the catalog's ETag so an unchanged catalog comes back as a 304.
     const response = await fetchImpl(`${runtimeApiUrl}/api/v1/connectors${query}`, {
-      cache: "no-store",
+      cache: "no-cache",
     });
     if (!response.ok) {
       return fallback;
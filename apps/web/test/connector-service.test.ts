@@ -53,7 +53,7 @@ describe("loadConnectors", () => {
 
     const connectors = await loadConnectors(fetchSpy);
 
-    expect(fetchSpy).toHaveBeenCalledWith("https://registry.openfuse.dev/api/v1/connectors", { cache: "no-store" });
+    expect(fetchSpy).toHaveBeenCalledWith("https://registry.openfuse.dev/api/v1/connectors", { cache: "no-cache" });
     expect(connectors).toEqual(remoteConnectors);
   });
 
@@ -1,11 +1,10 @@
-"""Generate the web fallback connector catalog from API connector metadata."""
+"""Generate the API connector manifest and the web fallback catalog from connector metadata."""
 
 from __future__ import annotations
 
 import json
-from pathlib import Path
 import sys
-
+from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
 API_APP = ROOT / "apps" / "api"
@@ -15,9 +14,12 @@ sys.path.insert(0, str(API_APP))
 sys.path.insert(0, str(API_APP / "app"))
 
 from app.services.connectors import derive_capabilities, registry  # noqa: E402
+from app.services.connectors.manifest import MANIFEST_PATH, write_manifest  # noqa: E402
 
 
 def main() -> None:
+    print(f"Wrote {write_manifest()} connectors to {MANIFEST_PATH}")
+
     catalog = []
     for definition in registry.describe():
         catalog.append(